@@ -0,0 +1,38 @@
+"""Time `--check` on up to date MkDocs pages of a spec with 10k
+commands, with a full report and when only the first page differs.
+
+    $ PYTHONPATH=. python benchmarks/check.py
+"""
+
+import os
+import time
+import tempfile
+
+from brandon.spec import Parser
+from brandon.builders.docs import Builder
+from specs import write_spec
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=200, commands=50, enums=10, items=1000)
+        app = Parser(filename).app
+
+        builder = Builder(app=app, output_path=tmp)
+        builder._create_directories()
+        builder._write_mkdocs_conf()
+
+        start = time.perf_counter()
+        builder._write_pages()
+        print(f"write pages       {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        start = time.perf_counter()
+        drifts = builder.check(full=True)
+        elapsed = time.perf_counter() - start
+        print(f"full check        {elapsed * 1000:8.1f} ms  {len(drifts)} drifts")
+
+        app.cli.groups[0].commands[0].description = "Changed"
+        start = time.perf_counter()
+        drifts = builder.check()
+        elapsed = time.perf_counter() - start
+        print(f"first page drift  {elapsed * 1000:8.1f} ms  {len(drifts)} drifts")
@@ -0,0 +1,41 @@
+"""Time the rendering of the MkDocs pages with different numbers of
+worker processes, on a spec with 5k commands. MkDocs itself is not run.
+
+    $ PYTHONPATH=. python benchmarks/docs_pages.py
+"""
+
+import os
+import time
+import tempfile
+
+from brandon.spec import Parser
+from brandon.builders.docs import Builder
+from specs import write_spec
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=100, commands=50, enums=5, items=100)
+        app = Parser(filename).app
+
+        cores = os.cpu_count() or 1
+        jobs = sorted({1, 2, 4, cores})
+        baseline = None
+
+        for j in jobs:
+            runs = []
+            for r in range(3):
+                output_path = os.path.join(tmp, f"{j}-{r}")
+                builder = Builder(app=app, output_path=output_path, jobs=j)
+                builder._create_directories()
+
+                start = time.perf_counter()
+                builder._write_pages()
+                runs.append(time.perf_counter() - start)
+
+            elapsed = min(runs)
+            baseline = baseline or elapsed
+            print(
+                f"jobs={j:<3} {elapsed * 1000:8.1f} ms  speedup {baseline / elapsed:4.2f}x"
+                f" ({cores} cores available)"
+            )
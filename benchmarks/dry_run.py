@@ -0,0 +1,52 @@
+"""Compare planning a build with `--dry-run` against the build itself,
+on a spec with 10k commands, and check how close the estimated sizes
+are to the written files.
+
+    $ PYTHONPATH=. python benchmarks/dry_run.py
+"""
+
+import os
+import time
+import tempfile
+
+from brandon.spec import Parser
+from brandon.builders.docs import Builder as DocsBuilder
+from brandon.builders.languages.python import Builder as PythonBuilder
+from specs import write_spec
+
+
+def write_pages(builder):
+    builder._create_directories()
+    builder._write_mkdocs_conf()
+    builder._write_pages()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=200, commands=50, enums=10, items=1000)
+        app = Parser(filename).app
+
+        builders = [
+            ("python", PythonBuilder, lambda b: b.build()),
+            ("docs", DocsBuilder, write_pages),
+        ]
+
+        for name, cls, build in builders:
+            builder = cls(app=app, output_path=os.path.join(tmp, name))
+
+            start = time.perf_counter()
+            plan = builder.plan()
+            planned = time.perf_counter() - start
+
+            start = time.perf_counter()
+            build(builder)
+            built = time.perf_counter() - start
+
+            estimated = plan.summary()["bytes"]
+            written = sum(os.path.getsize(e.path) for e in plan.files())
+            print(
+                f"{name:7} plan {planned * 1000:8.1f} ms  build {built * 1000:8.1f} ms"
+                f"  {len(plan.files())} files, estimated {estimated} bytes,"
+                f" written {written}"
+            )
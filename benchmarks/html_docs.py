@@ -0,0 +1,23 @@
+"""Time the static HTML docs backend on a spec with 3k commands.
+
+    $ PYTHONPATH=. python benchmarks/html_docs.py
+"""
+import os
+import time
+import tempfile
+
+from brandon.spec import Parser
+from brandon.builders.html import Builder
+from specs import write_spec
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=60, commands=50, enums=10, items=200)
+        app = Parser(filename).app
+
+        for chunked in (False, True):
+            start = time.perf_counter()
+            Builder(app=app, output_path=tmp, chunked=chunked).build()
+            elapsed = time.perf_counter() - start
+            print(f"chunked={chunked!s:5} {elapsed * 1000:8.1f} ms")
@@ -0,0 +1,51 @@
+"""Compare the time to import the generated `schemas.py` with eager
+and lazy enums, on a spec with 20 enums of 5k items each. Each import
+runs in a new interpreter, with the bytecode compiled beforehand.
+
+    $ PYTHONPATH=. python benchmarks/lazy_enums.py
+"""
+
+import os
+import sys
+import time
+import tempfile
+import compileall
+import subprocess
+
+from brandon.spec import Parser
+from brandon.builders.languages.python import Builder
+from specs import write_spec
+
+
+def import_time(project_root, statement, runs=5):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=project_root, check=True)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=1, commands=1, enums=20, items=5000)
+        app = Parser(filename).app
+
+        baseline = import_time(tmp, "pass")
+        print(f"{'interpreter':<24} {baseline * 1000:8.1f} ms")
+
+        for lazy in [False, True]:
+            output_path = os.path.join(tmp, "lazy" if lazy else "eager")
+            builder = Builder(app=app, output_path=output_path, lazy_enums=lazy)
+            builder.build()
+            compileall.compile_dir(builder.project_root, quiet=1)
+
+            mode = "lazy" if lazy else "eager"
+            elapsed = import_time(builder.project_root, f"import {app.exec}.schemas")
+            print(f"{mode + ' import':<24} {elapsed * 1000:8.1f} ms")
+
+            statement = f"from {app.exec}.schemas import Enum0; Enum0.KEY_0"
+            elapsed = import_time(builder.project_root, statement)
+            print(f"{mode + ' import + one enum':<24} {elapsed * 1000:8.1f} ms")
@@ -0,0 +1,73 @@
+"""Compare write calls and throughput when writing a large page
+element by element against rendering it with each backend and
+writing it at once.
+
+    $ PYTHONPATH=. python benchmarks/md_render.py
+"""
+
+import time
+from io import StringIO
+
+from brandon.md_utils import (
+    Document,
+    Heading,
+    Paragraph,
+    Table,
+    Command,
+    fragment,
+    MARKDOWN,
+    HTML,
+    RST,
+)
+
+SECTIONS = 2000
+ROWS = 20
+
+
+class CountingStream(StringIO):
+    calls = 0
+
+    def write(self, s):
+        self.calls += 1
+        return super().write(s)
+
+
+def make_doc():
+    doc = Document("Large page")
+    for i in range(SECTIONS):
+        doc.add(Heading(f"command-{i}", level=1))
+        doc.add(Paragraph(f"Description of `command-{i}`."))
+        doc.add(fragment(Heading("Usage", level=2)))
+        doc.add(Command(["app", f"command-{i}", "<path>"]))
+        rows = [[f"`opt-{j}`", "string", f"Option {j}", ""] for j in range(ROWS)]
+        doc.add(Table(["Option", "Type", "Description", "Default"], rows))
+    return doc
+
+
+def per_element(doc, stream):
+    for e in doc._elements:
+        stream.write(e.render())
+
+
+def measure(name, write):
+    runs = []
+    for _ in range(3):
+        doc = make_doc()
+        stream = CountingStream()
+        start = time.perf_counter()
+        write(doc, stream)
+        runs.append(time.perf_counter() - start)
+
+    elapsed = min(runs)
+    size = len(stream.getvalue()) / 2**20
+    print(
+        f"{name:<12} {stream.calls:6} writes {elapsed * 1000:8.1f} ms"
+        f" {size / elapsed:7.1f} MiB/s"
+    )
+
+
+if __name__ == "__main__":
+    measure("per-element", per_element)
+    measure("markdown", lambda doc, stream: doc.write(stream, MARKDOWN))
+    measure("html", lambda doc, stream: doc.write(stream, HTML))
+    measure("rst", lambda doc, stream: doc.write(stream, RST))
@@ -0,0 +1,49 @@
+"""Time the cold start (`--help`) of the Python CLI generated from a
+spec with 10k commands: from the sources without bytecode, from the
+sources with a warm `__pycache__` and from the zipapp.
+
+    $ PYTHONPATH=. python benchmarks/pyz_cold_start.py
+"""
+
+import os
+import sys
+import time
+import tempfile
+import statistics
+import subprocess
+
+from brandon.spec import Parser
+from brandon.builders.languages.python import Builder
+from specs import write_spec
+
+RUNS = 5
+
+
+def cold_start(args, env=None):
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(args, env=env, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=200, commands=50, enums=10, items=1000)
+        app = Parser(filename).app
+
+        builder = Builder(app=app, output_path=tmp, zipapp=True)
+        builder.build()
+
+        env = dict(os.environ, PYTHONPATH=builder.project_root)
+        module = [sys.executable, "-m", app.exec, "--help"]
+
+        no_bytecode = dict(env, PYTHONDONTWRITEBYTECODE="1")
+        print(f"sources           {cold_start(module, no_bytecode) * 1000:8.1f} ms")
+        print(f"sources + pycache {cold_start(module, env) * 1000:8.1f} ms")
+
+        archive = [sys.executable, builder.archive_path, "--help"]
+        size = os.path.getsize(builder.archive_path)
+        print(f"zipapp            {cold_start(archive) * 1000:8.1f} ms  {size} bytes")
@@ -0,0 +1,33 @@
+"""Time `brandon search` queries over a persisted index.
+
+    $ PYTHONPATH=. python benchmarks/search.py
+"""
+import os
+import time
+import tempfile
+
+from brandon.search import load_index
+from specs import write_spec
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=200, commands=20, enums=10, items=1000)
+
+        index, ms = timed(lambda: load_index(filename))
+        entries = sum(len(u["entries"]) for u in index.units.values())
+        print(f"{entries} entries, index built in {ms:8.1f} ms")
+
+        index, ms = timed(lambda: load_index(filename))
+        print(f"persisted index loaded in      {ms:8.1f} ms")
+
+        for query in ["option-3", "group-150 command-7", "value-999"]:
+            results, ms = timed(lambda: index.search(query, limit=50))
+            print(f"query {query!r:24} {len(results):3} results {ms:8.2f} ms")
@@ -0,0 +1,67 @@
+"""Time the import of the generated group modules and count the click
+parameter objects they create, on a spec with 20 groups of 200
+commands sharing 10 group options each. Each import runs in a new
+interpreter, with the bytecode compiled beforehand.
+
+    $ PYTHONPATH=. python benchmarks/shared_params.py
+"""
+
+import os
+import sys
+import time
+import tempfile
+import compileall
+import subprocess
+
+from brandon.spec import Parser
+from brandon.builders.languages.python import Builder
+from specs import write_spec
+
+COUNT_PARAMS = """
+import click
+created = 0
+init = click.core.Parameter.__init__
+def counting_init(self, *args, **kwargs):
+    global created
+    created += 1
+    init(self, *args, **kwargs)
+click.core.Parameter.__init__ = counting_init
+import {exec}.main
+print(created)
+"""
+
+
+def import_time(project_root, statement, runs=5):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], cwd=project_root, check=True)
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=20, commands=200, options=10, enums=1, items=1)
+        app = Parser(filename).app
+
+        builder = Builder(app=app, output_path=tmp)
+        builder.build()
+        compileall.compile_dir(builder.project_root, quiet=1)
+
+        baseline = import_time(builder.project_root, "import click")
+        print(f"{'import click':<24} {baseline * 1000:8.1f} ms")
+
+        elapsed = import_time(builder.project_root, f"import {app.exec}.main")
+        print(f"{'import main':<24} {elapsed * 1000:8.1f} ms")
+
+        created = subprocess.run(
+            [sys.executable, "-c", COUNT_PARAMS.format(exec=app.exec)],
+            cwd=builder.project_root,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        print(f"{'parameters created':<24} {created:>8}")
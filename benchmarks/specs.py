@@ -0,0 +1,55 @@
+"""Synthetic specifications used by the benchmarks."""
+
+import yaml
+
+
+def make_spec(groups=100, commands=50, options=10, enums=10, items=1000):
+    """Build a specification with `groups` groups of `commands`
+    commands each, all sharing `options` group level options.
+    """
+    return {
+        "name": "Bench App",
+        "version": "1.0.0",
+        "description": "Benchmark application.",
+        "authors": [
+            {"name": "Author", "email": "author@foo.bar", "url": "https://foo.bar"}
+        ],
+        "languages": ["python"],
+        "schemas": {
+            "enums": {
+                f"enum-{e}": {
+                    "description": f"Enum {e}",
+                    "items": {f"key-{i}": f"value-{i}" for i in range(items)},
+                }
+                for e in range(enums)
+            }
+        },
+        "cli": {
+            f"group-{g}": {
+                "description": f"Group {g}",
+                "options": {
+                    f"option-{o}": {
+                        "description": f"Option {o} of group {g}",
+                        "type": "string",
+                        "short": chr(ord("a") + o % 26),
+                    }
+                    for o in range(options)
+                },
+                "commands": {
+                    f"command-{c}": {
+                        "description": f"Command {c} of group {g}",
+                        "arguments": {
+                            "target": {"description": "The target", "type": "string"}
+                        },
+                    }
+                    for c in range(commands)
+                },
+            }
+            for g in range(groups)
+        },
+    }
+
+
+def write_spec(filename, **kwargs):
+    with open(filename, "w") as fp:
+        yaml.dump(make_spec(**kwargs), fp, sort_keys=False)
@@ -0,0 +1,31 @@
+"""Compare the peak memory of the regular and streaming parsers.
+
+$ PYTHONPATH=. python benchmarks/streaming.py
+"""
+
+import os
+import tempfile
+import tracemalloc
+
+from brandon.spec import Parser
+from specs import write_spec
+
+
+def peak(filename, streaming):
+    tracemalloc.start()
+    parser = Parser(filename, streaming=streaming)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parser
+    return peak
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "cli.yml")
+        write_spec(filename, groups=200, commands=20, enums=20, items=500)
+        print(f"spec size {os.path.getsize(filename) / 2**20:8.1f} MiB")
+
+        for streaming in (False, True):
+            mib = peak(filename, streaming) / 2**20
+            print(f"streaming={streaming!s:5} peak {mib:8.1f} MiB")
@@ -0,0 +1,5 @@
+import logging
+
+# brandon doesn't print log records unless the application using it
+# configures logging, see `brandon.log` for the command line setup
+logging.getLogger(__name__).addHandler(logging.NullHandler())
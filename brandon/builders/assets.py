@@ -0,0 +1,197 @@
+"""Post-build stage for documentation sites: cache-busting names for
+the static assets and precompressed copies of the text files, ready to
+be uploaded to a static host.
+"""
+
+import os
+import re
+import gzip
+import json
+import shutil
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from brandon import cache
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_EXTENSIONS = (".html", ".js", ".css", ".json", ".xml", ".svg", ".txt")
+FINGERPRINTED_EXTENSIONS = (".js", ".css")
+MANIFEST = "manifest.json"
+
+# kept next to the site folder, which MkDocs removes on each build
+CACHE_DIR = ".compressed"
+
+ENCODINGS = {
+    "gzip": ".gz",
+    "br": ".br",
+}
+
+_URL_RE = re.compile(r'((?:src|href)=")([^"#?:]+)([^"]*")')
+_FINGERPRINT_RE = re.compile(r"\.[0-9a-f]{8}(\.min)?\.[a-z]+$")
+
+
+def compress(data: bytes, encoding) -> bytes:
+    if encoding == "gzip":
+        # no timestamp, so the same content is always compressed the same
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    return brotli.compress(data)
+
+
+class PostBuild:
+    """Fingerprint and compress the files of the site in `site_dir`.
+
+    Stylesheets and scripts get a copy named after their content hash
+    (e.g. `style.1a2b3c4d.css`), the pages are updated to point to it
+    and the mapping is saved in `manifest.json`. Then text files are
+    compressed in `jobs` threads. Compressed files are kept in
+    `cache_dir`, outside the site, so files whose content didn't change
+    since the last build aren't compressed again, even if the site is
+    built from scratch.
+    """
+
+    def __init__(
+        self, site_dir, cache_dir, fingerprint=True, compress=True, jobs=None
+    ) -> None:
+        self.site_dir = site_dir
+        self.cache_dir = cache_dir
+        self.fingerprint = fingerprint
+        self.encodings = []
+        self.jobs = jobs
+        self.stats = {"fingerprinted": 0, "compressed": 0, "reused": 0}
+
+        if compress:
+            self.encodings.append("gzip")
+            if brotli is not None:
+                self.encodings.append("br")
+            else:
+                logger.warning("brotli is not installed, skipping `.br` files")
+
+    def run(self):
+        previous = self._load_manifest()
+        self._remove_files(previous.get("assets", {}).values())
+
+        assets = self._fingerprint() if self.fingerprint else {}
+        files = self._compress() if self.encodings else {}
+
+        with open(os.path.join(self.site_dir, MANIFEST), "w") as fp:
+            json.dump({"assets": assets, "files": files}, fp, indent=2, sort_keys=True)
+
+        return self.stats
+
+    def _load_manifest(self):
+        try:
+            with open(os.path.join(self.site_dir, MANIFEST)) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+    def _remove_files(self, paths):
+        """Remove the fingerprinted copies of a previous run, along with
+        their compressed versions.
+        """
+        for p in paths:
+            for suffix in [""] + list(ENCODINGS.values()):
+                try:
+                    os.remove(os.path.join(self.site_dir, p + suffix))
+                except OSError:
+                    pass
+
+    def _site_files(self, extensions):
+        for root, _, files in os.walk(self.site_dir):
+            for f in files:
+                if f.endswith(extensions) and f != MANIFEST:
+                    path = os.path.join(root, f)
+                    yield os.path.relpath(path, self.site_dir).replace(os.sep, "/")
+
+    def _fingerprint(self):
+        assets = {}
+
+        for path in self._site_files(FINGERPRINTED_EXTENSIONS):
+            if _FINGERPRINT_RE.search(path):
+                # already named after its content, e.g. theme bundles
+                continue
+
+            source = os.path.join(self.site_dir, path)
+            base, ext = os.path.splitext(path)
+            assets[path] = f"{base}.{cache.file_digest(source)[:8]}{ext}"
+            shutil.copyfile(source, os.path.join(self.site_dir, assets[path]))
+            self.stats["fingerprinted"] += 1
+
+        if assets:
+            for page in self._site_files((".html",)):
+                self._update_references(page, assets)
+
+        return assets
+
+    def _update_references(self, page, assets):
+        page_dir = os.path.dirname(page)
+
+        def replace(match):
+            url = match.group(2)
+            target = os.path.normpath(os.path.join(page_dir, url)).replace(os.sep, "/")
+            if target not in assets:
+                return match.group(0)
+
+            new_url = os.path.relpath(assets[target], page_dir or ".")
+            return match.group(1) + new_url.replace(os.sep, "/") + match.group(3)
+
+        filename = os.path.join(self.site_dir, page)
+        with open(filename) as fp:
+            content = fp.read()
+
+        updated = _URL_RE.sub(replace, content)
+        if updated != content:
+            with open(filename, "w") as fp:
+                fp.write(updated)
+
+    def _compress(self):
+        paths = list(self._site_files(COMPRESSED_EXTENSIONS))
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            results = list(executor.map(self._compress_file, paths))
+
+        digests = []
+        for digest, compressed in results:
+            digests.append(digest)
+            self.stats["compressed"] += compressed
+            self.stats["reused"] += len(self.encodings) - compressed
+
+        # compressed files of contents that are gone are not needed anymore
+        used = set(digests)
+        for root, _, files in os.walk(self.cache_dir):
+            for f in files:
+                if f.split(".")[0] not in used:
+                    os.remove(os.path.join(root, f))
+
+        return dict(zip(paths, digests))
+
+    def _compress_file(self, path):
+        filename = os.path.join(self.site_dir, path)
+        with open(filename, "rb") as fp:
+            data = fp.read()
+        digest = cache.digest(data)
+        compressed = 0
+
+        for encoding in self.encodings:
+            cached = os.path.join(
+                self.cache_dir, digest[:2], digest + ENCODINGS[encoding]
+            )
+
+            if not os.path.exists(cached):
+                os.makedirs(os.path.dirname(cached), exist_ok=True)
+                tmp = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as fp:
+                    fp.write(compress(data, encoding))
+                os.replace(tmp, cached)
+                compressed += 1
+
+            shutil.copyfile(cached, filename + ENCODINGS[encoding])
+
+        return digest, compressed
@@ -0,0 +1,280 @@
+import shlex
+
+from brandon.schemas import Shells
+from brandon.spec import Types
+
+# characters fish expands in the arguments of `complete -a`
+FISH_SPECIAL = set("\\ $*?~%#(){}[]<>^&|;\"'")
+
+
+class Builder:
+    """Create static completion scripts for bash, zsh and fish.
+
+    The scripts list the groups, commands and options of the
+    application, and the items of the enums referenced by parameters,
+    so completion is resolved by the shell alone without starting the
+    application.
+    """
+
+    def __init__(self, app, shell: Shells) -> None:
+        self.app = app
+        self.shell = shell
+        self.function = f"_{self.app.exec.replace('-', '_')}_completion"
+        self.enums = {e.name: e for e in app.schemas.enums}
+
+    def build(self) -> str:
+        if self.shell == Shells.BASH:
+            lines = self._bash()
+        elif self.shell == Shells.ZSH:
+            lines = self._zsh()
+        elif self.shell == Shells.FISH:
+            lines = self._fish()
+        else:
+            raise Exception(f"Unsupported shell `{self.shell}`")
+
+        return "\n".join(lines) + "\n"
+
+    def _commands(self):
+        """Yield the path (group and command names) of each command."""
+        for g in self.app.cli.groups:
+            for c in g.commands:
+                yield [g.name, c.name], c
+
+        for c in self.app.cli.commands:
+            yield [c.name], c
+
+    def _choices(self, param):
+        if param.enum is None:
+            return []
+        return [str(v) for v in self.enums[param.enum].items.values()]
+
+    def _option_flags(self, option):
+        flags = [f"--{option.name}"]
+        if option.short:
+            flags.append(f"-{option.short}")
+        return flags
+
+    def _candidates(self):
+        """Map each path, as typed so far, to the words that can
+        follow it.
+        """
+        candidates = {
+            "": [g.name for g in self.app.cli.groups]
+            + [c.name for c in self.app.cli.commands]
+        }
+
+        for g in self.app.cli.groups:
+            candidates[g.name] = [c.name for c in g.commands]
+
+        for path, c in self._commands():
+            words = ["--help"]
+            for o in c.options:
+                words.extend(self._option_flags(o))
+            for a in c.arguments:
+                words.extend(self._choices(a))
+            candidates[" ".join(path)] = words
+
+        return candidates
+
+    def _option_values(self):
+        """Map `{path}:{option flag}` to the choices of the option."""
+        values = {}
+
+        for path, c in self._commands():
+            for o in c.options:
+                choices = self._choices(o)
+                if choices:
+                    for flag in self._option_flags(o):
+                        values[f"{' '.join(path)}:{flag}"] = choices
+
+        return values
+
+    def _path_scan(self, first_index, words_var, current_var):
+        groups = "|".join(g.name for g in self.app.cli.groups)
+
+        lines = [
+            '    local cmd_path="" word i',
+            f"    for ((i = {first_index}; i < {current_var}; i++)); do",
+            f'        word="${{{words_var}[i]}}"',
+            '        [[ "$word" == -* ]] && continue',
+            '        case "$cmd_path" in',
+            '            "") cmd_path="$word" ;;',
+        ]
+        if groups:
+            lines.append(f'            {groups}) cmd_path="$cmd_path $word" ;;')
+        lines.extend(
+            [
+                "            *) break ;;",
+                "        esac",
+                "    done",
+            ]
+        )
+
+        return lines
+
+    def _bash(self):
+        # candidates are filtered here rather than by `compgen -W`, which
+        # expands its word list, so values are offered as they are
+        lines = [
+            f"# bash completion for {self.app.exec}",
+            f"{self.function}_reply() {{",
+            '    local cur="$1" word quoted',
+            "    shift",
+            "    COMPREPLY=()",
+            '    for word in "$@"; do',
+            '        [[ "$word" == "$cur"* ]] || continue',
+            '        printf -v quoted %q "$word"',
+            '        COMPREPLY+=("$quoted")',
+            "    done",
+            "}",
+            f"{self.function}() {{",
+            '    local cur="${COMP_WORDS[COMP_CWORD]}"',
+            '    local prev="${COMP_WORDS[COMP_CWORD-1]}"',
+        ]
+        lines.extend(self._path_scan(1, "COMP_WORDS", "COMP_CWORD"))
+
+        values = self._option_values()
+        if values:
+            lines.append('    case "$cmd_path:$prev" in')
+            for key, choices in values.items():
+                lines.append(
+                    f'        "{key}") {self.function}_reply "$cur"'
+                    f" {_shell_words(choices)}; return ;;"
+                )
+            lines.append("    esac")
+
+        lines.append("    COMPREPLY=()")
+        lines.append('    case "$cmd_path" in')
+        for key, words in self._candidates().items():
+            lines.append(
+                f'        "{key}") {self.function}_reply "$cur" {_shell_words(words)} ;;'
+            )
+        lines.extend(
+            [
+                "    esac",
+                "}",
+                f"complete -o default -F {self.function} {self.app.exec}",
+            ]
+        )
+
+        return lines
+
+    def _zsh(self):
+        lines = [
+            f"#compdef {self.app.exec}",
+            "",
+            f"{self.function}() {{",
+            '    local prev="${words[CURRENT-1]}"',
+        ]
+        lines.extend(self._path_scan(2, "words", "CURRENT"))
+
+        values = self._option_values()
+        if values:
+            lines.append('    case "$cmd_path:$prev" in')
+            for key, choices in values.items():
+                lines.append(
+                    f'        "{key}") compadd -- {_shell_words(choices)}; return ;;'
+                )
+            lines.append("    esac")
+
+        commands = {" ".join(path) for path, _ in self._commands()}
+        lines.append('    case "$cmd_path" in')
+        for key, words in self._candidates().items():
+            files = "; _files" if key in commands else ""
+            lines.append(f'        "{key}") compadd -- {_shell_words(words)}{files} ;;')
+        lines.extend(
+            [
+                "    esac",
+                "}",
+                "",
+                f'if [[ "$funcstack[1]" == "{self.function}" ]]; then',
+                f'    {self.function} "$@"',
+                "else",
+                f"    compdef {self.function} {self.app.exec}",
+                "fi",
+            ]
+        )
+
+        return lines
+
+    def _fish(self):
+        exe = self.app.exec
+        lines = [f"# fish completion for {exe}", f"complete -c {exe} -f"]
+
+        for g in self.app.cli.groups:
+            lines.append(
+                f"complete -c {exe} -n __fish_use_subcommand -a {g.name}"
+                f" -d {_fish_quote(g.description)}"
+            )
+
+        for c in self.app.cli.commands:
+            lines.append(
+                f"complete -c {exe} -n __fish_use_subcommand -a {c.name}"
+                f" -d {_fish_quote(c.description)}"
+            )
+
+        for g in self.app.cli.groups:
+            names = " ".join(c.name for c in g.commands)
+            for c in g.commands:
+                condition = (
+                    f"__fish_seen_subcommand_from {g.name}; and not"
+                    f" __fish_seen_subcommand_from {names}"
+                )
+                lines.append(
+                    f"complete -c {exe} -n {_fish_quote(condition)} -a {c.name}"
+                    f" -d {_fish_quote(c.description)}"
+                )
+
+        for path, c in self._commands():
+            condition = "; and ".join(f"__fish_seen_subcommand_from {p}" for p in path)
+
+            for o in c.options:
+                parts = [f"complete -c {exe} -n {_fish_quote(condition)} -l {o.name}"]
+                if o.short:
+                    parts.append(f"-s {o.short}")
+                if o.type != Types.FLAG:
+                    parts.append("-r")
+
+                choices = self._choices(o)
+                if choices:
+                    parts.append(f"-a {_fish_quote(_fish_words(choices))}")
+
+                if o.description:
+                    parts.append(f"-d {_fish_quote(o.description)}")
+                lines.append(" ".join(parts))
+
+            if c.arguments and not any(self._choices(a) for a in c.arguments):
+                lines.append(f"complete -c {exe} -n {_fish_quote(condition)} -F")
+
+            for a in c.arguments:
+                choices = self._choices(a)
+                if choices:
+                    lines.append(
+                        f"complete -c {exe} -n {_fish_quote(condition)}"
+                        f" -a {_fish_quote(_fish_words(choices))}"
+                    )
+
+        return lines
+
+
+def _fish_quote(text):
+    text = (text or "").replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{text}'"
+
+
+def _shell_words(words):
+    """Quote each word for bash and zsh, so values with spaces or shell
+    syntax are kept as a single literal word.
+    """
+    return " ".join(shlex.quote(w) for w in words)
+
+
+def _fish_words(words):
+    """Escape each word with backslashes, as fish expands the list of
+    arguments given to `complete -a`.
+    """
+    escaped = []
+    for w in words:
+        w = "".join(f"\\{c}" if c in FISH_SPECIAL else c for c in w)
+        escaped.append(w.replace("\t", "\\t").replace("\n", "\\n"))
+    return " ".join(escaped)
@@ -1,7 +1,7 @@
 import os
-import re
 import yaml
 import subprocess
+from dataclasses import dataclass, replace
 from enum import Enum
 from urllib.parse import urlparse
 from materialx.emoji import twemoji, to_svg
@@ -14,8 +14,19 @@ from brandon.md_utils import (
     UnorderedList,
     Link,
     Command,
+    fragment,
     sandwich,
 )
+from brandon.builders.assets import PostBuild, CACHE_DIR
+from brandon.names import class_name, function_name
+from brandon.store import fetch
+from brandon.workers import process_pool
+from brandon.plan import Plan, markdown_table_size
+from brandon.drift import check_files
+
+ARGUMENTS_HEADER = ["Argument", "Type", "Description", "Example"]
+OPTIONS_HEADER = ["Option", "Type", "Description", "Default", "Example"]
+ENUM_HEADER = ["Key", "Value"]
 
 
 class Icons(Enum):
@@ -40,37 +51,227 @@ class Icons(Enum):
 class Builder:
     """Create mkdocs configuration file and necessary
     pages for the projects documentation.
+
+    Command pages can be rendered in `jobs` worker processes (all
+    available cores if `None`). Each worker receives only its slice of
+    commands. Rendered pages are reused from the artifact `store`, if
+    one is given.
+
+    Enums are documented in a single page, unless `enum_page_size` is
+    set. Then each enum gets its own pages, of up to `enum_page_size`
+    items each.
+
+    After MkDocs builds the site, its assets can be fingerprinted and
+    its text files compressed, see `assets.PostBuild`.
     """
 
-    def __init__(self, app, output_path: str) -> None:
+    VERSION = "1"
+
+    def __init__(
+        self,
+        app,
+        output_path: str,
+        jobs=1,
+        store=None,
+        enum_page_size=None,
+        fingerprint=False,
+        compress=False,
+    ) -> None:
         self.app = app
+        self.jobs = jobs
+        self.store = store
+        self.enum_page_size = enum_page_size
+        self.fingerprint = fingerprint
+        self.compress = compress
         self.output_path = os.path.join(output_path, f"{app.exec}-docs")
         self.pages_dir = os.path.join(self.output_path, "docs")
         self.reference_pages_dir = os.path.join(self.pages_dir, "reference")
+        self.enums_pages_dir = os.path.join(self.reference_pages_dir, "enums")
 
     def build(self):
+        """Write the pages and build the site, returning the statistics
+        of the post-build stage, if it ran.
+        """
         self._create_directories()
         self._write_mkdocs_conf()
         self._write_pages()
+        self._remove_stale_pages()
 
         # building the site
         subprocess.run(["mkdocs", "build"], cwd=self.output_path)
 
-    def _create_directories(self):
-        os.makedirs(self.output_path, exist_ok=True)
-        os.makedirs(self.pages_dir, exist_ok=True)
+        if self.fingerprint or self.compress:
+            return PostBuild(
+                site_dir=os.path.join(self.output_path, "site"),
+                cache_dir=os.path.join(self.output_path, CACHE_DIR),
+                fingerprint=self.fingerprint,
+                compress=self.compress,
+                jobs=self.jobs,
+            ).run()
+
+    def plan(self, plan=None):
+        """Add the directories and pages the build would write to
+        `plan`, with estimated sizes, and the stale pages it would
+        remove. The site built by MkDocs is not part of the plan.
+        """
+        plan = plan if plan is not None else Plan()
+
+        for d in self._directories():
+            plan.add_directory(d)
+
+        conf = yaml.dump(self._mkdocs_conf([]), sort_keys=False)
+        plan.add_file(
+            os.path.join(self.output_path, "mkdocs.yml"),
+            len(conf) - len("nav: []\n") + len("nav:\n") + nav_size(self._nav()),
+        )
+        plan.add_file(
+            os.path.join(self.pages_dir, "index.md"),
+            len(self._index_page().render()),
+        )
+
+        for c, group in self._commands():
+            plan.add_file(
+                command_page_file(self.reference_pages_dir, c, group),
+                estimate_command_page(self.app.exec, c, group),
+            )
+
+        if self.enum_page_size:
+            for p in self._enum_pages():
+                plan.add_file(p.path, estimate_enum_page(p))
+        elif self.app.schemas:
+            plan.add_file(
+                os.path.join(self.reference_pages_dir, "enums.md"),
+                estimate_enums_page(self.app.schemas.enums),
+            )
+
+        for path in self._stale_pages():
+            plan.delete_file(path, os.path.getsize(path))
+
+        return plan
+
+    def rendered_files(self):
+        """Yield the path and content of each file the build writes,
+        rendered in memory. The MkDocs configuration, whose navigation
+        lists every page, is the slowest to render, so it comes last.
+        """
+        yield os.path.join(self.pages_dir, "index.md"), self._index_page().render()
+
+        for c, group in self._commands():
+            yield (
+                command_page_file(self.reference_pages_dir, c, group),
+                render_command_page(self.app.exec, c, group),
+            )
 
-        # reference subfolder
-        os.makedirs(self.reference_pages_dir, exist_ok=True)
+        if self.enum_page_size:
+            for p in self._enum_pages():
+                yield p.path, render_enum_page(p)
+        elif self.app.schemas:
+            yield (
+                os.path.join(self.reference_pages_dir, "enums.md"),
+                self._render_enums_page(),
+            )
+
+        yield os.path.join(self.output_path, "mkdocs.yml"), self._render_mkdocs_conf()
+
+    def check(self, full=False):
+        """Compare the pages on disk with the ones the specification
+        generates, see `drift.check_files`. Stale pages are drift too.
+        """
+        return check_files(self.rendered_files(), stale=self._stale_pages(), full=full)
+
+    def _commands(self):
+        """Yield each command along with the name of its group, or
+        `None` for top level commands.
+        """
+        for g in self.app.cli.groups:
+            for c in g.commands:
+                yield c, g.name
+
+        for c in self.app.cli.commands:
+            yield c, None
+
+    def _directories(self):
+        dirs = [self.output_path, self.pages_dir, self.reference_pages_dir]
 
         # subfolders for groups
         for g in self.app.cli.groups:
-            os.mkdir(os.path.join(self.reference_pages_dir, g.name))
+            dirs.append(os.path.join(self.reference_pages_dir, g.name))
+
+        if self.enum_page_size:
+            dirs.append(self.enums_pages_dir)
+
+        return dirs
+
+    def _page_files(self):
+        files = [os.path.join(self.pages_dir, "index.md")]
+
+        for c, group in self._commands():
+            files.append(command_page_file(self.reference_pages_dir, c, group))
+
+        if self.enum_page_size:
+            files.extend(p.path for p in self._enum_pages())
+        elif self.app.schemas:
+            files.append(os.path.join(self.reference_pages_dir, "enums.md"))
+
+        return files
+
+    def _enum_pages(self):
+        """Split each enum in pages of `enum_page_size` items."""
+        pages = []
+
+        for e in self.app.schemas.enums:
+            items = list(e.items.items())
+            count = max(1, -(-len(items) // self.enum_page_size))
+
+            for i in range(count):
+                start = i * self.enum_page_size
+                pages.append(
+                    EnumPage(
+                        name=class_name(e.name),
+                        slug=function_name(e.name),
+                        description=e.description,
+                        items=items[start : start + self.enum_page_size],
+                        number=i + 1,
+                        count=count,
+                        start=start,
+                        total=len(items),
+                        directory=self.enums_pages_dir,
+                    )
+                )
 
-    def _write_mkdocs_conf(self):
-        """Too much stuff going on here"""
-        conf_file = os.path.join(self.output_path, "mkdocs.yml")
+        return pages
 
+    def _create_directories(self):
+        """Create only the directories that are missing, so builds
+        can reuse an existing output path.
+        """
+        for d in self._directories():
+            if not os.path.isdir(d):
+                os.makedirs(d)
+
+    def _stale_pages(self):
+        """Yield the reference pages that are not part of the
+        documentation anymore, e.g. from removed commands.
+        """
+        files = set(self._page_files())
+
+        for root, _, filenames in os.walk(self.reference_pages_dir):
+            for f in filenames:
+                path = os.path.join(root, f)
+                if f.endswith(".md") and path not in files:
+                    yield path
+
+    def _remove_stale_pages(self):
+        """Remove the stale pages and the folders left empty."""
+        for path in list(self._stale_pages()):
+            os.remove(path)
+
+        dirs = set(self._directories())
+        for root, _, _ in os.walk(self.reference_pages_dir, topdown=False):
+            if root not in dirs and not os.listdir(root):
+                os.rmdir(root)
+
+    def _nav(self):
         nav = []
         nav.append({"Home": "index.md"})
         reference_page = []
@@ -86,48 +287,87 @@ class Builder:
             commands_section["Commands"].append({c.name: f"reference/{c.name}.md"})
 
         reference_page.append(commands_section)
-        reference_page.append({"Schemas": [{"Enums": "reference/enums.md"}]})
+        reference_page.append({"Schemas": [{"Enums": self._enums_nav()}]})
 
         nav.append({"Reference": reference_page})
-
-        with open(conf_file, "w") as fp:
-            yaml.dump(
+        return nav
+
+    def _mkdocs_conf(self, nav):
+        return {
+            "site_name": self.app.name,
+            "theme": {"name": "material", "features": ["navigation.instant"]},
+            "repo_url": self.app.url,
+            "nav": nav,
+            "markdown_extensions": [
+                "attr_list",
                 {
-                    "site_name": self.app.name,
-                    "theme": {"name": "material", "features": ["navigation.instant"]},
-                    "repo_url": self.app.url,
-                    "nav": nav,
-                    "markdown_extensions": [
-                        "attr_list",
-                        {
-                            "pymdownx.emoji": {
-                                "emoji_index": twemoji,
-                                "emoji_generator": to_svg,
-                            }
-                        },
-                        {"pymdownx.highlight": {"anchor_linenums": True}},
-                        "pymdownx.inlinehilite",
-                        "pymdownx.snippets",
-                        "pymdownx.superfences",
-                    ],
+                    "pymdownx.emoji": {
+                        "emoji_index": twemoji,
+                        "emoji_generator": to_svg,
+                    }
                 },
-                fp,
-                sort_keys=False,
-            )
+                {"pymdownx.highlight": {"anchor_linenums": True}},
+                "pymdownx.inlinehilite",
+                "pymdownx.snippets",
+                "pymdownx.superfences",
+            ],
+        }
+
+    def _render_mkdocs_conf(self):
+        return yaml.dump(self._mkdocs_conf(self._nav()), sort_keys=False)
+
+    def _write_mkdocs_conf(self):
+        conf_file = os.path.join(self.output_path, "mkdocs.yml")
+        write_if_changed(conf_file, self._render_mkdocs_conf())
+
+    def _enums_nav(self):
+        if not self.enum_page_size:
+            return "reference/enums.md"
+
+        nav = {}
+        for p in self._enum_pages():
+            entry = f"reference/enums/{p.file(p.number)}"
+            if p.count == 1:
+                nav[p.name] = entry
+            else:
+                end = p.start + len(p.items)
+                nav.setdefault(p.name, []).append({f"{p.start + 1}-{end}": entry})
+
+        return [{name: entry} for name, entry in nav.items()]
 
     def _write_pages(self):
         self._write_index_page()
 
-        for g in self.app.cli.groups:
-            for c in g.commands:
-                self._write_command_page(c, g.name)
-
-        for c in self.app.cli.commands:
-            self._write_command_page(c)
+        tasks = [
+            (write_command_page, (self.app.exec, self.reference_pages_dir, c, group))
+            for c, group in self._commands()
+        ]
 
-        if self.app.schemas:
+        if self.enum_page_size:
+            tasks.extend((write_enum_page, (p,)) for p in self._enum_pages())
+        elif self.app.schemas:
             self._write_enums_page()
 
+        self._write_page_tasks(tasks)
+
+    def _write_page_tasks(self, tasks):
+        jobs = self.jobs or os.cpu_count() or 1
+
+        if jobs == 1 or len(tasks) < 2:
+            write_pages(tasks, self.store)
+            return
+
+        # contiguous slices, so each worker writes neighbouring pages
+        size = -(-len(tasks) // jobs)
+        slices = [tasks[i : i + size] for i in range(0, len(tasks), size)]
+
+        with process_pool(jobs) as executor:
+            futures = [executor.submit(write_pages, s, self.store) for s in slices]
+            for f in futures:
+                _, stats = f.result()
+                if stats is not None:
+                    self.store.merge(stats)
+
     def _author_list(self):
         for a in self.app.authors:
             parts = [
@@ -140,101 +380,303 @@ class Builder:
 
     def _write_index_page(self):
         page_file = os.path.join(self.pages_dir, "index.md")
+        write_document(page_file, self._index_page())
 
-        with open(page_file, "w") as fp:
-            doc = Document(self.app.name)
-            doc.add(Paragraph(self.app.description))
-
-            if self.app.authors:
-                doc.add(Heading("Authors", level=1))
-                doc.add(UnorderedList(self._author_list()))
-
-            doc.write(fp)
-
-    def _write_command_page(self, command, group=None):
-        def args_rows(args):
-            for a in args:
-                desc = a.description if a.description else ""
-                exmp = a.example if a.example else ""
-                yield [sandwich(a.name, "`"), a.type.value, desc, exmp]
-
-        def opts_rows(opts):
-            for o in opts:
-                desc = o.description if o.description else ""
-                exmp = o.example if o.example else ""
-                default = o.default if o.default else ""
-                yield [sandwich(o.name, "`"), o.type.value, desc, default, exmp]
-
-        if group is not None:
-            page_file = os.path.join(
-                self.reference_pages_dir, group, f"{command.name}.md"
-            )
+    def _index_page(self):
+        doc = Document(self.app.name)
+        doc.add(Paragraph(self.app.description))
+
+        if self.app.authors:
+            doc.add(Heading("Authors", level=1))
+            doc.add(UnorderedList(self._author_list()))
+
+        return doc
+
+    def _write_enums_page(self):
+        page_file = os.path.join(self.reference_pages_dir, f"enums.md")
+
+        content = fetch(
+            self.store,
+            ["docs-enums", self.VERSION, self.app.schemas],
+            self._render_enums_page,
+        )
+        write_if_changed(page_file, content)
+
+    def _render_enums_page(self):
+        doc = Document("Enums")
+        doc.add(Paragraph("Enumerations used by the project."))
+
+        for e in self.app.schemas.enums:
+            doc.add(Heading(name=class_name(e.name), level=1))
+
+            if e.description:
+                doc.add(Paragraph(e.description))
+
+            rows = [[sandwich(k, "`"), v] for k, v in e.items.items()]
+            doc.add(Table(header=ENUM_HEADER, rows=rows, bold=True))
+
+        return doc.render()
+
+
+def command_page_file(reference_pages_dir, command, group=None):
+    if group is not None:
+        return os.path.join(reference_pages_dir, group, f"{command.name}.md")
+    return os.path.join(reference_pages_dir, f"{command.name}.md")
+
+
+def write_command_page(app_exec, reference_pages_dir, command, group=None, store=None):
+    """Write the page of a single command. This is a module level
+    function, so it can run in worker processes.
+    """
+    page_file = command_page_file(reference_pages_dir, command, group)
+    content = fetch(
+        store,
+        ["docs-command", Builder.VERSION, app_exec, group or "", command],
+        lambda: render_command_page(app_exec, command, group),
+    )
+    return write_if_changed(page_file, content)
+
+
+def render_command_page(app_exec, command, group=None):
+    def args_rows(args):
+        for a in args:
+            desc = a.description if a.description else ""
+            exmp = a.example if a.example else ""
+            yield [sandwich(a.name, "`"), a.type.value, desc, exmp]
+
+    def opts_rows(opts):
+        for o in opts:
+            desc = o.description if o.description else ""
+            exmp = o.example if o.example else ""
+            default = o.default if o.default else ""
+            yield [sandwich(o.name, "`"), o.type.value, desc, default, exmp]
+
+    cmd_parts = [app_exec]
+
+    if group is not None:
+        cmd_parts.append(group)
+
+    cmd_parts.append(command.name)
+
+    args = [f"<{a.name}>" for a in command.arguments]
+    if args:
+        cmd_parts.append(" ".join(args))
+
+    opts = []
+    for o in command.options:
+        if o.short:
+            opts.append(f"[-{o.short}|--{o.name}]")
         else:
-            page_file = os.path.join(self.reference_pages_dir, f"{command.name}.md")
-        cmd_parts = [self.app.exec]
+            opts.append(f"[--{o.name}]")
 
-        if group is not None:
-            cmd_parts.append(group)
+    if opts:
+        cmd_parts.append(" ".join(opts))
 
-        cmd_parts.append(command.name)
+    doc = Document(command.name)
 
-        args = [f"<{a.name}>" for a in command.arguments]
-        if args:
-            cmd_parts.append(" ".join(args))
+    if command.description:
+        doc.add(Paragraph(command.description))
 
-        opts = []
-        for o in command.options:
-            if o.short:
-                opts.append(f"[-{o.short}|--{o.name}]")
-            else:
-                opts.append(f"[--{o.name}]")
+    doc.add(fragment(Heading("Usage", level=1)))
+    doc.add(Command(cmd_parts))
 
-        if opts:
-            cmd_parts.append(" ".join(opts))
+    if args:
+        # arguments table
+        doc.add(fragment(Heading("Arguments", level=1)))
+        doc.add(
+            Table(header=ARGUMENTS_HEADER, rows=args_rows(command.arguments), bold=True)
+        )
 
-        with open(page_file, "w") as fp:
-            doc = Document(command.name)
+    if opts:
+        # options table
+        doc.add(fragment(Heading("Options", level=1)))
+        doc.add(
+            Table(header=OPTIONS_HEADER, rows=opts_rows(command.options), bold=True)
+        )
 
-            if command.description:
-                doc.add(Paragraph(command.description))
+    return doc.render()
 
-            doc.add(Heading("Usage", level=1))
-            doc.add(Command(cmd_parts))
 
-            if args:
-                # arguments table
-                doc.add(Heading("Arguments", level=1))
-                header = ["Argument", "Type", "Description", "Example"]
-                doc.add(
-                    Table(header=header, rows=args_rows(command.arguments), bold=True)
-                )
+def estimate_command_page(app_exec, command, group=None):
+    """Estimated size of the page `render_command_page` renders, worked
+    out from the lengths of the names and descriptions alone.
+    """
+    size = len(command.name) + 4
+    if command.description:
+        size += len(command.description) + 2
+
+    # usage heading and command line
+    usage = len(app_exec) + len(command.name) + 1
+    if group is not None:
+        usage += len(group) + 1
+    usage += sum(len(a.name) + 3 for a in command.arguments)
+    usage += sum(len(o.name) + 5 for o in command.options)
+    usage += sum(len(o.short) + 2 for o in command.options if o.short)
+    size += 10 + usage + 6
+
+    if command.arguments:
+        rows = (
+            [
+                len(a.name) + 2,
+                len(a.type.value),
+                len(a.description or ""),
+                len(str(a.example or "")),
+            ]
+            for a in command.arguments
+        )
+        size += 14 + markdown_table_size(ARGUMENTS_HEADER, rows)
+
+    if command.options:
+        rows = (
+            [
+                len(o.name) + 2,
+                len(o.type.value),
+                len(o.description or ""),
+                len(str(o.default or "")),
+                len(str(o.example or "")),
+            ]
+            for o in command.options
+        )
+        size += 12 + markdown_table_size(OPTIONS_HEADER, rows)
 
-            if opts:
-                # options table
-                doc.add(Heading("Options", level=1))
-                header = ["Option", "Type", "Description", "Default", "Example"]
-                doc.add(
-                    Table(header=header, rows=opts_rows(command.options), bold=True)
-                )
+    return size
 
-            doc.write(fp)
 
-    def _write_enums_page(self):
-        page_file = os.path.join(self.reference_pages_dir, f"enums.md")
+def write_pages(tasks, store=None):
+    """Run a slice of `(function, args)` page writing tasks, returning
+    how many pages changed and the statistics of the artifact store.
+    """
+    changed = 0
+    for function, args in tasks:
+        changed += function(*args, store=store)
+
+    return changed, store.stats() if store else None
+
+
+@dataclass
+class EnumPage:
+    """A page with a slice of the items of an enum."""
+
+    name: str
+    slug: str
+    description: str
+    items: list
+    number: int
+    count: int
+    start: int
+    total: int
+    directory: str
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, self.file(self.number))
+
+    def file(self, number):
+        return f"{self.slug}.md" if number == 1 else f"{self.slug}-{number}.md"
+
 
-        with open(page_file, "w") as fp:
-            doc = Document("Enums")
-            doc.add(Paragraph("Enumerations used by the project."))
+def write_enum_page(page: EnumPage, store=None):
+    content = fetch(
+        store,
+        # the directory is left out, so pages are reused by other builds
+        ["docs-enum-page", Builder.VERSION, repr(replace(page, directory=""))],
+        lambda: render_enum_page(page),
+    )
+    return write_if_changed(page.path, content)
 
-            for e in self.app.schemas.enums:
-                name = re.sub("[^A-Za-z]", "", e.name.title())
-                doc.add(Heading(name=name, level=1))
 
-                if e.description:
-                    doc.add(Paragraph(e.description))
+def render_enum_page(page: EnumPage):
+    doc = Document(page.name)
+
+    if page.description and page.number == 1:
+        doc.add(Paragraph(page.description))
+
+    if page.count > 1:
+        end = page.start + len(page.items)
+        doc.add(Paragraph(f"Items {page.start + 1} to {end} of {page.total}."))
+
+    rows = [[sandwich(k, "`"), v] for k, v in page.items]
+    doc.add(Table(header=ENUM_HEADER, rows=rows, bold=True))
+
+    if page.count > 1:
+        links = []
+        if page.number > 1:
+            links.append(Link("Previous", page.file(page.number - 1)).render())
+        if page.number < page.count:
+            links.append(Link("Next", page.file(page.number + 1)).render())
+        doc.add(Paragraph(" | ".join(links)))
+
+    return doc.render()
+
+
+def estimate_enums_page(enums):
+    """Estimated size of the single page documenting all `enums`."""
+    size = len("# Enums\n\nEnumerations used by the project.\n\n")
+
+    for e in enums:
+        size += len(class_name(e.name)) + 5
+        if e.description:
+            size += len(e.description) + 2
+        rows = ([len(str(k)) + 2, len(str(v))] for k, v in e.items.items())
+        size += markdown_table_size(ENUM_HEADER, rows)
+
+    return size
+
+
+def estimate_enum_page(page: EnumPage):
+    size = len(page.name) + 4
+
+    if page.description and page.number == 1:
+        size += len(page.description) + 2
+
+    if page.count > 1:
+        end = page.start + len(page.items)
+        size += len(f"Items {page.start + 1} to {end} of {page.total}.") + 2
+
+        # links to the previous and next pages
+        links = []
+        if page.number > 1:
+            links.append(len(page.file(page.number - 1)) + 12)
+        if page.number < page.count:
+            links.append(len(page.file(page.number + 1)) + 8)
+        size += sum(links) + 3 * (len(links) - 1) + 2
+
+    rows = ([len(str(k)) + 2, len(str(v))] for k, v in page.items)
+    return size + markdown_table_size(ENUM_HEADER, rows)
+
+
+def nav_size(nav, indent=0):
+    """Estimated size of a MkDocs `nav` list dumped to YAML."""
+    size = 0
+
+    for entry in nav:
+        for title, value in entry.items():
+            size += indent + len(str(title)) + 4
+            if isinstance(value, list):
+                size += nav_size(value, indent + 2)
+            else:
+                size += len(value) + 1
+
+    return size
+
+
+def write_document(path, doc: Document):
+    return write_if_changed(path, doc.render())
+
+
+def write_if_changed(path, content: str):
+    """Write `content` to `path` unless the file already has the
+    same content, so unchanged files keep their modification time.
+    Returns whether the file was written.
+    """
+    try:
+        with open(path) as fp:
+            if fp.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
 
-                header = ["Key", "Value"]
-                rows = [[sandwich(k, "`"), v] for k, v in e.items.items()]
-                doc.add(Table(header=header, rows=rows, bold=True))
+    with open(path, "w") as fp:
+        fp.write(content)
 
-            doc.write(fp)
+    return True
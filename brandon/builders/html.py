@@ -0,0 +1,270 @@
+import os
+import json
+from html import escape
+
+from brandon.builders.assets import PostBuild, CACHE_DIR
+from brandon.names import class_name
+
+STYLE = """body{font-family:sans-serif;max-width:960px;margin:0 auto;padding:0 1em;color:#222}
+nav{border-bottom:1px solid #ddd;padding:.5em 0}nav a{margin-right:1em}
+table{border-collapse:collapse;width:100%;margin-bottom:1em}
+th,td{border:1px solid #ddd;padding:.3em .6em;text-align:left}th{background:#f5f5f5}
+code{background:#f5f5f5;padding:0 .2em}#results li{margin:.3em 0}"""
+
+SEARCH_SCRIPT = """(function(){
+var input=document.getElementById("search"),list=document.getElementById("results"),docs=null;
+input.addEventListener("input",function(){
+if(docs===null){fetch(input.dataset.index).then(function(r){return r.json()}).then(function(d){docs=d.docs;show()});return}
+show()});
+function show(){
+var q=input.value.toLowerCase().split(/\\s+/).filter(Boolean);list.innerHTML="";
+if(!q.length)return;
+docs.filter(function(d){var t=(d[0]+" "+d[2]).toLowerCase();return q.every(function(w){return t.indexOf(w)>=0})})
+.slice(0,50).forEach(function(d){var li=document.createElement("li"),a=document.createElement("a");
+a.href=input.dataset.root+d[1];a.textContent=d[0];li.appendChild(a);list.appendChild(li)})}
+})();"""
+
+
+class Builder:
+    """Render the documentation straight to static HTML, without
+    MkDocs. The whole reference is rendered to a single page or, if
+    `chunked` is set, to one page per group. A compact JSON search
+    index with commands, options and enums is written next to the
+    pages. Assets can be fingerprinted and text files compressed after
+    the pages are written, see `assets.PostBuild`.
+    """
+
+    def __init__(
+        self, app, output_path: str, chunked=False, fingerprint=False, compress=False
+    ) -> None:
+        self.app = app
+        self.chunked = chunked
+        self.fingerprint = fingerprint
+        self.compress = compress
+        self.output_path = os.path.join(output_path, f"{app.exec}-docs", "site")
+        self.search_entries = []
+
+    def build(self):
+        """Write the pages, returning the statistics of the post-build
+        stage, if it ran.
+        """
+        os.makedirs(self.output_path, exist_ok=True)
+        self.search_entries = []
+
+        if self.chunked:
+            self._write_chunked_pages()
+        else:
+            self._write_page("index.html", self.app.name, self._render_reference())
+
+        self._write_assets()
+
+        if self.fingerprint or self.compress:
+            return PostBuild(
+                site_dir=self.output_path,
+                cache_dir=os.path.join(os.path.dirname(self.output_path), CACHE_DIR),
+                fingerprint=self.fingerprint,
+                compress=self.compress,
+            ).run()
+
+    def _write_chunked_pages(self):
+        sections = [self._render_home(), "<h2>Reference</h2>", "<ul>"]
+
+        for g in self.app.cli.groups:
+            sections.append(f'<li><a href="{group_page(g)}">{escape(g.name)}</a></li>')
+
+        if self.app.cli.commands:
+            sections.append('<li><a href="commands.html">Commands</a></li>')
+
+        if self.app.schemas.enums:
+            sections.append('<li><a href="enums.html">Enums</a></li>')
+
+        sections.append("</ul>")
+        self._write_page("index.html", self.app.name, "\n".join(sections))
+
+        for g in self.app.cli.groups:
+            self._write_page(group_page(g), g.name, self._render_group(g))
+
+        if self.app.cli.commands:
+            body = self._render_commands(self.app.cli.commands, page="commands.html")
+            self._write_page("commands.html", "Commands", body)
+
+        if self.app.schemas.enums:
+            self._write_page("enums.html", "Enums", self._render_enums("enums.html"))
+
+    def _render_reference(self):
+        sections = [self._render_home()]
+
+        for g in self.app.cli.groups:
+            sections.append(self._render_group(g, page="index.html"))
+
+        sections.append(self._render_commands(self.app.cli.commands, "index.html"))
+
+        if self.app.schemas.enums:
+            sections.append(self._render_enums("index.html"))
+
+        return "\n".join(sections)
+
+    def _render_home(self):
+        lines = [f"<p>{escape(self.app.description)}</p>"]
+
+        if self.app.authors:
+            lines.append("<h2>Authors</h2>")
+            lines.append("<ul>")
+            for a in self.app.authors:
+                author = escape(a.name)
+                if a.email:
+                    author += f' &lt;<a href="mailto:{escape(a.email)}">{escape(a.email)}</a>&gt;'
+                if a.url:
+                    author += f' <a href="{escape(a.url)}">{escape(a.url)}</a>'
+                lines.append(f"<li>{author}</li>")
+            lines.append("</ul>")
+
+        return "\n".join(lines)
+
+    def _render_group(self, group, page=None):
+        page = page or group_page(group)
+        anchor = f"group-{group.name}"
+        self._add_entry(group.name, page, anchor, group.description or "")
+
+        lines = [f'<h2 id="{anchor}">{escape(group.name)}</h2>']
+        if group.description:
+            lines.append(f"<p>{escape(group.description)}</p>")
+
+        lines.append(self._render_commands(group.commands, page, group))
+        return "\n".join(lines)
+
+    def _render_commands(self, commands, page, group=None):
+        return "\n".join(self._render_command(c, page, group) for c in commands)
+
+    def _render_command(self, command, page, group=None):
+        names = [command.name] if group is None else [group.name, command.name]
+        title = " ".join(names)
+        anchor = "-".join(["command"] + names)
+
+        cmd_parts = [self.app.exec] + names
+        cmd_parts.extend(f"<{a.name}>" for a in command.arguments)
+
+        for o in command.options:
+            if o.short:
+                cmd_parts.append(f"[-{o.short}|--{o.name}]")
+            else:
+                cmd_parts.append(f"[--{o.name}]")
+
+        self._add_entry(
+            title,
+            page,
+            anchor,
+            " ".join(
+                [command.description or ""]
+                + [a.name for a in command.arguments]
+                + [f"--{o.name}" for o in command.options]
+            ),
+        )
+
+        lines = [f'<h3 id="{anchor}">{escape(title)}</h3>']
+        if command.description:
+            lines.append(f"<p>{escape(command.description)}</p>")
+        lines.append(f"<p><code>$ {escape(' '.join(cmd_parts))}</code></p>")
+
+        if command.arguments:
+            lines.append("<h4>Arguments</h4>")
+            lines.append(
+                _table(
+                    ["Argument", "Type", "Description", "Example"],
+                    [
+                        [f"<code>{escape(a.name)}</code>", a.type.value]
+                        + [escape(str(v or "")) for v in (a.description, a.example)]
+                        for a in command.arguments
+                    ],
+                )
+            )
+
+        if command.options:
+            lines.append("<h4>Options</h4>")
+            lines.append(
+                _table(
+                    ["Option", "Type", "Description", "Default", "Example"],
+                    [
+                        [f"<code>{escape(o.name)}</code>", o.type.value]
+                        + [
+                            escape(str(v or ""))
+                            for v in (o.description, o.default, o.example)
+                        ]
+                        for o in command.options
+                    ],
+                )
+            )
+
+        return "\n".join(lines)
+
+    def _render_enums(self, page):
+        lines = ['<h2 id="enums">Enums</h2>']
+
+        for e in self.app.schemas.enums:
+            name = class_name(e.name)
+            anchor = f"enum-{name}"
+            self._add_entry(name, page, anchor, e.description or "")
+
+            lines.append(f'<h3 id="{anchor}">{escape(name)}</h3>')
+            if e.description:
+                lines.append(f"<p>{escape(e.description)}</p>")
+
+            rows = [
+                [f"<code>{escape(str(k))}</code>", escape(str(v))]
+                for k, v in e.items.items()
+            ]
+            lines.append(_table(["Key", "Value"], rows))
+
+        return "\n".join(lines)
+
+    def _add_entry(self, title, page, anchor, text):
+        self.search_entries.append([title, f"{page}#{anchor}", text])
+
+    def _write_page(self, filename, title, body):
+        page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="style.css">
+</head>
+<body>
+<nav><a href="index.html">{escape(self.app.name)}</a>
+<input id="search" type="search" placeholder="Search" data-index="search_index.json" data-root="">
+<ul id="results"></ul></nav>
+<h1>{escape(title)}</h1>
+{body}
+<script src="search.js"></script>
+</body>
+</html>
+"""
+        with open(os.path.join(self.output_path, filename), "w") as fp:
+            fp.write(page)
+
+    def _write_assets(self):
+        with open(os.path.join(self.output_path, "style.css"), "w") as fp:
+            fp.write(STYLE)
+
+        with open(os.path.join(self.output_path, "search.js"), "w") as fp:
+            fp.write(SEARCH_SCRIPT)
+
+        with open(os.path.join(self.output_path, "search_index.json"), "w") as fp:
+            json.dump({"docs": self.search_entries}, fp, separators=(",", ":"))
+
+
+def group_page(group):
+    """File of the page of `group` in chunked mode. The prefix keeps
+    groups named e.g. `index` or `enums` from replacing other pages.
+    """
+    return f"group-{group.name}.html"
+
+
+def _table(header, rows):
+    lines = ["<table>"]
+    lines.append("<tr>" + "".join(f"<th>{h}</th>" for h in header) + "</tr>")
+
+    for r in rows:
+        lines.append("<tr>" + "".join(f"<td>{c}</td>" for c in r) + "</tr>")
+
+    lines.append("</table>")
+    return "\n".join(lines)
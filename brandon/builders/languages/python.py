@@ -1,12 +1,26 @@
 import os
-import re
+import shutil
 import logging
-import keyword
+import zipapp
+import tempfile
+import compileall
+import py_compile
+import importlib.metadata
 
-from brandon.md_utils import sandwich
+import click
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from brandon.plan import Plan
+from brandon.drift import check_files
+from brandon.store import fetch
+from brandon.names import class_name, member_name, function_name, safe_identifier
+
+logger = logging.getLogger(__name__)
+
+# installation records of the bundled click, not needed in the zipapp
+VENDOR_SKIP = {"INSTALLER", "RECORD", "REQUESTED"}
+
+# black's default line length
+LINE_LENGTH = 88
 
 
 class Module:
@@ -26,47 +40,122 @@ class Module:
                 continue
 
             self.add_expr(f"import {i}")
-        self.add_expr(os.linesep)
+
+        if self.imports:
+            self.add_expr(os.linesep)
 
     def add_expr(self, line, level=0):
         self.lines.append("    " * level + line)
 
-    def add_enum(self, enum):
-        fmt_name = re.sub("[^A-Za-z]", "", enum.name.title())
-        if not fmt_name.isidentifier() or keyword.iskeyword(fmt_name):
-            fmt_name = f"_{fmt_name}"
+    def add_lines(self, lines):
+        self.lines.extend(lines)
+
+    def add_enum(self, enum, level=0):
+        fmt_name = safe_identifier(class_name(enum.name))
 
-        self.add_expr(f"class {fmt_name}(Enum):")
+        self.add_expr(f"class {fmt_name}(Enum):", level=level)
         if enum.description:
-            self.add_expr(f'"""{enum.description}"""', level=1)
+            self.add_expr(docstring(enum.description, level + 1), level=level + 1)
+            self.add_expr("")
 
         for k, v in enum.items.items():
-            guard = '"' if type(v) == str else ""
-            fmt_item_name = re.sub("[^A-Za-z_]", "", k).upper()
-            self.add_expr(f"{fmt_item_name} = {sandwich(v, guard)}", level=1)
+            value = string_literal(v) if type(v) == str else repr(v)
+            fmt_item_name = safe_identifier(member_name(k))
+            self.add_expr(f"{fmt_item_name} = {value}", level=level + 1)
+
+        if not enum.items:
+            self.add_expr("pass", level=level + 1)
+
+        if level == 0:
+            self.add_expr(os.linesep)
+
+    def add_lazy_enums(self, enums):
+        """Add the enums wrapped in factory functions, which are only
+        called by the module `__getattr__` (PEP 562) when an enum is
+        first used, so importing the module doesn't create them.
+        """
+        factories = {}
+
+        for e in enums:
+            fmt_name = safe_identifier(class_name(e.name))
+            factories[fmt_name] = f"_{function_name(e.name)}"
+
+            self.add_expr(f"def {factories[fmt_name]}():")
+            self.add_enum(e, level=1)
+            self.add_expr("")
+            self.add_expr(f'{fmt_name}.__qualname__ = "{fmt_name}"', level=1)
+            self.add_expr(f"return {fmt_name}", level=1)
+            self.add_expr(os.linesep)
+
+        if factories:
+            self.add_expr("_ENUMS = {")
+            for name, factory in factories.items():
+                self.add_expr(f'"{name}": {factory},', level=1)
+            self.add_expr("}")
+        else:
+            self.add_expr("_ENUMS = {}")
         self.add_expr(os.linesep)
 
+        self.add_expr("def __getattr__(name):")
+        self.add_expr('"""Create the enums when they are first used."""', level=1)
+        self.add_expr("try:", level=1)
+        self.add_expr("factory = _ENUMS[name]", level=2)
+        self.add_expr("except KeyError:", level=1)
+        self.add_expr(
+            'raise AttributeError(f"module {__name__!r} has no attribute {name!r}")',
+            level=2,
+        )
+        self.add_expr("return globals().setdefault(name, factory())", level=1)
+        self.add_expr(os.linesep)
+
+        self.add_expr("def __dir__():")
+        self.add_expr("return sorted(set(globals()) | set(_ENUMS))", level=1)
+
     def add_function(self, name, comment, params=[], decorators=[]):
-        fmt_name = re.sub("[^A-Za-z_]", "", name.replace("-", "_")).lower()
-        if not fmt_name.isidentifier() or keyword.iskeyword(fmt_name):
-            fmt_name = f"_{fmt_name}"
+        fmt_name = safe_identifier(function_name(name))
 
         for d in decorators:
-            self.add_expr(d.expression)
+            self.add_lines(d.lines())
 
-        self.add_expr(f"def {fmt_name}({', '.join(params)}):")
-        self.add_expr(f'"""{comment}"""', level=1)
+        self.add_lines(wrap_call(f"def {fmt_name}", params, ":", is_def=True))
+        self.add_expr(docstring(comment, 1), level=1)
+        self.add_expr(os.linesep)
+
+    def add_shared_params(self, name, comment, params):
+        """Add the click parameter objects `params` once, in a module
+        level list, and a `name` decorator that appends them to the
+        parameters of a command, after the ones of its own decorators.
+        """
+        self.add_expr("_SHARED_PARAMS = [")
+        for p in params:
+            self.add_lines(p.lines(prefix="", suffix=",", level=1))
+        self.add_expr("]")
+        self.add_expr(os.linesep)
+
+        self.add_expr(f"def {name}(f):")
+        self.add_expr(docstring(comment, 1), level=1)
+        # click reverses the parameters of the decorators when creating
+        # the command, as decorators are applied from the bottom up
+        self.add_expr('params = getattr(f, "__click_params__", [])', level=1)
+        self.add_expr("f.__click_params__ = params + _SHARED_PARAMS[::-1]", level=1)
+        self.add_expr("return f", level=1)
         self.add_expr(os.linesep)
 
     def add_main(self, function_name="main"):
         self.add_expr('if __name__ == "__main__":')
         self.add_expr(f"{function_name}()", level=1)
-        self.add_expr("")
 
-    def write(self):
+    def render(self):
+        """Join the lines, ending the module with a single newline as
+        black does.
+        """
+        content = os.linesep.join(self.lines).rstrip()
+        return content + os.linesep if content else ""
+
+    def write(self, content=None):
+        """Write the module, or `content` previously rendered from it."""
         with open(self.filepath, "w") as fp:
-            fp.write(os.linesep.join(self.lines))
-            fp.write(os.linesep)
+            fp.write(self.render() if content is None else content)
 
 
 class Decorator:
@@ -78,21 +167,140 @@ class Decorator:
 
     @property
     def expression(self):
+        return f"@{self.call}"
+
+    @property
+    def items(self):
+        return list(self.args) + [f"{k}={v}" for k, v in self.kwargs.items()]
+
+    def lines(self, prefix="@", suffix="", level=0):
+        """The decorator expression, wrapped as black would do if it
+        doesn't fit in a line.
+        """
+        if self.no_params:
+            return ["    " * level + f"{prefix}{self.name}{suffix}"]
+        return wrap_call(f"{prefix}{self.name}", self.items, suffix, level)
+
+    @property
+    def call(self):
+        """The decorator expression without the `@`, so it can
+        also be applied as a regular function call.
+        """
         if self.no_params:
-            return f"@{self.name}"
+            return self.name
 
         if len(self.kwargs) == 0 and len(self.args) == 0:
-            return f"@{self.name}()"
+            return f"{self.name}()"
 
         if len(self.kwargs) == 0:
-            return f'@{self.name}({", ".join(self.args)})'
+            return f'{self.name}({", ".join(self.args)})'
 
         if len(self.args) == 0:
             return (
-                f'@{self.name}({", ".join(f"{k}={v}" for k,v in self.kwargs.items())})'
+                f'{self.name}({", ".join(f"{k}={v}" for k,v in self.kwargs.items())})'
             )
 
-        return f'@{self.name}({", ".join(self.args)}, {", ".join(f"{k}={v}" for k,v in self.kwargs.items())})'
+        return f'{self.name}({", ".join(self.args)}, {", ".join(f"{k}={v}" for k,v in self.kwargs.items())})'
+
+
+def wrap_call(head, items, tail="", level=0, is_def=False):
+    """Lines of the call `{head}({items}){tail}`, following black's
+    default style: a single line if it fits in `LINE_LENGTH`, otherwise
+    the items in an indented line of their own or, if they still don't
+    fit, one item per line with a trailing comma.
+    """
+    indent = "    " * level
+    line = f"{indent}{head}({', '.join(items)}){tail}"
+
+    if len(line) <= LINE_LENGTH or not items:
+        return [line]
+
+    body = f"{indent}    {', '.join(items)}"
+    if len(items) == 1:
+        # black adds a trailing comma to a lone parameter of a function
+        # definition, but not to a lone argument of a call
+        return [f"{indent}{head}(", body + ("," if is_def else ""), f"{indent}){tail}"]
+
+    if len(body) <= LINE_LENGTH:
+        return [f"{indent}{head}(", body, f"{indent}){tail}"]
+
+    return (
+        [f"{indent}{head}("]
+        + [f"{indent}    {i}," for i in items]
+        + [f"{indent}){tail}"]
+    )
+
+
+def string_literal(value):
+    """Python literal of the string `value`, with the quotes black
+    prefers, i.e. double quotes unless single ones need fewer escapes.
+    """
+    value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace("\r", "\\r")
+    if value.count('"') > value.count("'"):
+        return "'" + value.replace("'", "\\'") + "'"
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+def docstring(text, level=0):
+    """Docstring of `text` at the indentation `level`, laid out as black
+    does: lines are stripped of trailing whitespace, continuation lines
+    are indented like the docstring, keeping their relative indentation,
+    and the closing quotes of multi-line docstrings move to their own
+    line when the last one is too long.
+    """
+    indent = " " * 4 * level
+    text = str(text).strip().replace("\\", "\\\\").replace('"""', '\\"\\"\\"')
+    lines = [line.rstrip() for line in text.splitlines()] or [""]
+
+    rest = [_expand_leading_tabs(line) for line in lines[1:]]
+    margin = min((len(line) - len(line.lstrip()) for line in rest if line), default=0)
+    lines[1:] = [indent + line[margin:] if line else "" for line in rest]
+
+    if lines[0].startswith('"'):
+        lines[0] = " " + lines[0]
+    if lines[-1].endswith('"'):
+        lines[-1] += " "
+
+    # closing quotes that don't fit go on their own line
+    if len(lines) > 1 and len(lines[-1]) + 3 > LINE_LENGTH:
+        lines[-1] = lines[-1].rstrip()
+        lines.append(indent)
+
+    return '"""' + "\n".join(lines) + '"""'
+
+
+def _expand_leading_tabs(line):
+    stripped = line.lstrip()
+    return line[: len(line) - len(stripped)].expandtabs() + stripped
+
+
+def literal_size(value):
+    """Size of the string literal of `value`, escapes included."""
+    return len(string_literal(value))
+
+
+def call_size(head, items, tail="", level=0, is_def=False):
+    """Size, newlines included, of the lines `wrap_call` returns for
+    the same call, from the size of each one of `items`.
+    """
+    indent = 4 * level
+    joined = sum(items) + 2 * (len(items) - 1)
+    line = indent + len(head) + max(joined, 0) + 2 + len(tail)
+
+    if line <= LINE_LENGTH or not items:
+        return line + 1
+
+    opening = indent + len(head) + 2
+    closing = indent + len(tail) + 2
+    body = indent + 4 + joined
+
+    if len(items) == 1:
+        return opening + body + (2 if is_def else 1) + closing
+
+    if body <= LINE_LENGTH:
+        return opening + body + 1 + closing
+
+    return opening + sum(indent + i + 6 for i in items) + closing
 
 
 class Builder:
@@ -101,54 +309,161 @@ class Builder:
 
     """
 
-    def __init__(self, app, output_path) -> None:
+    VERSION = "4"
+
+    def __init__(
+        self, app, output_path, lazy_enums=False, store=None, zipapp=False
+    ) -> None:
         self.app = app
+        self.lazy_enums = lazy_enums
+        self.store = store
+        self.zipapp = zipapp
         self.project_root = os.path.join(output_path, f"{app.exec}-{app.version}")
         self.source_root = os.path.join(self.project_root, f"{app.exec}")
+        self.archive_path = os.path.join(
+            self.project_root, "dist", f"{app.exec}-{app.version}.pyz"
+        )
 
     def build(self):
         self._create_directories()
         self._create_modules()
+        self._remove_stale_modules()
         self._create_readme()
         self._create_toml()
 
+        if self.zipapp:
+            self._create_zipapp()
+
+    def plan(self, plan=None):
+        """Add the directories and files the build would write to
+        `plan`. Module sizes are estimated from the specification,
+        ignoring the extra indentation of wrapped lines, along with the
+        stale group modules it would remove. The zipapp is not part of
+        the plan, as it's built from the written modules.
+        """
+        plan = plan if plan is not None else Plan()
+        cli_dir = os.path.join(self.source_root, "cli")
+
+        plan.add_directory(self.project_root)
+        plan.add_directory(self.source_root)
+        plan.add_directory(cli_dir)
+        plan.add_directory(os.path.join(self.project_root, "tests"))
+
+        plan.add_file(os.path.join(self.source_root, "__init__.py"), 0)
+        plan.add_file(os.path.join(cli_dir, "__init__.py"), 0)
+
+        for g in self.app.cli.groups:
+            plan.add_file(
+                os.path.join(cli_dir, f"{g.name}.py"), self._estimate_group_module(g)
+            )
+
+        plan.add_file(
+            os.path.join(self.source_root, "main.py"), self._estimate_main_module()
+        )
+        plan.add_file(
+            os.path.join(self.source_root, "schemas.py"),
+            self._estimate_schemas_module(),
+        )
+        if self.zipapp:
+            plan.add_file(
+                os.path.join(self.source_root, "__main__.py"),
+                len(self._main_entry_module().render()),
+            )
+        plan.add_file(
+            os.path.join(self.project_root, "README.md"), len(self._render_readme())
+        )
+        plan.add_file(
+            os.path.join(self.project_root, "pyproject.toml"), len(self._render_toml())
+        )
+
+        for path in self._stale_modules():
+            plan.delete_file(path, os.path.getsize(path))
+
+        return plan
+
+    def _create_zipapp(self):
+        """Package the generated source in a single `.pyz` file, run with
+        `python {exec}-{version}.pyz`. Legacy `.pyc` files are compiled
+        next to each module, where `zipimport` looks for them, so the
+        bytecode is loaded straight from the archive. Their hashes are
+        not checked against the sources, which are included as well and
+        used instead by other Python versions. click is bundled as well,
+        so the archive only needs Python on the host.
+        """
+        with tempfile.TemporaryDirectory() as staging:
+            shutil.copytree(
+                self.source_root,
+                os.path.join(staging, self.app.exec),
+                ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+            )
+            self._main_entry_module(path=staging).write()
+            self._vendor_click(staging)
+
+            compileall.compile_dir(
+                staging,
+                quiet=1,
+                legacy=True,
+                invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+            )
+
+            os.makedirs(os.path.dirname(self.archive_path), exist_ok=True)
+            zipapp.create_archive(
+                staging, self.archive_path, interpreter="/usr/bin/env python3"
+            )
+
+    def _vendor_click(self, staging):
+        """Copy the click package brandon runs with to `staging`, along
+        with its metadata and license.
+        """
+        shutil.copytree(
+            os.path.dirname(click.__file__),
+            os.path.join(staging, "click"),
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+        )
+
+        for f in importlib.metadata.distribution("click").files or []:
+            if not f.parts[0].endswith(".dist-info") or f.name in VENDOR_SKIP:
+                continue
+            target = os.path.join(staging, *f.parts)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(f.locate(), target)
+
+    def _main_entry_module(self, path=None):
+        """`__main__` module running the CLI, for `python -m {exec}` and
+        as the entry point of the zipapp.
+        """
+        module = Module(
+            name="__main__",
+            path=path or self.source_root,
+            imports=[f"{self.app.exec}.main.cli"],
+        )
+        module.add_main(function_name="cli")
+        return module
+
     def _create_directories(self):
         os.makedirs(self.project_root, exist_ok=True)
         os.makedirs(os.path.join(self.source_root, "cli"), exist_ok=True)
         os.makedirs(os.path.join(self.project_root, "tests"), exist_ok=True)
 
-    def _create_grouped_command_decs(self, group, command):
+    def _create_grouped_command_decs(self, group, command, shared=([], [])):
         decorators = []
         decorators.append(
             Decorator(
                 name=f"{group.name}_group.command",
                 kwargs={
-                    "name": f'"{command.name}"',
-                    "help": f'"{command.description}"',
+                    "name": string_literal(command.name),
+                    "help": string_literal(command.description),
                 },
             )
         )
 
-        for a in command.arguments:
-            decorators.append(Decorator(name="click.argument", args=[f'"{a.name}"']))
+        arguments, options, uses_shared = self._own_params(group, command, shared)
+        decorators.extend(self._create_param_decs(arguments, options))
 
-        for o in command.options:
-            if o.short:
-                decorators.append(
-                    Decorator(
-                        name="click.option",
-                        args=[f'"-{o.short}"', f'"--{o.name}"', f'"{o.name}"'],
-                        kwargs={"help": f'"{o.description}"'},
-                    )
-                )
-            else:
-                decorators.append(
-                    Decorator(
-                        name="click.option",
-                        args=[f'"--{o.name}"', f'"{o.name}"'],
-                        kwargs={"help": f'"{o.description}"'},
-                    )
-                )
+        if uses_shared:
+            decorators.append(
+                Decorator(name=f"{group.name}_shared_params", no_params=True)
+            )
 
         return decorators
 
@@ -158,35 +473,89 @@ class Builder:
             Decorator(
                 name="cli.command",
                 kwargs={
-                    "name": f'"{command.name}"',
-                    "help": f'"{command.description}"',
+                    "name": string_literal(command.name),
+                    "help": string_literal(command.description),
                 },
             )
         )
+        decorators.extend(self._create_param_decs(command.arguments, command.options))
 
-        for a in command.arguments:
-            decorators.append(Decorator(name="click.argument", args=[f'"{a.name}"']))
+        return decorators
 
-        for o in command.options:
+    def _create_param_decs(self, arguments, options):
+        decorators = []
+
+        for a in arguments:
+            decorators.append(
+                Decorator(name="click.argument", args=[string_literal(a.name)])
+            )
+
+        for o in options:
             if o.short:
                 decorators.append(
                     Decorator(
                         name="click.option",
-                        args=[f'"-{o.short}"', f'"--{o.name}"', f'"{o.name}"'],
-                        kwargs={"help": f'"{o.description}"'},
+                        args=[
+                            string_literal(f"-{o.short}"),
+                            string_literal(f"--{o.name}"),
+                            string_literal(o.name),
+                        ],
+                        kwargs={"help": string_literal(o.description)},
                     )
                 )
             else:
                 decorators.append(
                     Decorator(
                         name="click.option",
-                        args=[f'"--{o.name}"', f'"{o.name}"'],
-                        kwargs={"help": f'"{o.description}"'},
+                        args=[string_literal(f"--{o.name}"), string_literal(o.name)],
+                        kwargs={"help": string_literal(o.description)},
                     )
                 )
 
         return decorators
 
+    def _create_param_objects(self, arguments, options):
+        """Calls creating the click parameter objects, with the same
+        declarations as the decorators of `_create_param_decs`.
+        """
+        objects = []
+
+        for d in self._create_param_decs(arguments, options):
+            name = "click.Argument" if d.name == "click.argument" else "click.Option"
+            objects.append(
+                Decorator(name=name, args=[f"[{', '.join(d.args)}]"], kwargs=d.kwargs)
+            )
+
+        return objects
+
+    def _shared_params(self, group):
+        """The arguments and options declared by the group, which are
+        emitted once in the group module, or empty lists if no command
+        inherits all of them.
+        """
+        if not group.arguments and not group.options:
+            return [], []
+
+        if not any(group.inherited_by(c) for c in group.commands):
+            return [], []
+
+        return group.arguments, group.options
+
+    def _own_params(self, group, command, shared):
+        """The arguments and options of `command` that are not part of
+        the `shared` parameters of the group, and whether it uses them.
+        Inherited parameters are the last ones of each list.
+        """
+        shared_args, shared_opts = shared
+        if not (shared_args or shared_opts) or not group.inherited_by(command):
+            return command.arguments, command.options, False
+
+        return (
+            command.arguments[: len(command.arguments) - len(shared_args)],
+            command.options[: len(command.options) - len(shared_opts)],
+            True,
+        )
+
     def _create_command_params(self, command):
         params = []
 
@@ -198,35 +567,67 @@ class Builder:
 
         return params
 
+    def rendered_files(self):
+        """Yield the path and content of each file of the project,
+        rendered in memory.
+        """
+        for module, content in self._modules():
+            yield module.filepath, content
+
+        yield os.path.join(self.project_root, "README.md"), self._render_readme()
+        yield os.path.join(self.project_root, "pyproject.toml"), self._render_toml()
+
+    def check(self, full=False):
+        """Compare the project on disk with the one the specification
+        generates, see `drift.check_files`.
+        """
+        return check_files(
+            self.rendered_files(), stale=self._stale_modules(), full=full
+        )
+
     def _create_modules(self):
+        for module, content in self._modules():
+            module.write(content)
+
+    def _stale_modules(self):
+        """Yield the modules of the `cli` package that are not generated
+        anymore, e.g. from removed or renamed groups.
+        """
+        cli_dir = os.path.join(self.source_root, "cli")
+        files = {os.path.join(cli_dir, "__init__.py")} | {
+            os.path.join(cli_dir, f"{g.name}.py") for g in self.app.cli.groups
+        }
+
+        if not os.path.isdir(cli_dir):
+            return
+
+        for f in sorted(os.listdir(cli_dir)):
+            path = os.path.join(cli_dir, f)
+            if f.endswith(".py") and path not in files:
+                yield path
+
+    def _remove_stale_modules(self):
+        for path in list(self._stale_modules()):
+            os.remove(path)
+
+    def _modules(self):
+        """Yield each module along with its rendered content."""
         cli_dir = os.path.join(self.source_root, "cli")
-        Module("__init__", path=self.source_root).write()
-        Module("__init__", path=cli_dir).write()
+        for init_mod in [
+            Module("__init__", path=self.source_root),
+            Module("__init__", path=cli_dir),
+        ]:
+            yield init_mod, init_mod.render()
 
         # group modules
         for g in self.app.cli.groups:
-            group_def = Decorator(
-                name="click.group",
-                kwargs={"name": f'"{g.name}"', "help": f'"{g.description}"'},
-            )
             group_mod = Module(name=g.name, path=cli_dir, imports=["click"])
-            group_mod.add_function(
-                name=f"{g.name}_group",
-                comment=f"`{g.name}` command group",
-                decorators=[group_def],
+            yield group_mod, fetch(
+                self.store,
+                ["python-group", self.VERSION, g],
+                lambda: self._render_group_module(group_mod, g),
             )
 
-            for c in g.commands:
-                decorators = self._create_grouped_command_decs(g, c)
-                params = self._create_command_params(c)
-                group_mod.add_function(
-                    name=f"{c.name}",
-                    comment=f"`{c.name}` command handler",
-                    decorators=decorators,
-                    params=params,
-                )
-            group_mod.write()
-
         # main module
         group_imports = [
             f"{self.app.exec}.cli.{g.name}.{g.name}_group" for g in self.app.cli.groups
@@ -255,22 +656,212 @@ class Builder:
 
         main_mod.add_expr(os.linesep)
         main_mod.add_main(function_name="cli")
-        main_mod.write()
+        yield main_mod, main_mod.render()
 
         # schemas module
         schemas_mod = Module(
             name="schemas", path=self.source_root, imports=["enum.Enum"]
         )
+        yield schemas_mod, fetch(
+            self.store,
+            ["python-schemas", self.VERSION, self.lazy_enums, self.app.schemas],
+            lambda: self._render_schemas_module(schemas_mod),
+        )
+
+        if self.zipapp:
+            entry_mod = self._main_entry_module()
+            yield entry_mod, entry_mod.render()
+
+    def _render_group_module(self, group_mod, g):
+        group_def = Decorator(
+            name="click.group",
+            kwargs={
+                "name": string_literal(g.name),
+                "help": string_literal(g.description),
+            },
+        )
+        group_mod.add_function(
+            name=f"{g.name}_group",
+            comment=f"`{g.name}` command group",
+            decorators=[group_def],
+        )
+
+        # group parameters are created once and shared by the commands
+        shared = self._shared_params(g)
+        if shared[0] or shared[1]:
+            group_mod.add_shared_params(
+                name=f"{g.name}_shared_params",
+                comment=f"Parameters shared by all commands in `{g.name}`",
+                params=self._create_param_objects(*shared),
+            )
+
+        for c in g.commands:
+            decorators = self._create_grouped_command_decs(g, c, shared)
+            params = self._create_command_params(c)
+            group_mod.add_function(
+                name=f"{c.name}",
+                comment=f"`{c.name}` command handler",
+                decorators=decorators,
+                params=params,
+            )
+
+        return group_mod.render()
+
+    def _render_schemas_module(self, schemas_mod):
+        if self.lazy_enums:
+            schemas_mod.add_lazy_enums(self.app.schemas.enums)
+        else:
+            for e in self.app.schemas.enums:
+                schemas_mod.add_enum(e)
+
+        return schemas_mod.render()
+
+    def _estimate_command_decs(self, head, name, description, level=0):
+        items = [literal_size(name) + 5, literal_size(description) + 5]
+        return call_size(head, items, level=level)
+
+    def _estimate_param_decs(self, arguments, options):
+        """Estimated size of the parameter decorators, as written by
+        `Decorator.lines`.
+        """
+        size = 0
+
+        for a in arguments:
+            size += call_size("@click.argument", [literal_size(a.name)])
+
+        for o in options:
+            items = [len(o.name) + 4, len(o.name) + 2, literal_size(o.description) + 5]
+            if o.short:
+                items.insert(0, len(o.short) + 3)
+            size += call_size("@click.option", items)
+
+        return size
+
+    def _estimate_param_objects(self, arguments, options):
+        """Estimated size of the items of `_SHARED_PARAMS`, as written
+        by `Module.add_shared_params`.
+        """
+        size = 0
+
+        for a in arguments:
+            items = [literal_size(a.name) + 2]
+            size += call_size("click.Argument", items, ",", level=1)
+
+        for o in options:
+            decls = [len(o.name) + 4, len(o.name) + 2]
+            if o.short:
+                decls.insert(0, len(o.short) + 3)
+            items = [sum(decls) + 2 * len(decls), literal_size(o.description) + 5]
+            size += call_size("click.Option", items, ",", level=1)
+
+        return size
+
+    def _estimate_function(self, name, comment, params=()):
+        definition = call_size(
+            f"def {function_name(name)}", [len(p) for p in params], ":", is_def=True
+        )
+        # docstring and the two blank lines after the function
+        return definition + len(docstring(comment, 1)) + 5 + 2
+
+    def _estimate_group_module(self, g):
+        size = len("import click") + 3
+
+        size += self._estimate_command_decs("@click.group", g.name, g.description)
+        size += self._estimate_function(f"{g.name}_group", f"`{g.name}` command group")
+
+        shared = self._shared_params(g)
+        if shared[0] or shared[1]:
+            comment = f"Parameters shared by all commands in `{g.name}`"
+            size += len("_SHARED_PARAMS = [") + 1
+            size += self._estimate_param_objects(*shared)
+            size += len("]") + 3
+            size += len(f"def {g.name}_shared_params(f):") + 1
+            size += len(docstring(comment, 1)) + 5
+            size += len('    params = getattr(f, "__click_params__", [])') + 1
+            size += len("    f.__click_params__ = params + _SHARED_PARAMS[::-1]") + 1
+            size += len("    return f") + 3
+
+        for c in g.commands:
+            size += self._estimate_command_decs(
+                f"@{g.name}_group.command", c.name, c.description
+            )
+
+            arguments, options, uses_shared = self._own_params(g, c, shared)
+            size += self._estimate_param_decs(arguments, options)
+            if uses_shared:
+                size += len(f"@{g.name}_shared_params") + 1
+
+            size += self._estimate_function(
+                c.name, f"`{c.name}` command handler", self._create_command_params(c)
+            )
+
+        # the module ends with a single newline
+        return size - 2
+
+    def _estimate_main_module(self):
+        size = len("import click") + 3
+        for g in self.app.cli.groups:
+            size += len(f"from {self.app.exec}.cli.{g.name} import {g.name}_group") + 1
+
+        size += len("@click.group()") + 1
+        size += self._estimate_function("cli", "CLI entry point")
+
+        for c in self.app.cli.commands:
+            size += self._estimate_command_decs("@cli.command", c.name, c.description)
+            size += self._estimate_param_decs(c.arguments, c.options)
+            size += self._estimate_function(
+                c.name, f"`{c.name}` command handler", self._create_command_params(c)
+            )
+
+        for g in self.app.cli.groups:
+            size += len(f"cli.add_command({g.name}_group)") + 1
+
+        return size + len('if __name__ == "__main__":') + len("    cli()") + 4
+
+    def _estimate_schemas_module(self):
+        level = 1 if self.lazy_enums else 0
+        empty = Module(name="schemas", path="", imports=["enum.Enum"])
+        if self.lazy_enums:
+            empty.add_lazy_enums([])
+        size = len(empty.render())
+
+        if self.lazy_enums and self.app.schemas.enums:
+            # `_ENUMS = {}` is split in two lines
+            size += 1
 
         for e in self.app.schemas.enums:
-            schemas_mod.add_enum(e)
-        schemas_mod.write()
+            fmt_name = safe_identifier(class_name(e.name))
+            size += len(f"class {fmt_name}(Enum):") + 4 * level + 1
+
+            if e.description:
+                size += len(docstring(e.description, level + 1)) + 4 * level + 6
+
+            for k, v in e.items.items():
+                value = literal_size(v) if type(v) == str else len(repr(v))
+                size += len(safe_identifier(member_name(k))) + value + 4 * level + 8
+
+            if not e.items:
+                size += 4 * level + 9
+
+            if self.lazy_enums:
+                factory = function_name(e.name)
+                size += len(f"def _{factory}():") + 1
+                size += len(f'    {fmt_name}.__qualname__ = "{fmt_name}"') + 2
+                size += len(f"    return {fmt_name}") + 3
+                size += len(f'    "{fmt_name}": _{factory},') + 1
+            else:
+                size += 2
+
+        return size
+
+    def _render_readme(self):
+        return f"# {self.app.name}{os.linesep}"
 
     def _create_readme(self):
         with open(os.path.join(self.project_root, "README.md"), "w") as fp:
-            fp.write(f"# {self.app.name}{os.linesep}")
+            fp.write(self._render_readme())
 
-    def _create_toml(self):
+    def _render_toml(self):
         lines = []
 
         lines.append("[tool.poetry]")
@@ -290,8 +881,11 @@ class Builder:
         lines.append('click = "8.1.3"')
         lines.append("")
 
+        return os.linesep.join(lines)
+
+    def _create_toml(self):
         with open(os.path.join(self.project_root, "pyproject.toml"), "w") as fp:
-            fp.write(os.linesep.join(lines))
+            fp.write(self._render_toml())
 
     def _create_cli_yml(self):
         pass
@@ -1,6 +1,10 @@
 import os
+import time
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 from brandon.builders.languages import *
+from brandon.plan import Plan
 from brandon.schemas import Languages
 
 
@@ -10,7 +14,16 @@ BUILDER_MAP = {
 
 
 class Project:
-    def __init__(self, app, language, output_path, overwrite=False) -> None:
+    def __init__(
+        self,
+        app,
+        language,
+        output_path,
+        overwrite=False,
+        lazy_enums=False,
+        store=None,
+        zipapp=False,
+    ) -> None:
         self.app = app
         self.language = language
         self.output_path = output_path
@@ -18,16 +31,160 @@ class Project:
         self.builder = None
 
         if language in BUILDER_MAP:
-            self.builder = BUILDER_MAP[language](app=app, output_path=output_path)
+            self.builder = BUILDER_MAP[language](
+                app=app,
+                output_path=output_path,
+                lazy_enums=lazy_enums,
+                store=store,
+                zipapp=zipapp,
+            )
 
-    def create(self):
+    def _check_language(self):
         if self.builder is None:
             raise Exception(f"Unsupported language `{self.language}`")
 
+    def _check_output(self):
+        self._check_language()
+
         if os.path.exists(self.builder.project_root) and not self.overwrite:
-            print(self.builder.project_root)
             raise Exception(
                 "Output folder already exists. Either use the flag `--overwrite` to overwrite the contents of this directory or change the app version in your `cli.yml`."
             )
 
+    def create(self):
+        self._check_output()
         self.builder.build()
+
+    def plan(self, plan=None):
+        """Plan the files `create` would write, failing the same way
+        it would.
+        """
+        self._check_output()
+        return self.builder.plan(plan)
+
+    def check(self, full=False):
+        """Compare the existing project with the one the specification
+        generates, without writing anything.
+        """
+        self._check_language()
+        return self.builder.check(full=full)
+
+
+@dataclass
+class ProjectReport:
+    """Outcome of building the project for one language."""
+
+    language: str
+    output_path: str
+    elapsed: float
+    error: str = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def create_projects(
+    app,
+    languages,
+    output_path,
+    overwrite=False,
+    lazy_enums=False,
+    store=None,
+    jobs=None,
+    zipapp=False,
+):
+    """Build the project for each one of `languages` concurrently, in
+    the `{output_path}/{language}` folder. A failing language doesn't
+    stop the others, its error is kept in the report instead.
+
+    Threads are used, so the parsed application is shared by all
+    builders instead of being copied to other processes.
+    """
+
+    def create(language):
+        start = time.perf_counter()
+        language_path = os.path.join(output_path, language)
+        project = Project(
+            app=app,
+            language=(
+                Languages(language) if Languages.is_supported(language) else language
+            ),
+            output_path=language_path,
+            overwrite=overwrite,
+            lazy_enums=lazy_enums,
+            store=store,
+            zipapp=zipapp,
+        )
+
+        if project.builder is not None:
+            language_path = project.builder.project_root
+
+        try:
+            project.create()
+            error = None
+        except Exception as e:
+            error = str(e)
+
+        return ProjectReport(
+            language=language,
+            output_path=language_path,
+            elapsed=time.perf_counter() - start,
+            error=error,
+        )
+
+    languages = list(dict.fromkeys(languages))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(create, languages))
+
+
+def plan_projects(
+    app, languages, output_path, overwrite=False, lazy_enums=False, zipapp=False
+):
+    """Plan the projects `create_projects` would build for each one of
+    `languages`, all in the same plan.
+    """
+    plan = Plan()
+
+    for language in dict.fromkeys(languages):
+        Project(
+            app=app,
+            language=(
+                Languages(language) if Languages.is_supported(language) else language
+            ),
+            output_path=os.path.join(output_path, language),
+            overwrite=overwrite,
+            lazy_enums=lazy_enums,
+            zipapp=zipapp,
+        ).plan(plan)
+
+    return plan
+
+
+def check_projects(
+    app, languages, output_path, full=False, lazy_enums=False, zipapp=False
+):
+    """Check the projects built by `create_projects`, with the same
+    `lazy_enums` and `zipapp` options, for drift. Unless `full` is set,
+    it stops at the first language with drift.
+    """
+    drifts = []
+
+    for language in dict.fromkeys(languages):
+        drifts.extend(
+            Project(
+                app=app,
+                language=(
+                    Languages(language)
+                    if Languages.is_supported(language)
+                    else language
+                ),
+                output_path=os.path.join(output_path, language),
+                lazy_enums=lazy_enums,
+                zipapp=zipapp,
+            ).check(full=full)
+        )
+        if drifts and not full:
+            break
+
+    return drifts
@@ -1,22 +1,89 @@
 import os
+import json
+import logging
+
+from brandon import cache
+from brandon.spec import Parser
+from brandon.schemas import SummaryFormats
+from brandon.msgpack_utils import packb
+
+logger = logging.getLogger(__name__)
 
 
 class Builder:
-    """Create a short summary of the specified application."""
+    """Create a short summary of the specified application.
+
+    Besides the human readable text, the summary can be rendered as
+    JSON or MessagePack, including the arguments and options of each
+    command, to be consumed by other tools.
+    """
+
+    VERSION = "1"
 
     def __init__(self, app) -> None:
         self.app = app
-        self.lines = []
 
-    def build(self) -> str:
-        self._create_summary()
-        return os.linesep.join(self.lines)
+    def build(self, format=SummaryFormats.TEXT):
+        if format == SummaryFormats.JSON:
+            return json.dumps(self.to_dict(), separators=(",", ":"))
 
-    def _create_summary(self):
-        self._add_line(f"{self.app.name} - {self.app.description}", True)
-        self._add_line(f"Usage:\n    {self.app.exec} [command]", True)
+        if format == SummaryFormats.MSGPACK:
+            return packb(self.to_dict())
+
+        return os.linesep.join(self._create_summary())
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.app.name,
+            "exec": self.app.exec,
+            "version": self.app.version,
+            "description": self.app.description,
+            "authors": [
+                {"name": a.name, "email": a.email, "url": a.url}
+                for a in self.app.authors
+            ],
+            "groups": [
+                {
+                    "name": g.name,
+                    "description": g.description,
+                    "commands": [self._command_dict(c) for c in g.commands],
+                }
+                for g in self.app.cli.groups
+            ],
+            "commands": [self._command_dict(c) for c in self.app.cli.commands],
+        }
+
+    def _command_dict(self, command):
+        return {
+            "name": command.name,
+            "description": command.description,
+            "arguments": [
+                {"name": a.name, "type": a.type.value, "description": a.description}
+                for a in command.arguments
+            ],
+            "options": [
+                {
+                    "name": o.name,
+                    "short": o.short,
+                    "type": o.type.value,
+                    "description": o.description,
+                    "default": o.default,
+                }
+                for o in command.options
+            ],
+        }
 
-        self._add_line(f"Commands:")
+    def _create_summary(self):
+        """Return the lines of the text summary. They are kept in a
+        local list, so concurrent builds don't share any state.
+        """
+        lines = [
+            f"{self.app.name} - {self.app.description}",
+            "",
+            f"Usage:\n    {self.app.exec} [command]",
+            "",
+            "Commands:",
+        ]
 
         command_lines = []
         max_width = 0
@@ -33,17 +100,53 @@ class Builder:
             command_lines.append([command_line, c.description])
 
         for c in command_lines:
-            self._add_line(f"{c[0]:{max_width+5}}{c[1]}")
+            lines.append(f"{c[0]:{max_width+5}}{c[1]}")
 
-        self._add_line("")
-        self._add_line(f"Authors:")
+        lines.append("")
+        lines.append("Authors:")
         for a in self.app.authors:
             if not a.email:
-                self._add_line(f"    {a.name}")
+                lines.append(f"    {a.name}")
             else:
-                self._add_line(f"    {a.name} <{a.email}>")
+                lines.append(f"    {a.name} <{a.email}>")
+
+        return lines
+
+
+def load_summary(filename, format=SummaryFormats.TEXT):
+    """Return the summary of the specification in `filename`. Rendered
+    summaries are cached next to the specification, one per format, and
+    reused while the specification and its included files are unchanged,
+    so it's only parsed again after it changes. If the cache can't be
+    written, the summary is still returned.
+    """
+    cache_file = cache.cache_dir(filename, f"{os.path.basename(filename)}.summary")
+    cached = cache.load(cache_file)
+
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != Builder.VERSION
+        or not isinstance(cached.get("outputs"), dict)
+        or not cache.is_current(cached.get("files"))
+    ):
+        cached = None
+    elif format.value in cached["outputs"]:
+        return cached["outputs"][format.value]
+
+    parser = Parser(filename)
+    output = Builder(app=parser.app).build(format)
+
+    # outputs of other formats are kept while the files are the same
+    files = cache.files_state(parser.files)
+    outputs = cached["outputs"] if cached and cached["files"] == files else {}
+    outputs[format.value] = output
+
+    try:
+        cache.store(
+            cache_file,
+            {"version": Builder.VERSION, "files": files, "outputs": outputs},
+        )
+    except Exception as e:
+        logger.debug("Summary of `%s` not cached: %s", filename, e)
 
-    def _add_line(self, text, double_nl=False):
-        self.lines.append(text)
-        if double_nl:
-            self.lines.append("")
+    return output
@@ -0,0 +1,114 @@
+"""Helpers for the cache kept next to the specification file, in
+the `.brandon` directory. Entries are stored as MessagePack, so only
+plain data is ever read back from the cache, never code.
+"""
+
+import os
+import hashlib
+import threading
+
+from brandon.msgpack_utils import packb, unpackb
+
+CACHE_DIR = ".brandon"
+
+
+def cache_dir(filename, *parts):
+    """Path inside the cache directory of the specification
+    pointed by `filename`.
+    """
+    root = os.path.dirname(os.path.abspath(filename))
+    return os.path.join(root, CACHE_DIR, *parts)
+
+
+def digest(*chunks) -> str:
+    h = hashlib.sha256()
+    for c in chunks:
+        h.update(c.encode() if isinstance(c, str) else c)
+    return h.hexdigest()
+
+
+def file_digest(filename) -> str:
+    with open(filename, "rb") as fp:
+        return digest(fp.read())
+
+
+def files_state(filenames) -> dict:
+    """Size, modification time and digest of each file, used to
+    check later if any of them changed with `is_current`.
+    """
+    state = {}
+
+    for f in filenames:
+        st = os.stat(f)
+        state[os.path.abspath(f)] = [st.st_size, st.st_mtime_ns, file_digest(f)]
+
+    return state
+
+
+def is_current(state) -> bool:
+    """Whether the files in `state` are unchanged. Files are only
+    hashed when their size or modification time changed.
+    """
+    if not state:
+        return False
+
+    for filename, (size, mtime, expected) in state.items():
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return False
+
+        if (st.st_size, st.st_mtime_ns) == (size, mtime):
+            continue
+
+        if file_digest(filename) != expected:
+            return False
+
+    return True
+
+
+def load(path):
+    """Return the data stored in `path` or `None` if it's not
+    cached or can't be decoded.
+    """
+    try:
+        with open(path, "rb") as fp:
+            return unpackb(fp.read())
+    except (OSError, ValueError):
+        return None
+
+
+def store(path, obj):
+    """Store `obj`, made of the types `msgpack_utils.packb` supports,
+    in `path`.
+    """
+    data = packb(obj)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # writing to a temporary file first, so concurrent runs never
+    # read a partially written entry. Threads of the same process need
+    # their own temporary files too.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(data)
+    os.replace(tmp_path, path)
+
+
+def evict(directory, keep):
+    """Remove the entries of `directory` whose path is not in `keep`.
+    Temporary files of concurrent writers are left alone.
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+
+    for name in names:
+        path = os.path.join(directory, name)
+        if path in keep or name.endswith(".tmp"):
+            continue
+
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -1,15 +1,24 @@
 import os
+import json
+import time
 import click
 import logging
 
 from brandon.spec import Parser
-from brandon.schemas import Languages
-from brandon.builders.project import Project
+from brandon.schemas import Languages, SummaryFormats, Shells
+from brandon.builders.project import (
+    Project,
+    create_projects,
+    plan_projects,
+    check_projects,
+)
 from brandon.builders.docs import Builder as DocsBuilder
-from brandon.builders.summary import Builder as SummaryBuilder
+from brandon.builders.html import Builder as HTMLBuilder
+from brandon.builders.summary import load_summary
+from brandon.builders.completion import Builder as CompletionBuilder
+from brandon.store import ArtifactStore
 
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 
 @click.group(name="generate", help="Generation of different parts of the project.")
@@ -40,12 +49,125 @@ def generate_group():
     "-o",
     "--output-path",
     "output_path",
-    default=os.getcwd(),
+    default=os.getcwd,
     help="Set the output path for the project folder.",
 )
-def project(filename, overwrite, language, output_path):
+@click.option(
+    "--lazy-enums",
+    "lazy_enums",
+    is_flag=True,
+    default=False,
+    help="Create the enums in `schemas.py` only when they are first used.",
+)
+@click.option(
+    "--zipapp",
+    "zipapp",
+    is_flag=True,
+    default=False,
+    help="Also package the generated Python CLI as a single-file zipapp in the `dist` folder, with precompiled bytecode and click bundled, so it only needs Python to run.",
+)
+@click.option(
+    "-a",
+    "--all-languages",
+    "all_languages",
+    is_flag=True,
+    default=False,
+    help="Build the project for every language in the `languages` key concurrently, each one in its own folder inside `output-path`.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    help="Directory of the artifact store, used to reuse the outputs rendered from identical parts of the specification. It can be shared by different runs.",
+)
+@click.option(
+    "--store-size",
+    "store_size",
+    type=int,
+    default=512,
+    help="Maximum size of the artifact store in MiB. The least recently used artifacts are evicted when it's full.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Show the directories and files that would be written, with their estimated sizes, without writing anything.",
+)
+@click.option(
+    "--check",
+    "check",
+    is_flag=True,
+    default=False,
+    help="Compare the existing output with the one the specification generates, without writing anything, and exit with status 1 if they differ.",
+)
+@click.option(
+    "--full-report",
+    "full_report",
+    is_flag=True,
+    default=False,
+    help="With `--check`, list every file that differs instead of stopping at the first one.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="With `--dry-run` or `--check`, show the result as JSON.",
+)
+def project(
+    filename,
+    overwrite,
+    language,
+    output_path,
+    lazy_enums,
+    zipapp,
+    all_languages,
+    store_path,
+    store_size,
+    dry_run,
+    check,
+    full_report,
+    as_json,
+):
     """Parses the cli.yaml file and generate the
     project."""
+    if dry_run and check:
+        raise click.ClickException(
+            "The options `--dry-run` and `--check` can't be used together"
+        )
+
+    store = None if check else open_store(store_path, store_size)
+
+    if all_languages:
+        if language:
+            raise click.ClickException(
+                "The options `--language` and `--all-languages` can't be used together"
+            )
+        if dry_run:
+            try:
+                app = Parser(filename).app
+                plan = plan_projects(
+                    app, app.languages, output_path, overwrite, lazy_enums, zipapp
+                )
+            except Exception as e:
+                raise click.ClickException(str(e))
+            echo_plan(plan, as_json)
+            return
+
+        if check:
+            try:
+                app = Parser(filename).app
+                drifts = check_projects(
+                    app, app.languages, output_path, full_report, lazy_enums, zipapp
+                )
+            except Exception as e:
+                raise click.ClickException(str(e))
+            echo_drifts(drifts, full_report, as_json)
+            return
+
+        create_all_projects(filename, overwrite, output_path, lazy_enums, store, zipapp)
+        echo_store_stats(store)
+        return
+
     try:
         app = Parser(filename).app
         if not language:
@@ -59,18 +181,131 @@ def project(filename, overwrite, language, output_path):
                 f"Invalid language `{language}`. Check the documentation for supported languages."
             )
 
-        Project(
+        project = Project(
             app=app,
             language=Languages(language),
             output_path=output_path,
             overwrite=overwrite,
-        ).create()
+            lazy_enums=lazy_enums,
+            store=store,
+            zipapp=zipapp,
+        )
+
+        if dry_run:
+            plan = project.plan()
+        elif check:
+            drifts = project.check(full=full_report)
+        else:
+            project.create()
     except Exception as e:
         raise click.ClickException(str(e))
 
+    if dry_run:
+        echo_plan(plan, as_json)
+        return
+
+    if check:
+        echo_drifts(drifts, full_report, as_json)
+        return
+
     click.echo(
         f"Project folder for `{app.name}` created successfully in `{output_path}`"
     )
+    echo_store_stats(store)
+
+
+def open_store(store_path, store_size):
+    if store_path is None:
+        return None
+    return ArtifactStore(store_path, max_bytes=store_size * 2**20)
+
+
+def echo_store_stats(store):
+    if store is not None:
+        stats = store.stats()
+        click.echo(
+            f"Artifact store: {stats['hits']} hits, {stats['misses']} misses,"
+            f" {stats['evictions']} evicted"
+        )
+
+
+def echo_plan(plan, as_json):
+    if as_json:
+        click.echo(json.dumps(plan.to_dict()))
+        return
+
+    for e in plan.entries:
+        if e.directory:
+            click.echo(f"{e.action:9}  {'':>10}  {e.path}{os.sep}")
+        else:
+            size = e.current_size if e.action == "delete" else e.size
+            click.echo(f"{e.action:9}  {size:>8} B  {e.path}")
+
+    summary = plan.summary()
+    click.echo(
+        f"{summary['files']} files ({summary['created']} new,"
+        f" {summary['overwritten']} overwritten), {summary['deleted']} deleted,"
+        f" {summary['new_directories']} new directories, ~{summary['bytes']} bytes"
+    )
+
+
+def echo_drifts(drifts, full_report, as_json):
+    """Show the files that differ from the specification and exit with
+    status 1 if there's any.
+    """
+    if as_json:
+        click.echo(json.dumps([d.to_dict() for d in drifts]))
+    else:
+        for d in drifts:
+            click.echo(f"{d.reason:8}  {d.path}")
+
+        if not drifts:
+            click.echo("Generated files are up to date")
+        elif full_report:
+            click.echo(f"{len(drifts)} files differ from the specification")
+        else:
+            click.echo(
+                "Generated files differ from the specification, use"
+                " `--full-report` to list all of them"
+            )
+
+    if drifts:
+        raise SystemExit(1)
+
+
+def create_all_projects(filename, overwrite, output_path, lazy_enums, store, zipapp):
+    try:
+        app = Parser(filename).app
+        start = time.perf_counter()
+        reports = create_projects(
+            app=app,
+            languages=app.languages,
+            output_path=output_path,
+            overwrite=overwrite,
+            lazy_enums=lazy_enums,
+            store=store,
+            zipapp=zipapp,
+        )
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    width = max([len(r.language) for r in reports] + [0])
+    for r in reports:
+        status = "ok" if r.ok else "failed"
+        detail = r.output_path if r.ok else r.error
+        click.echo(
+            f"{r.language:{width}}  {status:6}  {r.elapsed * 1000:8.1f} ms  {detail}"
+        )
+
+    failed = [r.language for r in reports if not r.ok]
+    click.echo(
+        f"{len(reports) - len(failed)} of {len(reports)} projects for `{app.name}`"
+        f" created in {elapsed * 1000:.1f} ms"
+    )
+
+    if failed:
+        raise click.ClickException(f"Failed languages: {', '.join(failed)}")
 
 
 @generate_group.command(
@@ -82,23 +317,173 @@ def project(filename, overwrite, language, output_path):
     "-o",
     "--output-path",
     "output_path",
-    default=os.getcwd(),
+    default=os.getcwd,
     help="Set the output path for the documentation.",
 )
-def docs(filename, output_path):
+@click.option(
+    "-f",
+    "--format",
+    "format",
+    type=click.Choice(["mkdocs", "html"]),
+    default="mkdocs",
+    help="Build the site using MkDocs or render the reference straight to static HTML.",
+)
+@click.option(
+    "--chunked",
+    "chunked",
+    is_flag=True,
+    default=False,
+    help="With the `html` format, render one page per group instead of a single page.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    "jobs",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Number of processes used to render the MkDocs pages. Use 0 for all available cores.",
+)
+@click.option(
+    "--store",
+    "store_path",
+    help="Directory of the artifact store, used to reuse the outputs rendered from identical parts of the specification. It can be shared by different runs.",
+)
+@click.option(
+    "--store-size",
+    "store_size",
+    type=int,
+    default=512,
+    help="Maximum size of the artifact store in MiB. The least recently used artifacts are evicted when it's full.",
+)
+@click.option(
+    "--enum-page-size",
+    "enum_page_size",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Document each enum in its own pages, with at most this many items per page. With 0, the default, all enums go in a single page.",
+)
+@click.option(
+    "--fingerprint",
+    "fingerprint",
+    is_flag=True,
+    default=False,
+    help="Copy scripts and stylesheets to files named after their content hash and point the pages to them.",
+)
+@click.option(
+    "--compress",
+    "compress",
+    is_flag=True,
+    default=False,
+    help="Write gzip (and brotli, if installed) compressed copies of the text files of the site.",
+)
+@click.option(
+    "--dry-run",
+    "dry_run",
+    is_flag=True,
+    default=False,
+    help="Show the directories and files that would be written, with their estimated sizes, without writing anything.",
+)
+@click.option(
+    "--check",
+    "check",
+    is_flag=True,
+    default=False,
+    help="Compare the existing output with the one the specification generates, without writing anything, and exit with status 1 if they differ.",
+)
+@click.option(
+    "--full-report",
+    "full_report",
+    is_flag=True,
+    default=False,
+    help="With `--check`, list every file that differs instead of stopping at the first one.",
+)
+@click.option(
+    "--json",
+    "as_json",
+    is_flag=True,
+    help="With `--dry-run` or `--check`, show the result as JSON.",
+)
+def docs(
+    filename,
+    output_path,
+    format,
+    chunked,
+    jobs,
+    store_path,
+    store_size,
+    enum_page_size,
+    fingerprint,
+    compress,
+    dry_run,
+    check,
+    full_report,
+    as_json,
+):
     """Parses the cli.yaml file and generate the
     documentation.
     """
+    if dry_run and check:
+        raise click.ClickException(
+            "The options `--dry-run` and `--check` can't be used together"
+        )
+
+    if (dry_run or check) and format == "html":
+        raise click.ClickException(
+            "The options `--dry-run` and `--check` are only available for the `mkdocs` format"
+        )
+
+    store = None if check else open_store(store_path, store_size)
+
     try:
         app = Parser(filename).app
-        DocsBuilder(app=app, output_path=output_path).build()
+        if format == "html":
+            builder = HTMLBuilder(
+                app=app,
+                output_path=output_path,
+                chunked=chunked,
+                fingerprint=fingerprint,
+                compress=compress,
+            )
+        else:
+            builder = DocsBuilder(
+                app=app,
+                output_path=output_path,
+                jobs=jobs or None,
+                store=store,
+                enum_page_size=enum_page_size or None,
+                fingerprint=fingerprint,
+                compress=compress,
+            )
+
+        if dry_run:
+            plan = builder.plan()
+        elif check:
+            drifts = builder.check(full=full_report)
+        else:
+            post_build_stats = builder.build()
     except Exception as e:
-        logger.error("Error", exc_info=True)
+        logger.debug("Failed to generate the documentation", exc_info=True)
         raise click.ClickException(str(e))
 
+    if dry_run:
+        echo_plan(plan, as_json)
+        return
+
+    if check:
+        echo_drifts(drifts, full_report, as_json)
+        return
+
     click.echo(
         f"Documentation folder for `{app.name}` created successfully in `{output_path}`"
     )
+    echo_store_stats(store)
+
+    if post_build_stats:
+        stats = post_build_stats
+        click.echo(
+            f"Assets: {stats['fingerprinted']} fingerprinted, {stats['compressed']}"
+            f" compressed, {stats['reused']} reused from cache"
+        )
 
 
 @generate_group.command(
@@ -106,13 +491,46 @@ def docs(filename, output_path):
     help="Generate a summary of the command line interface, to be used somewhere else, from the CLI specification file pointed by FILENAME.",
 )
 @click.argument("filename")
-def summary(filename):
+@click.option(
+    "-f",
+    "--format",
+    "format",
+    type=click.Choice([f.value for f in SummaryFormats]),
+    default=SummaryFormats.TEXT.value,
+    help="Output format of the summary. The `json` and `msgpack` formats include the arguments and options of each command.",
+)
+def summary(filename, format):
     """Generate a summary of the command line interface,
     tobe used somewhere else, from the CLI specification
     file pointed by FILENAME.
     """
+    try:
+        click.echo(
+            load_summary(filename, SummaryFormats(format)), nl=format != "msgpack"
+        )
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+
+@generate_group.command(
+    name="completion",
+    help="Generate a static shell completion script from the CLI specification file pointed by FILENAME.",
+)
+@click.argument("filename")
+@click.option(
+    "-s",
+    "--shell",
+    "shell",
+    type=click.Choice([s.value for s in Shells]),
+    default=Shells.BASH.value,
+    help="The shell the completion script is generated for.",
+)
+def completion(filename, shell):
+    """Parses the cli.yaml file and generate the
+    completion script.
+    """
     try:
         app = Parser(filename).app
-        click.echo(SummaryBuilder(app=app).build())
+        click.echo(CompletionBuilder(app=app, shell=Shells(shell)).build(), nl=False)
     except Exception as e:
         raise click.ClickException(str(e))
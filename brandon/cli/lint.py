@@ -0,0 +1,68 @@
+import json
+import time
+import click
+
+from brandon.spec import Parser
+from brandon.lint import RULES, lint as lint_app
+
+
+def parse_thresholds(values):
+    thresholds = {}
+
+    for v in values:
+        name, sep, threshold = v.partition("=")
+        if not sep or not threshold.isdigit():
+            raise Exception(f"Invalid threshold `{v}`, expected RULE=N")
+        thresholds[name] = int(threshold)
+
+    return thresholds
+
+
+@click.command(
+    name="lint",
+    help="Check the CLI specification file pointed by FILENAME for patterns that make the generated CLI slow.",
+)
+@click.argument("filename")
+@click.option(
+    "-r",
+    "--rule",
+    "rules",
+    type=click.Choice(list(RULES)),
+    multiple=True,
+    help="Rule to run. All rules are run by default.",
+)
+@click.option(
+    "-t",
+    "--threshold",
+    "thresholds",
+    multiple=True,
+    help="Threshold of a rule, as RULE=N.",
+)
+@click.option("--json", "as_json", is_flag=True, help="Show the findings as JSON.")
+def lint(filename, rules, thresholds, as_json):
+    """Exits with status 1 if any rule is violated, so it can be
+    used in CI.
+    """
+    start = time.perf_counter()
+
+    try:
+        app = Parser(filename).app
+        findings = lint_app(app, rules, parse_thresholds(thresholds))
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if as_json:
+        click.echo(json.dumps([f.to_dict() for f in findings]))
+    else:
+        for f in findings:
+            click.echo(f"{f.rule}: {f.path}: {f.message}")
+            click.echo(
+                f"    ~{f.lines} lines, {f.decorators} decorators,"
+                f" ~{f.import_us / 1000:.1f} ms to import"
+            )
+        click.echo(f"{len(findings)} findings in {elapsed:.0f} ms")
+
+    if findings:
+        raise SystemExit(1)
@@ -0,0 +1,35 @@
+import click
+
+from brandon.search import load_index
+
+
+@click.command(
+    name="search",
+    help="Search groups, commands, parameters and enums in the CLI specification file pointed by FILENAME.",
+)
+@click.argument("filename")
+@click.argument("query", nargs=-1, required=True)
+@click.option(
+    "-n",
+    "--limit",
+    "limit",
+    type=int,
+    default=50,
+    help="Maximum number of results to show.",
+)
+def search(filename, query, limit):
+    """Search the index built from the cli.yaml file,
+    which is updated whenever the file changes.
+    """
+    try:
+        results = load_index(filename).search(" ".join(query), limit=limit)
+    except Exception as e:
+        raise click.ClickException(str(e))
+
+    if not results:
+        click.echo("No results found")
+        return
+
+    width = max(len(r[1]) for r in results)
+    for kind, path, description in results:
+        click.echo(f"{kind:10}{path:{width+5}}{description}".rstrip())
@@ -0,0 +1,57 @@
+"""Detection of drift between a specification and a tree generated
+from it, used by the `--check` option of the `generate` commands.
+"""
+
+import os
+from dataclasses import dataclass, asdict
+
+from brandon import cache
+
+MISSING = "missing"
+CHANGED = "changed"
+STALE = "stale"
+
+
+@dataclass
+class Drift:
+    path: str
+    reason: str
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def check_files(files, stale=(), full=False):
+    """Compare `files`, pairs of path and content rendered in memory,
+    with the files on disk, followed by the `stale` paths the build
+    would remove. Contents are compared by size and then by digest.
+
+    Files are rendered one by one as `files` is consumed, so unless
+    `full` is set, the check stops at the first drift without
+    rendering the remaining files.
+    """
+    drifts = []
+
+    def found(path, reason):
+        drifts.append(Drift(path, reason))
+        return not full
+
+    for path, content in files:
+        data = content.encode()
+
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            if found(path, MISSING):
+                return drifts
+            continue
+
+        if size != len(data) or cache.file_digest(path) != cache.digest(data):
+            if found(path, CHANGED):
+                return drifts
+
+    for path in stale:
+        if found(path, STALE):
+            return drifts
+
+    return drifts
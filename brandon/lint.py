@@ -0,0 +1,222 @@
+"""Rules that flag parts of a specification which make the generated
+CLI slow to import or large to maintain, used by `brandon lint`.
+
+Estimates are based on the code produced by the Python builder: each
+command is a function with one decorator for the command and one for
+each parameter, and each enumeration item is a member of an `Enum`
+class in `schemas.py`. The parameters of a group are created once in
+its module and added with a single decorator to the commands that
+inherit all of them.
+"""
+
+from dataclasses import dataclass
+
+from brandon.names import class_name
+
+# approximate import cost of the generated code, measured with click 8.1
+DECORATOR_COST_US = 6
+ENUM_MEMBER_COST_US = 9
+
+# lines of a generated function besides its decorators: signature,
+# docstring and blank lines
+FUNCTION_LINES = 4
+
+# lines of the `_SHARED_PARAMS` list, besides one per parameter, and of
+# the `{group}_shared_params` decorator, blank lines included
+SHARED_PARAMS_LINES = 11
+
+RULES = {}
+
+
+@dataclass
+class Finding:
+    rule: str
+    path: str
+    message: str
+    lines: int = 0
+    decorators: int = 0
+    import_us: int = 0
+
+    def to_dict(self):
+        return {
+            "rule": self.rule,
+            "path": self.path,
+            "message": self.message,
+            "lines": self.lines,
+            "decorators": self.decorators,
+            "import_ms": round(self.import_us / 1000, 2),
+        }
+
+
+def register(rule):
+    """Class decorator that makes a rule available to `lint`."""
+    RULES[rule.name] = rule
+    return rule
+
+
+class Rule:
+    """Base of the lint rules. Subclasses set `name`, `description`
+    and a default `threshold`, and yield findings from `check`.
+    """
+
+    name = None
+    description = None
+    threshold = None
+
+    def __init__(self, threshold=None) -> None:
+        if threshold is not None:
+            self.threshold = threshold
+
+    def check(self, app):
+        raise NotImplementedError()
+
+
+def command_decorators(command):
+    return 1 + len(command.arguments) + len(command.options)
+
+
+def commands_estimate(commands):
+    """Generated lines and decorators of a list of commands."""
+    decorators = sum(command_decorators(c) for c in commands)
+    return decorators + FUNCTION_LINES * len(commands), decorators
+
+
+def group_estimate(group):
+    """Generated lines and decorators of the commands of a group. The
+    commands that inherit all group parameters get a single decorator
+    instead of one per parameter, and the parameters are created once.
+    """
+    lines, decorators = commands_estimate(group.commands)
+    shared = len(group.arguments) + len(group.options)
+    if not shared:
+        return lines, decorators
+
+    inheriting = sum(1 for c in group.commands if group.inherited_by(c))
+    if not inheriting:
+        return lines, decorators
+
+    lines += shared + SHARED_PARAMS_LINES - (shared - 1) * inheriting
+    decorators -= shared * (inheriting - 1)
+    return lines, decorators
+
+
+@register
+class TopLevelCommands(Rule):
+    name = "top-level-commands"
+    description = "Too many commands outside groups, all defined in `main.py`."
+    threshold = 100
+
+    def check(self, app):
+        commands = app.cli.commands
+        if len(commands) <= self.threshold:
+            return
+
+        lines, decorators = commands_estimate(commands)
+        yield Finding(
+            rule=self.name,
+            path="main",
+            message=f"{len(commands)} top level commands, consider moving them to groups",
+            lines=lines,
+            decorators=decorators,
+            import_us=decorators * DECORATOR_COST_US,
+        )
+
+
+@register
+class LargeGroup(Rule):
+    name = "large-group"
+    description = "Groups with too many commands, all defined in one module."
+    threshold = 200
+
+    def check(self, app):
+        for g in app.cli.groups:
+            if len(g.commands) <= self.threshold:
+                continue
+
+            lines, decorators = group_estimate(g)
+            yield Finding(
+                rule=self.name,
+                path=g.name,
+                message=f"{len(g.commands)} commands in group, consider splitting it",
+                lines=lines,
+                decorators=decorators,
+                import_us=decorators * DECORATOR_COST_US,
+            )
+
+
+@register
+class SharedParameters(Rule):
+    """Commands that override some of the parameters of their group
+    can't use the shared ones, so the group parameters they inherit
+    become a decorator per command again.
+    """
+
+    name = "shared-parameters"
+    description = "Group parameters repeated by commands overriding some of them."
+    threshold = 500
+
+    def check(self, app):
+        for g in app.cli.groups:
+            shared = g.arguments + g.options
+            if not shared:
+                continue
+
+            # commands hold the group parameters themselves, not copies
+            # of them, unless they declare a parameter with the same name
+            shared_ids = {id(p) for p in shared}
+            copies = 0
+            for c in g.commands:
+                if not g.inherited_by(c):
+                    params = c.arguments + c.options
+                    copies += sum(1 for p in params if id(p) in shared_ids)
+
+            if copies <= self.threshold:
+                continue
+
+            yield Finding(
+                rule=self.name,
+                path=g.name,
+                message=f"{len(shared)} group parameters repeated {copies} times by commands overriding some of them",
+                lines=copies,
+                decorators=copies,
+                import_us=copies * DECORATOR_COST_US,
+            )
+
+
+@register
+class LargeEnum(Rule):
+    name = "large-enum"
+    description = (
+        "Enumerations with too many items, created when `schemas.py` is imported."
+    )
+    threshold = 256
+
+    def check(self, app):
+        for e in app.schemas.enums:
+            if len(e.items) <= self.threshold:
+                continue
+
+            yield Finding(
+                rule=self.name,
+                path=class_name(e.name),
+                message=f"{len(e.items)} items in enumeration, consider `--lazy-enums`",
+                lines=len(e.items) + FUNCTION_LINES,
+                import_us=len(e.items) * ENUM_MEMBER_COST_US,
+            )
+
+
+def lint(app, rules=None, thresholds={}):
+    """Run the `rules` (all registered rules by default) over `app`.
+    `thresholds` maps rule names to the threshold used instead of the
+    default one.
+    """
+    findings = []
+
+    for name in rules or RULES:
+        if name not in RULES:
+            raise Exception(f"Unknown lint rule `{name}`")
+
+        rule = RULES[name](thresholds.get(name))
+        findings.extend(rule.check(app))
+
+    return findings
@@ -0,0 +1,63 @@
+"""Logging setup for the `brandon` command line.
+
+Modules log to children of the `brandon` logger and never change its
+level or handlers, so applications that import brandon as a library
+keep control of their own logging. Only the command line calls
+`configure`.
+"""
+
+import sys
+import json
+import logging
+
+LOGGER_NAME = "brandon"
+
+LEVELS = ["debug", "info", "warning", "error"]
+
+# attributes every `LogRecord` has, anything else was passed in `extra`
+_RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as a JSON object in a single line, including
+    the fields passed in `extra`.
+    """
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, default=str)
+
+
+def configure(level="warning", json_output=False, stream=None):
+    """Send the records of the `brandon` loggers at `level` or above
+    to `stream` (stderr by default), as text or JSON lines.
+    """
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if json_output:
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+    logger = logging.getLogger(LOGGER_NAME)
+    for h in list(logger.handlers):
+        if not isinstance(h, logging.NullHandler):
+            logger.removeHandler(h)
+
+    logger.addHandler(handler)
+    logger.setLevel(level.upper())
+    logger.propagate = False
+
+    return logger
@@ -2,15 +2,38 @@ import click
 import logging
 
 from brandon.spec import Parser
+from brandon.log import LEVELS, configure
 from brandon.cli.generate import generate_group
+from brandon.cli.search import search
+from brandon.cli.lint import lint
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
 
 
 @click.group()
-def cli():
+@click.option(
+    "--log-level",
+    "log_level",
+    type=click.Choice(LEVELS),
+    default="warning",
+    help="Show log messages of this level or above.",
+)
+@click.option(
+    "-q",
+    "--quiet",
+    "quiet",
+    is_flag=True,
+    help="Show only errors, same as `--log-level error`.",
+)
+@click.option(
+    "--log-json",
+    "log_json",
+    is_flag=True,
+    help="Write log messages as JSON lines, with the extra fields of each one.",
+)
+def cli(log_level, quiet, log_json):
     """CLI entry point"""
+    configure(level="error" if quiet else log_level, json_output=log_json)
 
 
 @cli.command(name="version", help="Show the version and exit.")
@@ -24,6 +47,8 @@ def version():
 
 
 cli.add_command(generate_group)
+cli.add_command(search)
+cli.add_command(lint)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,14 @@
+import re
+import itertools
 from abc import ABC
+from html import escape
 from dataclasses import dataclass, field
+from functools import lru_cache, cached_property
 import typing
 from io import IOBase
 
+CACHE_SIZE = 2**12
+
 
 class TextElement(ABC):
     def render(self):
@@ -12,16 +18,44 @@ class TextElement(ABC):
         return self.render()
 
 
-@dataclass
-class Paragraph(TextElement):
-    text: str
+class Fragment(TextElement):
+    """Immutable element whose text is rendered only once.
+
+    Fragments are frozen dataclasses, so equal fragments have the same
+    hash. Passing them through `fragment` returns a single shared
+    instance, so an element repeated across many documents (e.g. the
+    `Usage` heading) is rendered once and reused.
+    """
+
+    @cached_property
+    def rendered(self):
+        return self._render()
 
     def render(self):
+        return self.rendered
+
+    def _render(self):
+        raise NotImplementedError()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fragment(element: Fragment) -> Fragment:
+    """Return the shared instance of the fragments equal to `element`."""
+    return element
+
+
+@dataclass(frozen=True)
+class Paragraph(Fragment):
+    text: str
+
+    kind = "paragraph"
+
+    def _render(self):
         return f"{self.text}\n\n"
 
 
-@dataclass
-class Heading(TextElement):
+@dataclass(frozen=True)
+class Heading(Fragment):
     """Level 1 corresponds to a double heading mark (##)
     in the document as a single one (#) is reserved for
     the title.
@@ -30,10 +64,28 @@ class Heading(TextElement):
     name: str
     level: int
 
-    def render(self):
+    kind = "heading"
+
+    def _render(self):
         return f"{'#'*(self.level+1)} {self.name}\n\n"
 
 
+@dataclass(frozen=True)
+class TableHeader(Fragment):
+    """Header and separator lines of a table."""
+
+    header: tuple
+    bold: bool = field(default=True)
+
+    def _render(self):
+        bread = " *" if self.bold else " "
+
+        fmt_header = [sandwich(h, bread) for h in self.header]
+        return (
+            lasagna(fmt_header, "|") + "\n" + lasagna(["---"] * len(self.header), "|")
+        )
+
+
 @dataclass
 class Table(TextElement):
     """Represents a table in the document,
@@ -49,19 +101,19 @@ class Table(TextElement):
     rows: typing.Iterable[typing.Collection]
     bold: bool = field(default=True)
 
-    def render(self):
-        ncol = len(self.header)
-        lines = []
-        bread = " *" if self.bold else " "
-
-        fmt_header = [sandwich(h, bread) for h in self.header]
-        lines.append(lasagna(fmt_header, "|"))
-        lines.append(lasagna(["---"] * ncol, "|"))
+    kind = "table"
 
+    def checked_rows(self):
+        ncol = len(self.header)
         for r in self.rows:
             if len(r) != ncol:
                 raise Exception("Row %s has wrong size (should be %s)" % (r, ncol))
+            yield r
 
+    def render(self):
+        lines = [fragment(TableHeader(tuple(self.header), self.bold)).render()]
+
+        for r in self.checked_rows():
             fmt_row = [sandwich(i, " ") for i in r]
             lines.append(lasagna(fmt_row, "|"))
 
@@ -72,6 +124,8 @@ class Table(TextElement):
 class UnorderedList(TextElement):
     items: list
 
+    kind = "unordered_list"
+
     def render(self):
         lines = []
         for i in self.items:
@@ -80,21 +134,28 @@ class UnorderedList(TextElement):
         return "\n".join(lines) + "\n" * 2
 
 
-@dataclass
-class Link(TextElement):
+@dataclass(frozen=True)
+class Link(Fragment):
     text: str
     url: str
 
-    def render(self):
+    kind = "link"
+
+    def _render(self):
         return f"[{self.text}]({self.url})"
 
 
-@dataclass
-class Command(TextElement):
-    args: list
+@dataclass(frozen=True)
+class Command(Fragment):
+    args: tuple
     root: bool = field(default=False)
 
-    def render(self):
+    kind = "command"
+
+    def __post_init__(self):
+        object.__setattr__(self, "args", tuple(self.args))
+
+    def _render(self):
         marker = "$" if not self.root else "#"
         return f"`{marker} {' '.join(self.args)}`\n\n"
 
@@ -110,12 +171,137 @@ class Document:
 
         self._elements.append(element)
 
-    def write(self, stream: IOBase):
+    def render(self, renderer=None) -> str:
+        return "".join((renderer or MARKDOWN).render(self._elements))
+
+    def write(self, stream: IOBase, renderer=None):
+        """Write the document to `stream` with a single `write` call.
+        Markdown is written unless another `renderer` is given.
+        """
         if not isinstance(stream, IOBase) or not stream.writable():
             raise Exception("Stream not writable")
 
-        for l in self._elements:
-            stream.write(l.render())
+        stream.write(self.render(renderer))
+
+
+class Renderer(ABC):
+    """Render the elements of a document into a list of strings,
+    joined once by `Document.render`.
+
+    Each element is dispatched to the method named after its `kind`
+    (e.g. `heading` or `table`), which appends its text to `out`. Note
+    that tables built from generators can only be rendered once.
+    """
+
+    def render(self, elements) -> list:
+        out = []
+        for e in elements:
+            getattr(self, e.kind)(e, out)
+        return out
+
+
+class MarkdownRenderer(Renderer):
+    def render(self, elements) -> list:
+        return [e.render() for e in elements]
+
+
+class HtmlRenderer(Renderer):
+    def heading(self, e, out):
+        level = min(e.level + 1, 6)
+        out.append(f"<h{level}>{escape(e.name)}</h{level}>\n")
+
+    def paragraph(self, e, out):
+        out.append(f"<p>{html_inline(e.text)}</p>\n")
+
+    def table(self, e, out):
+        out.append("<table>\n<tr>")
+        out.extend(f"<th>{html_inline(h)}</th>" for h in e.header)
+        out.append("</tr>\n")
+
+        for r in e.checked_rows():
+            out.append("<tr>")
+            out.extend(f"<td>{html_inline(c)}</td>" for c in r)
+            out.append("</tr>\n")
+
+        out.append("</table>\n")
+
+    def unordered_list(self, e, out):
+        out.append("<ul>\n")
+        out.extend(f"<li>{html_inline(i)}</li>\n" for i in e.items)
+        out.append("</ul>\n")
+
+    def link(self, e, out):
+        out.append(f'<a href="{escape(e.url)}">{escape(e.text)}</a>')
+
+    def command(self, e, out):
+        marker = "$" if not e.root else "#"
+        out.append(
+            f"<pre><code>{escape(marker)} {escape(' '.join(e.args))}</code></pre>\n"
+        )
+
+
+class RstRenderer(Renderer):
+    UNDERLINES = "=-~^\"'"
+
+    def heading(self, e, out):
+        line = self.UNDERLINES[min(e.level, len(self.UNDERLINES) - 1)] * len(e.name)
+        if e.level == 0:
+            out.append(f"{line}\n{e.name}\n{line}\n\n")
+        else:
+            out.append(f"{e.name}\n{line}\n\n")
+
+    def paragraph(self, e, out):
+        out.append(f"{rst_inline(e.text)}\n\n")
+
+    def table(self, e, out):
+        out.append(".. list-table::\n   :header-rows: 1\n\n")
+
+        for r in itertools.chain([e.header], e.checked_rows()):
+            cells = [rst_inline(c) for c in r]
+            out.append(f"   * - {cells[0]}\n")
+            out.extend(f"     - {c}\n" for c in cells[1:])
+
+        out.append("\n")
+
+    def unordered_list(self, e, out):
+        out.extend(f"- {rst_inline(i)}\n" for i in e.items)
+        out.append("\n")
+
+    def link(self, e, out):
+        out.append(f"`{e.text} <{e.url}>`_")
+
+    def command(self, e, out):
+        marker = "$" if not e.root else "#"
+        out.append(f".. code-block:: console\n\n   {marker} {' '.join(e.args)}\n\n")
+
+
+MARKDOWN = MarkdownRenderer()
+HTML = HtmlRenderer()
+RST = RstRenderer()
+
+_CODE_RE = re.compile("`([^`]*)`")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]*)\)")
+
+
+def html_inline(text):
+    """Escape `text` and convert the inline Markdown used by the
+    builders (code spans and links) to HTML.
+    """
+    text = escape(str(text))
+    if "`" in text:
+        text = _CODE_RE.sub(r"<code>\1</code>", text)
+    if "](" in text:
+        text = _LINK_RE.sub(r'<a href="\2">\1</a>', text)
+    return text
+
+
+def rst_inline(text):
+    text = str(text)
+    if "`" in text:
+        text = _CODE_RE.sub(r"``\1``", text)
+    if "](" in text:
+        text = _LINK_RE.sub(r"`\1 <\2>`_", text)
+    return text
 
 
 def sandwich(filling: str, bread: str, mirror=True):
@@ -0,0 +1,180 @@
+"""Minimal MessagePack encoder and decoder, enough to serialize the
+JSON like structures created by the builders and kept in the cache
+without extra dependencies.
+
+See https://github.com/msgpack/msgpack/blob/master/spec.md
+"""
+
+import struct
+
+CONSTANTS = {0xC0: None, 0xC2: False, 0xC3: True}
+NUMBERS = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+# type and format of the size for the codes followed by one
+SIZED = {
+    0xC4: (bytes, ">B"),
+    0xC5: (bytes, ">H"),
+    0xC6: (bytes, ">I"),
+    0xD9: (str, ">B"),
+    0xDA: (str, ">H"),
+    0xDB: (str, ">I"),
+    0xDC: (list, ">H"),
+    0xDD: (list, ">I"),
+    0xDE: (dict, ">H"),
+    0xDF: (dict, ">I"),
+}
+
+
+def packb(obj) -> bytes:
+    out = bytearray()
+    _pack(obj, out)
+    return bytes(out)
+
+
+def unpackb(data: bytes):
+    """Decode an object encoded by `packb`. Raise `ValueError` if `data`
+    isn't a single valid MessagePack object of the types `packb` writes.
+    """
+    try:
+        obj, offset = _unpack(data, 0)
+    except (IndexError, TypeError, struct.error, RecursionError) as e:
+        raise ValueError("Invalid MessagePack data") from e
+
+    if offset != len(data):
+        raise ValueError("Extra data after the MessagePack object")
+
+    return obj
+
+
+def _pack(obj, out: bytearray):
+    if obj is None:
+        out.append(0xC0)
+    elif obj is True:
+        out.append(0xC3)
+    elif obj is False:
+        out.append(0xC2)
+    elif isinstance(obj, int):
+        _pack_int(obj, out)
+    elif isinstance(obj, float):
+        out.append(0xCB)
+        out += struct.pack(">d", obj)
+    elif isinstance(obj, str):
+        data = obj.encode("utf-8")
+        _pack_header(len(data), out, 0xA0, 31, 0xD9, 0xDA, 0xDB)
+        out += data
+    elif isinstance(obj, (bytes, bytearray)):
+        _pack_header(len(obj), out, None, 0, 0xC4, 0xC5, 0xC6)
+        out += obj
+    elif isinstance(obj, (list, tuple)):
+        _pack_header(len(obj), out, 0x90, 15, None, 0xDC, 0xDD)
+        for i in obj:
+            _pack(i, out)
+    elif isinstance(obj, dict):
+        _pack_header(len(obj), out, 0x80, 15, None, 0xDE, 0xDF)
+        for k, v in obj.items():
+            _pack(k, out)
+            _pack(v, out)
+    else:
+        raise Exception("Can't serialize object of type `%s`" % type(obj).__name__)
+
+
+def _pack_header(size, out, fix, fix_max, code8, code16, code32):
+    if fix is not None and size <= fix_max:
+        out.append(fix | size)
+    elif code8 is not None and size <= 0xFF:
+        out += struct.pack(">BB", code8, size)
+    elif size <= 0xFFFF:
+        out += struct.pack(">BH", code16, size)
+    else:
+        out += struct.pack(">BI", code32, size)
+
+
+def _pack_int(value, out):
+    if 0 <= value <= 0x7F:
+        out.append(value)
+    elif -32 <= value < 0:
+        out += struct.pack(">b", value)
+    elif 0 <= value <= 0xFFFFFFFFFFFFFFFF:
+        for code, fmt, limit in (
+            (0xCC, "B", 0xFF),
+            (0xCD, "H", 0xFFFF),
+            (0xCE, "I", 0xFFFFFFFF),
+            (0xCF, "Q", None),
+        ):
+            if limit is None or value <= limit:
+                out += struct.pack(f">B{fmt}", code, value)
+                return
+    elif -(2**63) <= value < 0:
+        for code, fmt, limit in (
+            (0xD0, "b", 2**7),
+            (0xD1, "h", 2**15),
+            (0xD2, "i", 2**31),
+            (0xD3, "q", None),
+        ):
+            if limit is None or value >= -limit:
+                out += struct.pack(f">B{fmt}", code, value)
+                return
+    else:
+        raise Exception("Integer `%s` is out of range" % value)
+
+
+def _unpack(data, offset):
+    """Decode the object starting at `offset`, returning it along with
+    the offset of the next one.
+    """
+    code = data[offset]
+    offset += 1
+
+    if code <= 0x7F:
+        return code, offset
+    if code >= 0xE0:
+        return code - 0x100, offset
+    if code in CONSTANTS:
+        return CONSTANTS[code], offset
+    if code in NUMBERS:
+        fmt = NUMBERS[code]
+        return struct.unpack_from(fmt, data, offset)[0], offset + struct.calcsize(fmt)
+
+    if code <= 0x8F:
+        kind, size = dict, code & 0x0F
+    elif code <= 0x9F:
+        kind, size = list, code & 0x0F
+    elif code <= 0xBF:
+        kind, size = str, code & 0x1F
+    elif code in SIZED:
+        kind, fmt = SIZED[code]
+        size = struct.unpack_from(fmt, data, offset)[0]
+        offset += struct.calcsize(fmt)
+    else:
+        raise ValueError("Unsupported MessagePack type `0x%02x`" % code)
+
+    if kind is list:
+        items = []
+        for _ in range(size):
+            item, offset = _unpack(data, offset)
+            items.append(item)
+        return items, offset
+
+    if kind is dict:
+        obj = {}
+        for _ in range(size):
+            key, offset = _unpack(data, offset)
+            obj[key], offset = _unpack(data, offset)
+        return obj, offset
+
+    end = offset + size
+    if end > len(data):
+        raise ValueError("Truncated MessagePack data")
+
+    chunk = bytes(data[offset:end])
+    return (chunk.decode("utf-8") if kind is str else chunk), end
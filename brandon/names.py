@@ -0,0 +1,56 @@
+"""Normalization of the names found in the specification into
+identifiers used by the parser and the builders.
+
+The same names are normalized many times (e.g. a command name by the
+parser, then by every builder), so the results are memoized.
+"""
+
+import re
+import keyword
+from functools import lru_cache
+
+CACHE_SIZE = 2**17
+
+_NAME_RE = re.compile("[^A-Za-z0-9_-]")
+_CLASS_RE = re.compile("[^A-Za-z0-9]")
+_IDENTIFIER_RE = re.compile("[^A-Za-z0-9_]")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_name(name: str, dash_map="_") -> str:
+    """Name used for executables, groups, commands and parameters."""
+    return _NAME_RE.sub("", name).lower().replace("-", dash_map)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def class_name(name: str) -> str:
+    """Title case name used for enumerations, e.g. `output-formats`
+    becomes `OutputFormats`.
+    """
+    return _CLASS_RE.sub("", name.title())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def member_name(key) -> str:
+    """Upper case name used for enumeration keys, e.g. `key-1`
+    becomes `KEY_1`.
+    """
+    return _IDENTIFIER_RE.sub("", str(key).replace("-", "_")).upper()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def function_name(name: str) -> str:
+    """Snake case name used for functions, e.g. `my-command` becomes
+    `my_command`.
+    """
+    return _IDENTIFIER_RE.sub("", name.replace("-", "_")).lower()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def safe_identifier(name: str) -> str:
+    """Prefix `name` with an underscore if it's not a valid Python
+    identifier or if it's a reserved keyword.
+    """
+    if not name.isidentifier() or keyword.iskeyword(name):
+        return f"_{name}"
+    return name
@@ -0,0 +1,104 @@
+"""Output plans: the directories and files a builder would write,
+with their estimated sizes, worked out from the specification without
+rendering or writing anything. Used by the `--dry-run` option of the
+`generate` commands.
+"""
+
+import os
+from dataclasses import dataclass, asdict
+
+CREATE = "create"
+OVERWRITE = "overwrite"
+KEEP = "keep"
+DELETE = "delete"
+
+
+@dataclass
+class PlanEntry:
+    path: str
+    directory: bool
+    action: str
+    size: int = 0
+    current_size: int = 0
+
+
+class Plan:
+    """Entries of a plan, in the order they'd be written. Existing
+    files are looked up by listing each parent directory once, so
+    planning huge outputs costs one `scandir` per directory instead of
+    one `stat` per file.
+    """
+
+    def __init__(self) -> None:
+        self.entries = []
+        self._listings = {}
+
+    def _listing(self, dirname):
+        if dirname not in self._listings:
+            listing = {}
+            try:
+                with os.scandir(dirname) as it:
+                    for e in it:
+                        listing[e.name] = -1 if e.is_dir() else e.stat().st_size
+            except OSError:
+                pass
+            self._listings[dirname] = listing
+
+        return self._listings[dirname]
+
+    def _current_size(self, path):
+        """Size of the file in `path`, -1 for a directory or `None` if
+        there's nothing there.
+        """
+        dirname, name = os.path.split(path)
+        return self._listing(dirname).get(name)
+
+    def add_directory(self, path):
+        exists = self._current_size(path) == -1
+        self.entries.append(PlanEntry(path, True, KEEP if exists else CREATE))
+
+    def add_file(self, path, size):
+        current = self._current_size(path)
+        if current is None or current == -1:
+            self.entries.append(PlanEntry(path, False, CREATE, size))
+        else:
+            self.entries.append(PlanEntry(path, False, OVERWRITE, size, current))
+
+    def delete_file(self, path, size):
+        self.entries.append(PlanEntry(path, False, DELETE, 0, size))
+
+    def files(self):
+        return [e for e in self.entries if not e.directory]
+
+    def summary(self):
+        files = self.files()
+        counts = {CREATE: 0, OVERWRITE: 0, DELETE: 0}
+        for e in files:
+            counts[e.action] += 1
+
+        return {
+            "directories": sum(1 for e in self.entries if e.directory),
+            "new_directories": sum(
+                1 for e in self.entries if e.directory and e.action == CREATE
+            ),
+            "files": counts[CREATE] + counts[OVERWRITE],
+            "created": counts[CREATE],
+            "overwritten": counts[OVERWRITE],
+            "deleted": counts[DELETE],
+            "bytes": sum(e.size for e in files),
+        }
+
+    def to_dict(self):
+        return {
+            "summary": self.summary(),
+            "entries": [asdict(e) for e in self.entries],
+        }
+
+
+def markdown_table_size(header, rows):
+    """Estimated size of a Markdown table with bold `header` names,
+    from the lengths of the cells of each one of `rows`.
+    """
+    columns = len(header)
+    size = sum(len(h) + 2 for h in header) + 7 * columns + 5
+    return size + sum(sum(row) + 3 * columns + 2 for row in rows)
@@ -15,3 +15,19 @@ class PythonArgLibs(Enum):
     """Supported Python libraries for parsing command line arguments."""
 
     CLICK = "click"
+
+
+class SummaryFormats(Enum):
+    """Output formats for the summary of the command line interface."""
+
+    TEXT = "text"
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+class Shells(Enum):
+    """Shells supported by the completion scripts."""
+
+    BASH = "bash"
+    ZSH = "zsh"
+    FISH = "fish"
@@ -0,0 +1,186 @@
+"""Inverted index over the groups, commands, parameters and enums
+of an application, used by `brandon search`.
+"""
+
+import os
+import re
+import json
+import logging
+
+from brandon import cache
+from brandon.spec import Parser, Group, EnumObject
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile("[a-z0-9]+")
+_WORD_RE = re.compile("[a-z0-9][a-z0-9_-]*[a-z0-9]")
+
+
+def tokenize(text) -> set:
+    """Split `text` into lower case alphanumeric tokens. Names with
+    dashes or underscores are also kept whole, e.g. `--output_path`
+    yields `output`, `path` and `output-path`.
+    """
+    text = str(text).lower().replace("_", "-")
+    return set(_TOKEN_RE.findall(text)) | set(_WORD_RE.findall(text))
+
+
+class Index:
+    """Inverted index from tokens to the entries of an application.
+
+    Entries are grouped in units, one for each top level group, command
+    or enum. Each unit keeps the digest of its definition, along with the
+    name of the executable found in its paths, its entries (kind, path
+    and description) and its own postings (token to entry positions), so
+    when the specification changes only the units that changed are
+    indexed again.
+    """
+
+    VERSION = 1
+
+    def __init__(self, units=None, files=None) -> None:
+        self.units = units or {}
+        self.files = files or {}
+
+    @classmethod
+    def build(cls, app, previous=None):
+        units = {}
+        reused = 0
+
+        for key, obj in cls._units(app):
+            digest = cache.digest(app.exec, repr(obj))
+            old = previous.units.get(key) if previous else None
+
+            if old is not None and old["digest"] == digest:
+                units[key] = old
+                reused += 1
+                continue
+
+            entries = list(cls._entries(app, obj))
+            postings = {}
+            for i, (_, path, description) in enumerate(entries):
+                for t in tokenize(f"{path} {description}"):
+                    postings.setdefault(t, []).append(i)
+
+            units[key] = {"digest": digest, "entries": entries, "postings": postings}
+
+        logger.debug("Indexed %s units, %s reused", len(units) - reused, reused)
+        return cls(units=units)
+
+    @staticmethod
+    def _units(app):
+        for g in app.cli.groups:
+            yield f"group:{g.name}", g
+
+        for c in app.cli.commands:
+            yield f"command:{c.name}", c
+
+        for e in app.schemas.enums:
+            yield f"enum:{e.name}", e
+
+    @staticmethod
+    def _entries(app, obj):
+        if isinstance(obj, EnumObject):
+            yield ["enum", obj.name, obj.description or ""]
+            for k, v in obj.items.items():
+                yield ["item", f"{obj.name}.{k}", str(v)]
+            return
+
+        if isinstance(obj, Group):
+            yield ["group", f"{app.exec} {obj.name}", obj.description or ""]
+            commands = [(f"{app.exec} {obj.name} {c.name}", c) for c in obj.commands]
+        else:
+            commands = [(f"{app.exec} {obj.name}", obj)]
+
+        for path, c in commands:
+            yield ["command", path, c.description or ""]
+
+            for a in c.arguments:
+                yield ["argument", f"{path} <{a.name}>", a.description or ""]
+
+            for o in c.options:
+                yield ["option", f"{path} --{o.name}", o.description or ""]
+
+    def search(self, query, limit=None):
+        """Return the entries matching all tokens in `query`."""
+        tokens = tokenize(query)
+        results = []
+
+        if not tokens:
+            return results
+
+        for unit in self.units.values():
+            postings = unit["postings"]
+            matches = None
+
+            for t in tokens:
+                positions = postings.get(t)
+                if positions is None:
+                    matches = None
+                    break
+                matches = (
+                    set(positions) if matches is None else matches & set(positions)
+                )
+                if not matches:
+                    break
+
+            for i in sorted(matches or []):
+                results.append(unit["entries"][i])
+                if limit and len(results) >= limit:
+                    return results
+
+        return results
+
+    def is_current(self):
+        """Whether the files the index was built from are unchanged."""
+        return cache.is_current(self.files)
+
+    def save(self, filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with open(filename, "w") as fp:
+            json.dump(
+                {"version": self.VERSION, "files": self.files, "units": self.units},
+                fp,
+                separators=(",", ":"),
+            )
+
+    @classmethod
+    def load(cls, filename):
+        """Load a persisted index, or return `None` if there's no
+        usable index in `filename`.
+        """
+        try:
+            with open(filename) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return None
+
+        return cls(units=data["units"], files=data["files"])
+
+
+def load_index(filename):
+    """Return the index for the specification in `filename`. The
+    index persisted next to the specification is used while the files
+    it was built from are unchanged, otherwise it's updated and saved.
+    If it can't be saved, e.g. in a read-only directory, the updated
+    index is only kept in memory.
+    """
+    index_file = cache.cache_dir(filename, f"{os.path.basename(filename)}.index.json")
+    index = Index.load(index_file)
+
+    if index is not None and index.is_current():
+        return index
+
+    parser = Parser(filename)
+    index = Index.build(parser.app, previous=index)
+    index.files = cache.files_state(parser.files)
+    try:
+        index.save(index_file)
+    except OSError as e:
+        logger.debug("Index of `%s` not saved: %s", filename, e)
+
+    return index
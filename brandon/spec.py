@@ -1,11 +1,14 @@
-import re
+import os
 import yaml
 import logging
 from enum import Enum
 from dataclasses import dataclass, field
 
-logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
+from brandon import cache
+from brandon.workers import process_pool
+from brandon.names import normalize_name
+
+logger = logging.getLogger(__name__)
 
 
 class Types(Enum):
@@ -22,6 +25,7 @@ class Argument:
     type: Types
     description: str = field(default=None)
     example: str = field(default=None)
+    enum: str = field(default=None)
 
 
 @dataclass
@@ -32,6 +36,7 @@ class Option:
     short: str = field(default=None)
     default: str = field(default=None)
     example: str = field(default=None)
+    enum: str = field(default=None)
 
 
 @dataclass
@@ -39,6 +44,15 @@ class Group:
     name: str
     description: str
     commands: list
+    arguments: list = field(default_factory=list)
+    options: list = field(default_factory=list)
+
+    def inherited_by(self, command):
+        """Whether `command` got every parameter of the group, i.e. it
+        neither disables inheritance nor overrides any of them.
+        """
+        params = {id(p) for p in command.arguments + command.options}
+        return all(id(p) in params for p in self.arguments + self.options)
 
 
 @dataclass
@@ -48,6 +62,18 @@ class Command:
     arguments: list
     options: list
 
+    def inherit(self, arguments, options):
+        """Append parameters declared by the parent group. The same
+        objects are shared by all commands of the group, so they are
+        not copied. Parameters declared by the command itself with the
+        same name override the ones from the group.
+        """
+        own_args = {a.name for a in self.arguments}
+        own_opts = {o.name for o in self.options}
+
+        self.arguments.extend(a for a in arguments if a.name not in own_args)
+        self.options.extend(o for o in options if o.name not in own_opts)
+
 
 @dataclass
 class CLI:
@@ -92,20 +118,59 @@ class Application:
 class Parser:
     """Parser for applications defined using the YAML
     specification.
+
+    In streaming mode, the YAML events are consumed one group, command
+    or enum at a time, and only the top level fields of the application
+    are kept in `data`. That keeps the peak memory close to the size of
+    the resulting `Application`. If `streaming` is not set, streaming
+    is used for files larger than `STREAMING_THRESHOLD` bytes.
+
+    The `cli` and `schemas.enums` objects may be split across several
+    files with the `$include` key. Included files (shards) are loaded in
+    up to `jobs` worker processes and, if `cache` is set, each shard's
+    data is cached by the hash of its contents, so only the shards that
+    changed are loaded again. Cache entries of shards no longer included
+    are removed after parsing. The specification file and all included
+    files are listed in `files`.
+
+    Each group, command, parameter and enum found is logged only if
+    debug logging is enabled when the parser is created, so parsing
+    large specifications doesn't build records nobody reads.
     """
 
     REQUIRED_APP = ["name", "description", "version"]
+    STREAMING_THRESHOLD = 64 * 1024 * 1024
+    INCLUDE = "$include"
+    SHARD_CACHE_VERSION = "2"
+
+    def __init__(self, filename, streaming=None, jobs=None, cache=True):
+        self.filename = filename
+        self.files = [filename]
+        self.jobs = jobs
+        self.cache = cache
+        self.cache_entries = set()
+        self.debug = logger.isEnabledFor(logging.DEBUG)
+
+        if streaming is None:
+            streaming = os.path.getsize(filename) > self.STREAMING_THRESHOLD
 
-    def __init__(self, filename):
         with open(filename) as fp:
-            self.data = yaml.safe_load(fp)
+            if streaming:
+                self._stream_app(fp)
+            else:
+                self.data = yaml.safe_load(fp)
+                self._parse_app()
 
-        self._parse_app()
+        if self.cache:
+            self._evict_shards()
 
     def _normalize_name(self, name: str, dash_map="_") -> str:
-        return re.sub("[^A-Za-z0-9_-]", "", name).lower().replace("-", dash_map)
+        return normalize_name(name, dash_map)
+
+    def _parse_app(self, schemas=None, cli=None):
+        if type(self.data) != dict:
+            raise Exception("The specification must be an `Application` object")
 
-    def _parse_app(self):
         for field in self.REQUIRED_APP:
             if field not in self.data:
                 raise Exception(
@@ -113,8 +178,14 @@ class Parser:
                 )
 
         authors = self._parse_authors()
-        schemas = self._parse_schemas()
-        cli = self._parse_cli()
+
+        if schemas is None:
+            schemas = self._parse_schemas()
+
+        if cli is None:
+            cli = self._parse_cli()
+
+        self._check_enum_references(schemas, cli)
 
         self.app = Application(
             name=self.data["name"],
@@ -130,6 +201,34 @@ class Parser:
             cli=cli,
         )
 
+        commands = len(cli.commands) + sum(len(g.commands) for g in cli.groups)
+        logger.info(
+            "Parsed `%s`: %s groups, %s commands, %s enums",
+            self.filename,
+            len(cli.groups),
+            commands,
+            len(schemas.enums),
+            extra={
+                "spec": self.filename,
+                "groups": len(cli.groups),
+                "commands": commands,
+                "enums": len(schemas.enums),
+            },
+        )
+
+    def _check_enum_references(self, schemas, cli):
+        enums = {e.name for e in schemas.enums}
+        commands = list(cli.commands)
+        for g in cli.groups:
+            commands.extend(g.commands)
+
+        for c in commands:
+            for p in c.arguments + c.options:
+                if p.enum is not None and p.enum not in enums:
+                    raise Exception(
+                        "Enum `%s` used by `%s` is not defined" % (p.enum, p.name)
+                    )
+
     def _parse_authors(self):
         authors = []
 
@@ -151,14 +250,21 @@ class Parser:
             return Schemas()
 
         for name, object in self.data["schemas"]["enums"].items():
-            enums.append(self._parse_enum(name, object))
+            self._parse_enum_item(name, object, enums)
 
         return Schemas(enums=enums)
 
+    def _parse_enum_item(self, name, object, enums):
+        if name == self.INCLUDE:
+            enums.extend(self._load_shards(object, "enums"))
+        else:
+            enums.append(self._parse_enum(name, object))
+
     def _parse_enum(self, enum_name, object):
         description = object.get("description", None)
 
-        logger.debug("Found enum `%s`", enum_name)
+        if self.debug:
+            logger.debug("Found enum `%s`", enum_name)
 
         if "items" not in object:
             raise Exception("You must declare the `items` field, even if it's empty")
@@ -172,34 +278,188 @@ class Parser:
         commands = []
 
         for name, object in self.data["cli"].items():
-            if "commands" in object:
-                groups.append(self._parse_group(name, object))
+            self._parse_cli_item(name, object, groups, commands)
+
+        return CLI(commands=commands, groups=groups)
+
+    def _parse_cli_item(self, name, object, groups, commands):
+        if name == self.INCLUDE:
+            for item in self._load_shards(object, "cli"):
+                if isinstance(item, Group):
+                    groups.append(item)
+                else:
+                    commands.append(item)
+        elif "commands" in object:
+            groups.append(self._parse_group(name, object))
+        else:
+            commands.append(self._parse_command(name, object))
+
+    def _shards_cache_dir(self):
+        return cache.cache_dir(self.filename, "shards", os.path.basename(self.filename))
+
+    def _evict_shards(self):
+        """Remove the cache entries of shards not included anymore."""
+        cache.evict(self._shards_cache_dir(), self.cache_entries)
+
+    def _load_shards(self, paths, section):
+        """Parse the files included in `section`, returning their items
+        in the order the files were declared. The data of each shard is
+        loaded from the cache, or from the file if it's not cached, and
+        then parsed, so the cache only holds plain data.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+
+        root = os.path.dirname(os.path.abspath(self.filename))
+        results = {}
+        missing = {}
+
+        for path in paths:
+            shard = os.path.join(root, path)
+            if not os.path.isfile(shard):
+                raise Exception("Included file `%s` not found" % path)
+            self.files.append(shard)
+
+            cache_file = None
+            data = None
+            if self.cache:
+                key = cache.digest(
+                    self.SHARD_CACHE_VERSION, section, cache.file_digest(shard)
+                )
+                cache_file = os.path.join(self._shards_cache_dir(), key)
+                self.cache_entries.add(cache_file)
+                data = cache.load(cache_file)
+
+            if data is None:
+                logger.debug("Loading included file `%s`", path)
+                missing[path] = (shard, cache_file)
             else:
-                commands.append(self._parse_command(name, object))
+                results[path] = ShardParser(shard, section, data).items
+
+        if len(missing) > 1 and self.jobs != 1:
+            with process_pool(self.jobs) as executor:
+                futures = {
+                    path: executor.submit(load_shard, shard)
+                    for path, (shard, _) in missing.items()
+                }
+                loaded = {path: f.result() for path, f in futures.items()}
+        else:
+            loaded = {path: load_shard(shard) for path, (shard, _) in missing.items()}
+
+        for path, data in loaded.items():
+            shard, cache_file = missing[path]
+            results[path] = ShardParser(shard, section, data).items
+
+            if cache_file is not None:
+                try:
+                    cache.store(cache_file, data)
+                except Exception as e:
+                    logger.debug("Included file `%s` not cached: %s", path, e)
+
+        return [item for path in paths for item in results[path]]
+
+    def _stream_app(self, stream):
+        loader = yaml.SafeLoader(stream)
+        self.data = {}
+        schemas = None
+        cli = None
+
+        try:
+            loader.get_event()  # stream start
+            if not loader.check_event(yaml.DocumentStartEvent):
+                raise Exception("The specification must be an `Application` object")
+            loader.get_event()
+
+            for key in self._stream_mapping(loader, "Application"):
+                if key == "cli":
+                    cli = self._stream_cli(loader)
+                elif key == "schemas":
+                    schemas = self._stream_schemas(loader)
+                else:
+                    self.data[key] = self._stream_value(loader)
+        finally:
+            loader.dispose()
+
+        self._parse_app(schemas=schemas, cli=cli)
+
+    def _stream_cli(self, loader):
+        groups = []
+        commands = []
+
+        for name in self._stream_mapping(loader, "CLI"):
+            object = self._stream_value(loader)
+            self._parse_cli_item(name, object, groups, commands)
 
         return CLI(commands=commands, groups=groups)
 
+    def _stream_schemas(self, loader):
+        enums = []
+
+        for key in self._stream_mapping(loader, "Schema"):
+            if key != "enums":
+                self._stream_value(loader)
+                continue
+
+            for name in self._stream_mapping(loader, "Enum"):
+                self._parse_enum_item(name, self._stream_value(loader), enums)
+
+        return Schemas(enums=enums)
+
+    def _stream_mapping(self, loader, object_name):
+        """Yield the keys of the mapping starting at the current event.
+        The caller must consume the value of each key before asking
+        for the next one.
+        """
+        if not loader.check_event(yaml.MappingStartEvent):
+            raise Exception("`%s` object must be a mapping" % object_name)
+        loader.get_event()
+
+        while not loader.check_event(yaml.MappingEndEvent):
+            yield self._stream_value(loader)
+
+        loader.get_event()
+
+    def _stream_value(self, loader):
+        """Construct the value of the node starting at the current
+        event, without loading the rest of the document.
+        """
+        return loader.construct_document(loader.compose_node(None, None))
+
     def _parse_group(self, group_name, object):
         group_name = self._normalize_name(group_name)
         description = object.get("description", None)
         commands = []
 
-        logger.debug("Found group `%s`", group_name)
+        if self.debug:
+            logger.debug("Found group `%s`", group_name)
+
+        # group parameters are parsed once and shared by its commands
+        arguments = []
+        options = []
+
+        if "arguments" in object:
+            for name, arg in object["arguments"].items():
+                arguments.append(self._parse_argument(name, arg))
+
+        if "options" in object:
+            for name, opt in object["options"].items():
+                options.append(self._parse_option(name, opt))
 
         for name, command in object["commands"].items():
             comm = self._parse_command(name, command)
 
-            if "arguments" in object:
-                for name, arg in object["arguments"].items():
-                    comm.arguments.append(self._parse_argument(name, arg))
-
-            if "options" in object:
-                for name, opt in object["options"].items():
-                    comm.options.append(self._parse_option(name, opt))
+            if command.get("inherit", True):
+                comm.inherit(arguments, options)
 
             commands.append(comm)
 
-        return Group(name=group_name, description=description, commands=commands)
+        return Group(
+            name=group_name,
+            description=description,
+            commands=commands,
+            arguments=arguments,
+            options=options,
+        )
 
     def _parse_command(self, cmd_name, object):
         cmd_name = self._normalize_name(cmd_name)
@@ -207,7 +467,8 @@ class Parser:
         arguments = []
         options = []
 
-        logger.debug("Found command `%s`", cmd_name)
+        if self.debug:
+            logger.debug("Found command `%s`", cmd_name)
 
         if "arguments" in object:
             for name, arg in object["arguments"].items():
@@ -227,14 +488,20 @@ class Parser:
         if "type" not in object:
             raise Exception("Missing type for `%s` argument" % arg_name)
 
-        logger.debug("Found argument `%s`", arg_name)
+        if self.debug:
+            logger.debug("Found argument `%s`", arg_name)
 
         type = Types(object["type"])
         description = object.get("description", None)
         example = object.get("example", None)
+        enum = object.get("enum", None)
 
         return Argument(
-            name=arg_name, type=type, description=description, example=example
+            name=arg_name,
+            type=type,
+            description=description,
+            example=example,
+            enum=enum,
         )
 
     def _parse_option(self, opt_name, object):
@@ -243,13 +510,15 @@ class Parser:
         if "type" not in object:
             raise Exception("Missing type for `%s` option" % opt_name)
 
-        logger.debug("Found option `%s`", opt_name)
+        if self.debug:
+            logger.debug("Found option `%s`", opt_name)
 
         type = Types(object["type"])
         description = object.get("description", None)
         short = object.get("short", None)
         default = object.get("default", None)
         example = object.get("example", None)
+        enum = object.get("enum", None)
 
         return Option(
             name=opt_name,
@@ -258,4 +527,39 @@ class Parser:
             short=short,
             default=default,
             example=example,
+            enum=enum,
         )
+
+
+class ShardParser(Parser):
+    """Parser for the files included by a specification using the
+    `$include` key. Shards can't include other files.
+    """
+
+    def __init__(self, filename, section, data=None):
+        self.filename = filename
+        self.items = []
+        self.debug = logger.isEnabledFor(logging.DEBUG)
+
+        if data is None:
+            data = load_shard(filename)
+
+        if type(data) != dict:
+            raise Exception("Included file `%s` must be a mapping" % filename)
+
+        for name, object in data.items():
+            if section == "cli":
+                self._parse_cli_item(name, object, self.items, self.items)
+            else:
+                self._parse_enum_item(name, object, self.items)
+
+    def _load_shards(self, paths, section):
+        raise Exception("Included file `%s` can't include other files" % self.filename)
+
+
+def load_shard(filename):
+    """Load the data of a shard, to be parsed with `ShardParser`. Used
+    by the worker processes, as loading the YAML is the slowest part.
+    """
+    with open(filename) as fp:
+        return yaml.safe_load(fp)
@@ -0,0 +1,160 @@
+"""Content addressed store of rendered artifacts (e.g. group modules,
+`schemas.py` or documentation pages), shared by builders and by
+different runs through a local or shared directory.
+
+Artifacts are keyed by the digest of the specification subtree they
+were rendered from plus the version of the builder, so identical
+groups and enums are rendered only once, even across specifications.
+"""
+
+import os
+import threading
+
+from brandon import cache
+
+DEFAULT_MAX_BYTES = 512 * 2**20
+
+# when the store is full, the least recently used artifacts are
+# evicted until it's this fraction of the maximum size
+EVICTION_TARGET = 0.8
+
+
+def key(*parts) -> str:
+    """Digest of the `parts` an artifact is rendered from. Objects are
+    hashed through their `repr`, which for the dataclasses in the
+    specification includes the whole subtree.
+    """
+    return cache.digest(*(p if isinstance(p, str) else repr(p) for p in parts))
+
+
+class ArtifactStore:
+    def __init__(self, root, max_bytes=DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # the store is sent to the processes rendering documentation
+        # pages, each copy counting its own statistics to be merged
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state.update(hits=0, misses=0, evictions=0)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.root, key[:2], key[2:])
+
+    def get(self, key):
+        """Return the artifact stored under `key`, or `None`."""
+        path = self._path(key)
+
+        try:
+            with open(path) as fp:
+                content = fp.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # the modification time tracks the last use, for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def put(self, key, content: str):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # writing to a temporary file first, so concurrent runners
+        # never read a partially written artifact
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w") as fp:
+            fp.write(content)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum(s for _, _, s in self._entries())
+            else:
+                self._size += size
+
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                self._evict()
+
+    def fetch(self, key, render):
+        """Return the artifact stored under `key`, rendering it with
+        `render` and storing it if it's missing.
+        """
+        content = self.get(key)
+        if content is None:
+            content = render()
+            self.put(key, content)
+        return content
+
+    def _entries(self):
+        """Yield the path, modification time and size of each artifact."""
+        try:
+            prefixes = list(os.scandir(self.root))
+        except OSError:
+            return
+
+        for prefix in prefixes:
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                yield entry.path, st.st_mtime_ns, st.st_size
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        self._size = sum(e[2] for e in entries)
+        target = self.max_bytes * EVICTION_TARGET
+
+        for path, _, size in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def merge(self, stats):
+        """Add the statistics of a copy of the store used elsewhere."""
+        with self._lock:
+            self.hits += stats["hits"]
+            self.misses += stats["misses"]
+            self.evictions += stats["evictions"]
+            self._size = None
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+def fetch(store, key_parts, render):
+    """Render an artifact through `store`, or directly when there's
+    no store.
+    """
+    if store is None:
+        return render()
+    return store.fetch(key(*key_parts), render)
@@ -0,0 +1,19 @@
+"""Process pools used to parse shards and render pages.
+
+Workers are started with the default start method of `multiprocessing`.
+Applications that run brandon in several threads, where forking while
+another thread holds a lock (e.g. one of the logging module) can leave
+it locked forever in the child, may opt in to a forkserver with
+`multiprocessing.set_start_method("forkserver")`. Like `spawn`, it
+imports the `__main__` module of the application in each worker, so
+that module must guard its entry point with `if __name__ == "__main__"`.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(max_workers=None):
+    """Return a process pool of `max_workers` processes, started with
+    the start method selected by the application, see above.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers)
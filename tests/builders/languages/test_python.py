@@ -1,6 +1,20 @@
 import os
+import yaml
+import sys
+import pytest
+import zipfile
+import subprocess
+import importlib.util
 
-from brandon.builders.languages.python import Builder, Module, Decorator
+from brandon.spec import Parser, Option, EnumObject
+from brandon.builders.languages.python import (
+    Builder,
+    Module,
+    Decorator,
+    wrap_call,
+    string_literal,
+)
+from brandon.store import ArtifactStore
 
 
 def test_module(tmp_path, sample_module):
@@ -54,3 +68,290 @@ def test_support_files(tmp_path, app):
     assert os.path.exists(os.path.join(proj_folder, "README.md"))
     assert os.path.exists(os.path.join(proj_folder, "pyproject.toml"))
     # assert os.path.exists(os.path.join(proj_folder, "cli.yml"))
+
+
+def test_shared_params(tmp_path, app):
+    Builder(app=app, output_path=tmp_path).build()
+    group_file = os.path.join(
+        tmp_path, f"{app.exec}-{app.version}", app.exec, "cli", "group1.py"
+    )
+
+    with open(group_file) as fp:
+        content = fp.read()
+
+    # `arg1` is declared by the group, so it's created only once
+    assert content.count('"arg1"') == 1
+    assert 'click.Argument(["arg1"])' in content
+    assert content.count("@group1_shared_params") == 2
+    assert '@click.argument("arg2")\n@group1_shared_params\n' in content
+
+
+def test_shared_params_from_group(tmp_path, project_spec):
+    verbose = {"description": "Verbose output", "type": "flag"}
+    commands = project_spec["cli"]["group1"]["commands"]
+    commands["comm4"] = {"description": "Test command 4", "inherit": False}
+    # the same option declared by every command is not a group option
+    for c in commands.values():
+        c["options"] = {"verbose": verbose}
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    builder = Builder(app=Parser(yml_spec).app, output_path=tmp_path)
+    builder.build()
+
+    group_file = os.path.join(builder.source_root, "cli", "group1.py")
+    with open(group_file) as fp:
+        content = fp.read()
+
+    assert 'click.Option(["--verbose"' not in content
+    assert content.count('@click.option("--verbose", "verbose"') == 3
+    assert content.count("@group1_shared_params") == 2
+
+    spec = importlib.util.spec_from_file_location("group1", group_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    commands = module.group1_group.commands
+    assert [p.name for p in commands["comm4"].params] == ["verbose"]
+    assert [p.name for p in commands["comm3"].params] == ["verbose", "arg1"]
+
+
+def test_group_module(tmp_path, app):
+    Builder(app=app, output_path=tmp_path).build()
+    group_file = os.path.join(
+        tmp_path, f"{app.exec}-{app.version}", app.exec, "cli", "group1.py"
+    )
+
+    spec = importlib.util.spec_from_file_location("group1", group_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    commands = module.group1_group.commands
+    assert [p.name for p in commands["comm1"].params] == ["arg2", "arg1"]
+    assert [p.name for p in commands["comm3"].params] == ["arg1"]
+    # shared parameters are created once, when the module is imported
+    assert commands["comm1"].params[1] is commands["comm3"].params[0]
+
+
+def test_lazy_enums(tmp_path, app):
+    Builder(app=app, output_path=tmp_path, lazy_enums=True).build()
+    schemas_file = os.path.join(
+        tmp_path, f"{app.exec}-{app.version}", app.exec, "schemas.py"
+    )
+
+    spec = importlib.util.spec_from_file_location("schemas", schemas_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # enums are only created when first used
+    assert "Enum1" not in vars(module)
+    assert "Enum1" in dir(module)
+    assert module.Enum1.KEY1.value == "value1"
+    assert module.Enum1 is vars(module)["Enum1"]
+    assert module.Enum1.__qualname__ == "Enum1"
+
+    with pytest.raises(AttributeError):
+        module.Missing
+
+
+def test_artifact_store(tmp_path, app):
+    store = ArtifactStore(os.path.join(tmp_path, "store"))
+    contents = []
+
+    for output in ["first", "second"]:
+        builder = Builder(
+            app=app, output_path=os.path.join(tmp_path, output), store=store
+        )
+        builder.build()
+
+        with open(os.path.join(builder.source_root, "cli", "group1.py")) as fp:
+            contents.append(fp.read())
+
+    assert contents[0] == contents[1]
+    assert store.stats() == {"hits": 2, "misses": 2, "evictions": 0}
+
+
+def test_wrap_call():
+    assert wrap_call("f", ['"a"', "b=1"]) == ['f("a", b=1)']
+
+    items = [f'"{c * 38}"' for c in "ab"]
+    assert wrap_call("@click.option", items) == [
+        "@click.option(",
+        f"    {items[0]}, {items[1]}",
+        ")",
+    ]
+
+    items = [f'"{c * 40}"' for c in "abc"]
+    assert wrap_call("@f", items) == ["@f("] + [f"    {i}," for i in items] + [")"]
+
+    assert wrap_call("def f", ["x" * 90], ":", is_def=True)[1] == f"    {'x' * 90},"
+    assert wrap_call("f", ['"' + "x" * 90 + '"'])[1] == '    "' + "x" * 90 + '"'
+
+
+def test_string_literal():
+    assert string_literal("foo") == '"foo"'
+    assert string_literal('say "hi"') == "'say \"hi\"'"
+    # the quotes needing fewer escapes are used, double ones on ties
+    assert string_literal('it\'s "x"') == "'it\\'s \"x\"'"
+    assert string_literal("it's \"x") == '"it\'s \\"x"'
+
+
+def test_backslashes(tmp_path, project_spec):
+    project_spec["schemas"]["enums"]["paths"] = {
+        "description": "Paths like C:\\New folder\\",
+        "items": {"home": "C:\\Users\\"},
+    }
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    builder = Builder(app=Parser(yml_spec).app, output_path=tmp_path)
+    builder.build()
+
+    schemas_file = os.path.join(builder.source_root, "schemas.py")
+    spec = importlib.util.spec_from_file_location("schemas", schemas_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    assert module.Paths.__doc__ == "Paths like C:\\New folder\\"
+    assert module.Paths.HOME.value == "C:\\Users\\"
+
+
+@pytest.mark.parametrize("lazy_enums", [False, True])
+def test_black_stable(tmp_path, project_spec, lazy_enums):
+    black = pytest.importorskip("black")
+
+    project_spec["schemas"]["enums"]["quoted"] = {
+        "description": 'Enum with "quotes"',
+        "items": {"a": 'say "hi"', "b": "it's", "c": 1.5, "d": 'it\'s "red"'},
+    }
+    # YAML block descriptions, with indented and long last lines
+    project_spec["schemas"]["enums"]["multiline"] = {
+        "description": "First line\n  indented\n\tTabbed\n\nLast line\n",
+        "items": {"a": "x"},
+    }
+    project_spec["schemas"]["enums"]["long"] = {
+        "description": "First line\n" + "word " * 17 + '"end"',
+        "items": {"a": "x"},
+    }
+    project_spec["cli"]["group1"]["commands"]["comm1"]["options"] = {
+        f"option-{i}": {"description": "Long description " * 5, "type": "string"}
+        for i in range(3)
+    }
+    project_spec["cli"]["group1"]["options"] = {
+        "shared-0": {"description": "Long description " * 5, "type": "string"},
+        "shared-1": {"description": "Short", "type": "flag", "short": "s"},
+    }
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    app = Parser(yml_spec).app
+    builder = Builder(app=app, output_path=tmp_path, lazy_enums=lazy_enums)
+    builder.build()
+
+    for root, _, files in os.walk(builder.project_root):
+        for f in files:
+            if f.endswith(".py"):
+                with open(os.path.join(root, f)) as fp:
+                    content = fp.read()
+                assert black.format_str(content, mode=black.Mode()) == content, f
+
+
+@pytest.mark.parametrize("lazy_enums", [False, True])
+def test_plan(tmp_path, app, lazy_enums):
+    # literals with both kinds of quotes and backslashes are escaped
+    quoted = 'Say "hi", it\'s C:\\foo'
+    app.cli.groups[0].description = quoted
+    app.cli.groups[0].commands[0].description = quoted
+    app.schemas.enums[0].items["key2"] = quoted
+
+    # names that need a leading underscore to be identifiers
+    app.schemas.enums[0].items[1] = "one"
+    app.schemas.enums.append(EnumObject("2fa-methods", None, {"class": "otp"}))
+
+    group = app.cli.groups[0]
+    for i, description in enumerate(["Short", "Long description " * 5]):
+        option = Option(f"opt{i}", "flag", description=description, short="x")
+        group.options.append(option)
+        for c in group.commands:
+            c.options.append(option)
+
+    builder = Builder(app=app, output_path=tmp_path, lazy_enums=lazy_enums)
+    plan = builder.plan()
+
+    assert not os.path.exists(builder.project_root)
+    assert len(plan.entries) == 11
+
+    builder.build()
+
+    for e in plan.files():
+        assert os.path.getsize(e.path) == e.size, e.path
+
+    assert builder.plan().summary()["overwritten"] == 7
+
+
+def test_check(tmp_path, app):
+    builder = Builder(app=app, output_path=tmp_path)
+    builder.build()
+
+    assert builder.check() == []
+
+    app.schemas.enums[0].items["key2"] = "value2"
+    os.remove(os.path.join(builder.project_root, "README.md"))
+    drifts = builder.check(full=True)
+
+    assert [(os.path.basename(d.path), d.reason) for d in drifts] == [
+        ("schemas.py", "changed"),
+        ("README.md", "missing"),
+    ]
+
+
+def test_stale_modules(tmp_path, app):
+    builder = Builder(app=app, output_path=tmp_path)
+    builder.build()
+
+    group = app.cli.groups[0]
+    old_module = os.path.join(builder.source_root, "cli", f"{group.name}.py")
+    group.name = "renamed"
+
+    drifts = builder.check(full=True)
+    assert (old_module, "stale") in [(d.path, d.reason) for d in drifts]
+    assert builder.plan().summary()["deleted"] == 1
+
+    builder.build()
+
+    assert not os.path.exists(old_module)
+    assert builder.check() == []
+
+
+def test_zipapp(tmp_path, app):
+    builder = Builder(app=app, output_path=tmp_path, zipapp=True)
+    builder.build()
+
+    assert os.path.exists(os.path.join(builder.source_root, "__main__.py"))
+    assert builder.check() == []
+    assert len(builder.plan().files()) == 8
+
+    with zipfile.ZipFile(builder.archive_path) as archive:
+        names = set(archive.namelist())
+
+    assert {"__main__.py", "__main__.pyc"} <= names
+    for module in ["main", "schemas", "cli/group1", "cli/__init__"]:
+        assert f"{app.exec}/{module}.py" in names
+        assert f"{app.exec}/{module}.pyc" in names
+    assert not [n for n in names if "__pycache__" in n]
+
+    # click is bundled with its license
+    assert {"click/__init__.py", "click/__init__.pyc", "click/core.pyc"} <= names
+    assert [n for n in names if n.endswith("LICENSE.txt")]
+
+    # without site-packages, so click is only found in the archive
+    result = subprocess.run(
+        [sys.executable, "-S", builder.archive_path, "group1", "--help"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "comm1" in result.stdout
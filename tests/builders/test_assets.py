@@ -0,0 +1,67 @@
+import os
+import gzip
+import json
+
+from brandon.builders.assets import PostBuild
+from brandon.builders.html import Builder
+
+
+def build(tmp_path, app, **kwargs):
+    return Builder(app=app, output_path=tmp_path, **kwargs).build()
+
+
+def test_fingerprint(tmp_path, app):
+    build(tmp_path, app, fingerprint=True)
+    site_dir = os.path.join(tmp_path, f"{app.exec}-docs", "site")
+
+    with open(os.path.join(site_dir, "manifest.json")) as fp:
+        assets = json.load(fp)["assets"]
+
+    assert sorted(assets) == ["search.js", "style.css"]
+    for path in assets.values():
+        assert os.path.exists(os.path.join(site_dir, path))
+
+    with open(os.path.join(site_dir, "index.html")) as fp:
+        content = fp.read()
+
+    assert f'href="{assets["style.css"]}"' in content
+    assert f'src="{assets["search.js"]}"' in content
+    assert 'href="style.css"' not in content
+
+
+def test_compress(tmp_path, app):
+    stats = build(tmp_path, app, compress=True)
+    site_dir = os.path.join(tmp_path, f"{app.exec}-docs", "site")
+
+    for f in ["index.html", "search.js", "search_index.json", "style.css"]:
+        with open(os.path.join(site_dir, f), "rb") as fp:
+            original = fp.read()
+        with gzip.open(os.path.join(site_dir, f + ".gz")) as fp:
+            assert fp.read() == original
+
+    assert stats["compressed"] > 0
+    assert stats["reused"] == 0
+
+
+def test_reuse_compressed_files(tmp_path, app):
+    first = build(tmp_path, app, fingerprint=True, compress=True)
+    second = build(tmp_path, app, fingerprint=True, compress=True)
+
+    assert second["compressed"] == 0
+    assert second["reused"] == first["compressed"] + first["reused"]
+
+
+def test_already_fingerprinted(tmp_path):
+    site_dir = tmp_path / "site"
+    site_dir.mkdir()
+    (site_dir / "bundle.0123abcd.min.js").write_text("var a = 1;")
+    (site_dir / "index.html").write_text('<script src="bundle.0123abcd.min.js">')
+
+    stats = PostBuild(site_dir, tmp_path / ".compressed", compress=False).run()
+
+    assert stats["fingerprinted"] == 0
+    assert sorted(os.listdir(site_dir)) == [
+        "bundle.0123abcd.min.js",
+        "index.html",
+        "manifest.json",
+    ]
@@ -0,0 +1,108 @@
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from brandon.builders.completion import Builder
+from brandon.schemas import Shells
+
+
+@pytest.fixture
+def enum_app(app):
+    app.cli.commands[0].options[0].enum = "enum1"
+    return app
+
+
+def complete_bash(script, words):
+    words_arr = " ".join(f'"{w}"' for w in words)
+    result = subprocess.run(
+        [
+            "bash",
+            "-c",
+            f"""{script}
+COMP_WORDS=({words_arr}); COMP_CWORD={len(words) - 1}
+_sampleapp_completion; printf '%s\\n' "${{COMPREPLY[@]}}"
+""",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [w for w in result.stdout.split("\n") if w]
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+def test_bash(enum_app):
+    script = Builder(app=enum_app, shell=Shells.BASH).build()
+
+    assert complete_bash(script, ["sampleapp", ""]) == ["group1", "comm2"]
+    assert complete_bash(script, ["sampleapp", "group1", "c"]) == ["comm1", "comm3"]
+    assert complete_bash(script, ["sampleapp", "comm2", "--"]) == ["--help", "--opt1"]
+    assert complete_bash(script, ["sampleapp", "comm2", "--opt1", ""]) == ["value1"]
+
+
+@pytest.fixture
+def quoted_app(enum_app, tmp_path):
+    marker = os.path.join(tmp_path, "pwned")
+    enum_app.schemas.enums[0].items = {
+        "k1": f"a;b$(touch {marker})",
+        "k2": "us east",
+        "k3": "it's \"red\"",
+    }
+    return enum_app
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="bash not available")
+def test_bash_quoted_values(quoted_app, tmp_path):
+    script = Builder(app=quoted_app, shell=Shells.BASH).build()
+
+    assert complete_bash(script, ["sampleapp", "comm2", "--opt1", ""]) == [
+        f"a\\;b\\$\\(touch\\ {tmp_path}/pwned\\)",
+        "us\\ east",
+        "it\\'s\\ \\\"red\\\"",
+    ]
+    assert complete_bash(script, ["sampleapp", "comm2", "--opt1", "us"]) == [
+        "us\\ east"
+    ]
+    assert not os.path.exists(os.path.join(tmp_path, "pwned"))
+
+
+def test_zsh_quoted_values(quoted_app, tmp_path):
+    script = Builder(app=quoted_app, shell=Shells.ZSH).build()
+
+    assert (
+        f"compadd -- 'a;b$(touch {tmp_path}/pwned)' 'us east'"
+        " 'it'\"'\"'s \"red\"'; return ;;" in script
+    )
+
+
+def test_fish_quoted_values(quoted_app, tmp_path):
+    script = Builder(app=quoted_app, shell=Shells.FISH).build()
+
+    assert (
+        f"-a 'a\\\\;b\\\\$\\\\(touch\\\\ {tmp_path}/pwned\\\\)"
+        " us\\\\ east it\\\\\\'s\\\\ \\\\\"red\\\\\"'" in script
+    )
+
+
+def test_zsh(enum_app):
+    script = Builder(app=enum_app, shell=Shells.ZSH).build()
+
+    assert script.startswith("#compdef sampleapp\n")
+    assert '        "comm2:--opt1") compadd -- value1; return ;;' in script
+    assert '        "group1") compadd -- comm1 comm3 ;;' in script
+    assert '        "group1 comm1") compadd -- --help; _files ;;' in script
+
+
+def test_fish(enum_app):
+    script = Builder(app=enum_app, shell=Shells.FISH).build()
+
+    assert (
+        "complete -c sampleapp -n __fish_use_subcommand -a group1 -d 'Test group'"
+        in script
+    )
+    assert (
+        "complete -c sampleapp -n '__fish_seen_subcommand_from comm2' -l opt1"
+        " -a 'value1' -d 'Option 1'" in script
+    )
@@ -1,7 +1,9 @@
 import os
 import yaml
+import pytest
 
 from brandon.builders.docs import Builder
+from brandon.store import ArtifactStore
 
 
 def test_config_file(tmp_path, app):
@@ -55,3 +57,160 @@ def test_page_creation(tmp_path, app):
     with open(os.path.join(ref_pages_dir, "enums.md")) as fp:
         content = fp.read()
         assert content.startswith(f"# Enums")
+
+
+def test_parallel_pages(tmp_path, app):
+    pages = {}
+    for jobs in [1, 2]:
+        output_path = os.path.join(tmp_path, str(jobs))
+        builder = Builder(app=app, output_path=output_path, jobs=jobs)
+        builder._create_directories()
+        builder._write_pages()
+
+        pages[jobs] = {}
+        for root, _, files in os.walk(builder.pages_dir):
+            for f in files:
+                path = os.path.join(root, f)
+                with open(path) as fp:
+                    pages[jobs][os.path.relpath(path, builder.pages_dir)] = fp.read()
+
+    assert len(pages[1]) == 5
+    assert pages[1] == pages[2]
+
+
+def test_rebuild(tmp_path, app):
+    builder = Builder(app=app, output_path=tmp_path)
+    builder._create_directories()
+    builder._write_pages()
+
+    page = os.path.join(builder.reference_pages_dir, "group1", "comm1.md")
+    os.utime(page, ns=(0, 0))
+
+    # building again on the same path keeps unchanged pages untouched
+    builder._create_directories()
+    builder._write_pages()
+    assert os.stat(page).st_mtime_ns == 0
+
+    # pages of removed commands are deleted
+    app.cli.groups[0].commands = app.cli.groups[0].commands[1:]
+    builder._create_directories()
+    builder._write_pages()
+    builder._remove_stale_pages()
+
+    assert not os.path.exists(page)
+    assert os.path.exists(
+        os.path.join(builder.reference_pages_dir, "group1", "comm3.md")
+    )
+
+
+def test_artifact_store(tmp_path, app):
+    store = ArtifactStore(os.path.join(tmp_path, "store"))
+
+    for jobs in [1, 2]:
+        output_path = os.path.join(tmp_path, str(jobs))
+        builder = Builder(app=app, output_path=output_path, jobs=jobs, store=store)
+        builder._create_directories()
+        builder._write_pages()
+
+    # 3 command pages and the enums page, rendered by the first build
+    assert store.stats() == {"hits": 4, "misses": 4, "evictions": 0}
+
+
+def test_enum_pages(tmp_path, app):
+    app.schemas.enums[0].items = {f"key{i}": f"value{i}" for i in range(5)}
+    builder = Builder(app=app, output_path=tmp_path)
+    builder._create_directories()
+    builder._write_pages()
+
+    enums_page = os.path.join(builder.reference_pages_dir, "enums.md")
+    assert os.path.exists(enums_page)
+
+    builder = Builder(app=app, output_path=tmp_path, enum_page_size=2)
+    builder._create_directories()
+    builder._write_mkdocs_conf()
+    builder._write_pages()
+    builder._remove_stale_pages()
+
+    assert not os.path.exists(enums_page)
+    assert sorted(os.listdir(builder.enums_pages_dir)) == [
+        "enum1-2.md",
+        "enum1-3.md",
+        "enum1.md",
+    ]
+
+    with open(os.path.join(builder.enums_pages_dir, "enum1-2.md")) as fp:
+        content = fp.read()
+    assert content.startswith("# Enum1\n\nItems 3 to 4 of 5.\n\n")
+    assert "| `key2` | value2 |" in content
+    assert "| `key4` |" not in content
+    assert content.endswith("[Previous](enum1.md) | [Next](enum1-3.md)\n\n")
+
+    with open(os.path.join(builder.output_path, "mkdocs.yml")) as fp:
+        config = yaml.full_load(fp)
+
+    assert config["nav"][1]["Reference"][1] == {
+        "Schemas": [
+            {
+                "Enums": [
+                    {
+                        "Enum1": [
+                            {"1-2": "reference/enums/enum1.md"},
+                            {"3-4": "reference/enums/enum1-2.md"},
+                            {"5-5": "reference/enums/enum1-3.md"},
+                        ]
+                    }
+                ]
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize("enum_page_size", [None, 1])
+def test_plan(tmp_path, app, enum_page_size):
+    app.schemas.enums[0].items[1] = "one"
+    builder = Builder(app=app, output_path=tmp_path, enum_page_size=enum_page_size)
+    plan = builder.plan()
+
+    assert not os.path.exists(builder.output_path)
+    assert all(e.action == "create" for e in plan.entries)
+
+    builder._create_directories()
+    builder._write_mkdocs_conf()
+    builder._write_pages()
+
+    # the estimates are exact for ASCII specifications
+    for e in plan.files():
+        assert os.path.getsize(e.path) == e.size, e.path
+
+    app.cli.groups[0].commands = app.cli.groups[0].commands[1:]
+    summary = builder.plan().summary()
+    assert summary["created"] == 0
+    assert summary["overwritten"] == len(plan.files()) - 1
+    assert summary["deleted"] == 1
+
+
+def test_check(tmp_path, app):
+    builder = Builder(app=app, output_path=tmp_path)
+    builder._create_directories()
+    builder._write_mkdocs_conf()
+    builder._write_pages()
+
+    assert builder.check() == []
+
+    page = os.path.join(builder.reference_pages_dir, "group1", "comm1.md")
+    with open(page, "a") as fp:
+        fp.write("edited")
+
+    app.cli.commands[0].description = "Changed description"
+    drifts = builder.check(full=True)
+
+    assert [(d.path, d.reason) for d in drifts] == [
+        (page, "changed"),
+        (os.path.join(builder.reference_pages_dir, "comm2.md"), "changed"),
+    ]
+    assert len(builder.check()) == 1
+
+    app.cli.groups[0].commands = app.cli.groups[0].commands[1:]
+    drifts = builder.check(full=True)
+    assert drifts[-1].path == page
+    assert drifts[-1].reason == "stale"
@@ -0,0 +1,62 @@
+import os
+import json
+
+from brandon.builders.html import Builder
+
+
+def test_single_page(tmp_path, app):
+    Builder(app=app, output_path=tmp_path).build()
+    site_dir = os.path.join(tmp_path, f"{app.exec}-docs", "site")
+
+    assert sorted(os.listdir(site_dir)) == [
+        "index.html",
+        "search.js",
+        "search_index.json",
+        "style.css",
+    ]
+
+    with open(os.path.join(site_dir, "index.html")) as fp:
+        content = fp.read()
+
+    assert f"<title>{app.name}</title>" in content
+    assert '<h3 id="command-group1-comm1">group1 comm1</h3>' in content
+    assert '<h3 id="command-comm2">comm2</h3>' in content
+    assert "<code>$ sampleapp group1 comm1 &lt;arg2&gt; &lt;arg1&gt;</code>" in content
+    assert '<h3 id="enum-Enum1">Enum1</h3>' in content
+
+
+def test_chunked_pages(tmp_path, app):
+    Builder(app=app, output_path=tmp_path, chunked=True).build()
+    site_dir = os.path.join(tmp_path, f"{app.exec}-docs", "site")
+
+    for page in ["index.html", "group-group1.html", "commands.html", "enums.html"]:
+        assert os.path.exists(os.path.join(site_dir, page))
+
+
+def test_group_named_like_a_page(tmp_path, app):
+    app.cli.groups[0].name = "index"
+    Builder(app=app, output_path=tmp_path, chunked=True).build()
+    site_dir = os.path.join(tmp_path, f"{app.exec}-docs", "site")
+
+    with open(os.path.join(site_dir, "index.html")) as fp:
+        content = fp.read()
+
+    assert "<h2>Reference</h2>" in content
+    assert '<a href="group-index.html">index</a>' in content
+    assert os.path.exists(os.path.join(site_dir, "group-index.html"))
+
+
+def test_search_index(tmp_path, app):
+    Builder(app=app, output_path=tmp_path, chunked=True).build()
+    index_file = os.path.join(tmp_path, f"{app.exec}-docs", "site", "search_index.json")
+
+    with open(index_file) as fp:
+        docs = json.load(fp)["docs"]
+
+    assert ["group1", "group-group1.html#group-group1", "Test group"] in docs
+    assert [
+        "comm2",
+        "commands.html#command-comm2",
+        "Test command 2 --opt1",
+    ] in docs
+    assert docs[-1][1] == "enums.html#enum-Enum1"
@@ -2,7 +2,7 @@ import os
 import pytest
 
 from brandon.builders.languages import PythonBuilder
-from brandon.builders.project import Project
+from brandon.builders.project import Project, check_projects, create_projects
 from brandon.schemas import Languages
 
 
@@ -35,3 +35,35 @@ def test_creation(tmp_path, app):
     )
     project.create()
     assert os.path.exists(os.path.join(project_dir, "README.md"))
+
+
+def test_create_projects(tmp_path, app):
+    reports = create_projects(
+        app=app, languages=["python", "go", "python"], output_path=tmp_path
+    )
+
+    assert [r.language for r in reports] == ["python", "go"]
+    assert reports[0].ok
+    assert reports[0].output_path == os.path.join(
+        tmp_path, "python", f"{app.exec}-{app.version}"
+    )
+    assert os.path.exists(os.path.join(reports[0].output_path, "README.md"))
+
+    assert not reports[1].ok
+    assert reports[1].error == "Unsupported language `go`"
+
+
+def test_check_projects(tmp_path, app):
+    create_projects(
+        app=app,
+        languages=["python"],
+        output_path=tmp_path,
+        lazy_enums=True,
+        zipapp=True,
+    )
+
+    assert check_projects(app, ["python"], tmp_path, lazy_enums=True, zipapp=True) == []
+    assert [
+        os.path.basename(d.path)
+        for d in check_projects(app, ["python"], tmp_path, full=True)
+    ] == ["schemas.py"]
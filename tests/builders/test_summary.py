@@ -1,4 +1,11 @@
-from brandon.builders.summary import Builder
+import os
+import json
+import yaml
+import datetime
+
+from brandon import cache
+from brandon.builders.summary import Builder, load_summary
+from brandon.schemas import SummaryFormats
 
 
 summary_sample = """Sample App - Sample desc
@@ -16,3 +23,94 @@ Authors:
 
 def test_summary_creation(app):
     assert Builder(app=app).build() == summary_sample
+
+
+def test_summary_json(app):
+    summary = json.loads(Builder(app=app).build(SummaryFormats.JSON))
+
+    assert summary["exec"] == "sampleapp"
+    assert summary["groups"][0]["commands"][0]["arguments"] == [
+        {"name": "arg2", "type": "int", "description": "Local argument"},
+        {"name": "arg1", "type": "string", "description": "Global argument"},
+    ]
+    assert summary["commands"][0]["options"] == [
+        {
+            "name": "opt1",
+            "short": None,
+            "type": "flag",
+            "description": "Option 1",
+            "default": None,
+        }
+    ]
+
+
+def test_summary_msgpack(app):
+    summary = Builder(app=app).build(SummaryFormats.MSGPACK)
+
+    assert isinstance(summary, bytes)
+    assert summary.startswith(b"\x87\xa4name\xaaSample App")
+
+
+def test_summary_build_twice(app):
+    builder = Builder(app=app)
+    assert builder.build() == builder.build() == summary_sample
+
+
+def test_load_summary(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert load_summary(yml_spec) == summary_sample
+    assert (
+        json.loads(load_summary(yml_spec, SummaryFormats.JSON))["name"] == "Sample App"
+    )
+
+    cache_file = os.path.join(tmp_path, ".brandon", "project.yml.summary")
+    assert set(cache.load(cache_file)["outputs"]) == {"text", "json"}
+    assert "app" not in cache.load(cache_file)
+
+    project_spec["description"] = "Changed desc"
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert load_summary(yml_spec).startswith("Sample App - Changed desc")
+
+
+def test_load_summary_invalid_cache(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    cache_file = os.path.join(tmp_path, ".brandon", "project.yml.summary")
+    for entry in [["not", "a", "summary"], {"version": Builder.VERSION}]:
+        cache.store(cache_file, entry)
+        assert load_summary(yml_spec) == summary_sample
+
+
+def test_load_summary_single_format(tmp_path, project_spec):
+    # dates can't be rendered as JSON, which doesn't affect the text
+    project_spec["cli"]["comm2"]["options"]["opt1"]["default"] = datetime.date(
+        2020, 1, 1
+    )
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert load_summary(yml_spec) == summary_sample
+    assert load_summary(yml_spec) == summary_sample
+
+    cache_file = os.path.join(tmp_path, ".brandon", "project.yml.summary")
+    assert set(cache.load(cache_file)["outputs"]) == {"text"}
+
+
+def test_load_summary_read_only_cache(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    # a file in place of the cache directory
+    with open(os.path.join(tmp_path, ".brandon"), "w") as fp:
+        fp.write("")
+
+    assert load_summary(yml_spec) == summary_sample
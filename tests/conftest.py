@@ -20,7 +20,6 @@ def my_function(opt):
 
 if __name__ == "__main__":
     my_function()
-
 '''
 
 
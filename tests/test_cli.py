@@ -1,10 +1,13 @@
 import os
+import json
 import yaml
 
 import pytest
 from click.testing import CliRunner
 
-from brandon.cli.generate import project, docs
+from brandon.cli.generate import project, docs, summary, completion
+from brandon.cli.search import search
+from brandon.cli.lint import lint
 
 
 @pytest.fixture
@@ -64,6 +67,35 @@ def test_generate_docs(tmp_path, project_spec):
     assert os.path.exists(os.path.join(tmp_path, "sample-docs", "mkdocs.yml"))
 
 
+def test_generate_docs_negative_values(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    for option in ["--jobs", "--enum-page-size"]:
+        result = runner.invoke(docs, [str(yml_spec), "-o", tmp_path, option, "-1"])
+
+        assert result.exit_code == 2
+        assert option in result.output
+        assert not os.path.exists(os.path.join(tmp_path, "sample-docs"))
+
+
+def test_generate_html_docs(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        docs, [str(yml_spec), "--output-path", tmp_path, "--format", "html"]
+    )
+
+    assert result.exit_code == 0
+    assert os.path.exists(os.path.join(tmp_path, "sample-docs", "site", "index.html"))
+    assert not os.path.exists(os.path.join(tmp_path, "sample-docs", "mkdocs.yml"))
+
+
 def test_malformed_yaml(tmp_path):
     yml_spec = os.path.join(tmp_path, "project.yml")
     with open(yml_spec, "w") as fp:
@@ -73,3 +105,128 @@ def test_malformed_yaml(tmp_path):
     result = runner.invoke(project, [str(yml_spec), "--output-path", tmp_path])
 
     assert result.exit_code == 1
+
+
+def test_search(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(search, [str(yml_spec), "test", "command"])
+
+    assert result.exit_code == 0
+    assert result.output == "command   sample test     Test command.\n"
+
+
+def test_generate_summary(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(summary, [str(yml_spec), "--format", "json"])
+
+    assert result.exit_code == 0
+    assert result.output.startswith('{"name":"Sample"')
+
+
+def test_generate_completion(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(completion, [str(yml_spec), "--shell", "fish"])
+
+    assert result.exit_code == 0
+    assert result.output.startswith("# fish completion for sample\n")
+
+
+def test_lint(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(lint, [str(yml_spec)])
+    assert result.exit_code == 0
+
+    result = runner.invoke(
+        lint, [str(yml_spec), "-t", "top-level-commands=0", "--json"]
+    )
+    assert result.exit_code == 1
+    assert json.loads(result.output)[0]["rule"] == "top-level-commands"
+
+
+def test_generate_all_languages(tmp_path, project_spec):
+    project_spec["languages"] = ["python", "go"]
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        project, [str(yml_spec), "--all-languages", "-o", str(tmp_path)]
+    )
+
+    assert result.exit_code == 1
+    lines = result.output.splitlines()
+    assert lines[0].startswith("python  ok")
+    assert lines[1].startswith("go      failed")
+    assert lines[2].startswith("1 of 2 projects for `Sample` created in")
+    assert os.path.exists(os.path.join(tmp_path, "python", "sample-1.0.0", "README.md"))
+
+
+def test_dry_run(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+    output_path = os.path.join(tmp_path, "output")
+
+    runner = CliRunner()
+    result = runner.invoke(
+        project, [str(yml_spec), "-o", output_path, "--dry-run", "--json"]
+    )
+
+    assert result.exit_code == 0
+    plan = json.loads(result.output)
+    assert plan["summary"]["created"] == 6
+    assert plan["summary"]["bytes"] > 0
+    assert not os.path.exists(output_path)
+
+    result = runner.invoke(docs, [str(yml_spec), "-o", output_path, "--dry-run"])
+
+    assert result.exit_code == 0
+    assert result.output.splitlines()[-1].startswith("4 files (4 new, 0 overwritten)")
+    assert not os.path.exists(output_path)
+
+
+def test_check(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+    output_path = os.path.join(tmp_path, "output")
+
+    runner = CliRunner()
+    args = [str(yml_spec), "-o", output_path, "-l", "python"]
+    result = runner.invoke(project, args + ["--check"])
+
+    assert result.exit_code == 1
+    assert result.output.startswith("missing")
+    assert not os.path.exists(output_path)
+
+    runner.invoke(project, args)
+    result = runner.invoke(project, args + ["--check", "--json"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == []
+
+    project_spec["cli"]["test"]["description"] = "Changed."
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    result = runner.invoke(project, args + ["--check", "--full-report", "--json"])
+
+    assert result.exit_code == 1
+    assert [d["reason"] for d in json.loads(result.output)] == ["changed"]
@@ -0,0 +1,33 @@
+from brandon.drift import check_files
+
+
+def test_check_files(tmp_path):
+    (tmp_path / "same.txt").write_text("content")
+    (tmp_path / "changed.txt").write_text("old content")
+
+    files = [
+        (str(tmp_path / "same.txt"), "content"),
+        (str(tmp_path / "changed.txt"), "new content"),
+        (str(tmp_path / "missing.txt"), "content"),
+    ]
+    drifts = check_files(files, stale=[str(tmp_path / "stale.txt")], full=True)
+
+    assert [(d.path, d.reason) for d in drifts] == [
+        (str(tmp_path / "changed.txt"), "changed"),
+        (str(tmp_path / "missing.txt"), "missing"),
+        (str(tmp_path / "stale.txt"), "stale"),
+    ]
+
+
+def test_stop_at_first_drift(tmp_path):
+    rendered = []
+
+    def files():
+        for i in range(10):
+            rendered.append(i)
+            yield str(tmp_path / f"{i}.txt"), "content"
+
+    drifts = check_files(files())
+
+    assert len(drifts) == 1
+    assert rendered == [0]
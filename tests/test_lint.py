@@ -0,0 +1,65 @@
+import pytest
+
+from brandon.spec import Argument
+from brandon.lint import lint, register, Rule, Finding, RULES
+
+
+def test_default_thresholds(app):
+    assert lint(app) == []
+
+
+def test_findings(app):
+    thresholds = {name: 0 for name in RULES}
+    findings = {(f.rule, f.path): f for f in lint(app, thresholds=thresholds)}
+
+    assert set(findings) == {
+        ("top-level-commands", "main"),
+        ("large-group", "group1"),
+        ("large-enum", "Enum1"),
+    }
+
+    # the commands have 3 decorators (comm1, arg2 and comm3) and `arg1`
+    # is created once, for both of them
+    group = findings[("large-group", "group1")]
+    assert group.decorators == 4
+    assert group.lines == 25
+
+
+def test_shared_parameters(app):
+    group = app.cli.groups[0]
+    thresholds = {"shared-parameters": 0}
+    assert lint(app, rules=["shared-parameters"], thresholds=thresholds) == []
+
+    # comm1 overrides the new group argument, so it repeats `arg1`
+    arg = Argument(name="arg3", type="string")
+    group.arguments.append(arg)
+    group.commands[0].arguments.append(Argument(name="arg3", type="int"))
+    group.commands[1].arguments.append(arg)
+
+    findings = lint(app, rules=["shared-parameters"], thresholds=thresholds)
+    assert [(f.path, f.decorators) for f in findings] == [("group1", 1)]
+    assert findings[0].message.startswith("2 group parameters repeated 1 times")
+
+
+def test_selected_rules(app):
+    findings = lint(app, rules=["large-enum"], thresholds={"large-enum": 0})
+    assert [f.rule for f in findings] == ["large-enum"]
+
+    with pytest.raises(Exception):
+        lint(app, rules=["unknown"])
+
+
+def test_custom_rule(app):
+    @register
+    class NoDescription(Rule):
+        name = "test-no-description"
+        description = "Commands without a description."
+
+        def check(self, app):
+            for c in app.cli.commands:
+                yield Finding(rule=self.name, path=c.name, message="test")
+
+    try:
+        assert [f.path for f in lint(app, rules=["test-no-description"])] == ["comm2"]
+    finally:
+        del RULES["test-no-description"]
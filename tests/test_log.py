@@ -0,0 +1,71 @@
+import io
+import os
+import json
+import yaml
+import logging
+
+import pytest
+
+from brandon.log import configure
+from brandon.spec import Parser
+import brandon.main  # imports the modules that create loggers
+
+
+@pytest.fixture
+def brandon_logger():
+    logger = logging.getLogger("brandon")
+    handlers, level, propagate = list(logger.handlers), logger.level, logger.propagate
+    yield logger
+    logger.handlers = handlers
+    logger.setLevel(level)
+    logger.propagate = propagate
+
+
+def test_library_defaults():
+    # modules don't change the level of their loggers
+    for name in ["brandon.spec", "brandon.cli.generate", "brandon.main"]:
+        assert logging.getLogger(name).level == logging.NOTSET
+
+    assert any(
+        isinstance(h, logging.NullHandler)
+        for h in logging.getLogger("brandon").handlers
+    )
+
+
+def test_configure(brandon_logger):
+    stream = io.StringIO()
+    configure(level="info", stream=stream)
+    configure(level="info", stream=stream)
+
+    logging.getLogger("brandon.spec").info("Parsed `%s`", "cli.yml")
+    logging.getLogger("brandon.spec").debug("Found group `%s`", "group1")
+
+    assert stream.getvalue() == "INFO: Parsed `cli.yml`\n"
+
+
+def test_json_output(brandon_logger):
+    stream = io.StringIO()
+    configure(level="debug", json_output=True, stream=stream)
+
+    logging.getLogger("brandon.spec").info("Parsed", extra={"commands": 3})
+    entry = json.loads(stream.getvalue())
+
+    assert entry["level"] == "info"
+    assert entry["logger"] == "brandon.spec"
+    assert entry["message"] == "Parsed"
+    assert entry["commands"] == 3
+
+
+def test_parser_debug(tmp_path, project_spec, brandon_logger):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    stream = io.StringIO()
+    configure(level="warning", stream=stream)
+    assert not Parser(yml_spec).debug
+
+    configure(level="debug", stream=stream)
+    Parser(yml_spec)
+
+    assert "DEBUG: Found command `comm1`" in stream.getvalue().splitlines()
@@ -1,5 +1,6 @@
 import pytest
 from io import StringIO
+from dataclasses import FrozenInstanceError
 
 from brandon.md_utils import (
     Document,
@@ -9,6 +10,9 @@ from brandon.md_utils import (
     UnorderedList,
     Link,
     Command,
+    fragment,
+    HTML,
+    RST,
 )
 
 
@@ -99,3 +103,68 @@ def test_command():
 
     command = Command(args=["ls", "-a", "/tmp"], root=True)
     assert command.render() == "`# ls -a /tmp`\n\n"
+
+
+def test_fragments():
+    heading = fragment(Heading(name="Usage", level=1))
+    assert fragment(Heading(name="Usage", level=1)) is heading
+    assert fragment(Heading(name="Usage", level=2)) is not heading
+    assert heading.render() is heading.render()
+
+    with pytest.raises(FrozenInstanceError):
+        heading.name = "Other"
+
+    command = Command(args=["ls", "-a"])
+    assert command == Command(args=("ls", "-a"))
+    assert hash(command) == hash(Command(args=["ls", "-a"]))
+
+
+def sample_doc():
+    doc = Document(title="Title")
+    doc.add(Paragraph(text="Run `foo`"))
+    doc.add(Heading(name="Usage", level=1))
+    doc.add(Command(args=["foo", "<bar>"]))
+    doc.add(Table(header=["Key", "Value"], rows=[["`a`", "1"]]))
+    doc.add(UnorderedList(items=["[Foo](bar)"]))
+    return doc
+
+
+def test_single_write():
+    class Stream(StringIO):
+        calls = 0
+
+        def write(self, s):
+            self.calls += 1
+            return super().write(s)
+
+    stream = Stream()
+    doc = sample_doc()
+    doc.write(stream)
+
+    assert stream.calls == 1
+    assert stream.getvalue() == sample_doc().render()
+
+
+def test_html_renderer():
+    assert sample_doc().render(HTML) == (
+        "<h1>Title</h1>\n"
+        "<p>Run <code>foo</code></p>\n"
+        "<h2>Usage</h2>\n"
+        "<pre><code>$ foo &lt;bar&gt;</code></pre>\n"
+        "<table>\n<tr><th>Key</th><th>Value</th></tr>\n"
+        "<tr><td><code>a</code></td><td>1</td></tr>\n</table>\n"
+        '<ul>\n<li><a href="bar">Foo</a></li>\n</ul>\n'
+    )
+
+
+def test_rst_renderer():
+    assert sample_doc().render(RST) == (
+        "=====\nTitle\n=====\n\n"
+        "Run ``foo``\n\n"
+        "Usage\n-----\n\n"
+        ".. code-block:: console\n\n   $ foo <bar>\n\n"
+        ".. list-table::\n   :header-rows: 1\n\n"
+        "   * - Key\n     - Value\n"
+        "   * - ``a``\n     - 1\n\n"
+        "- `Foo <bar>`_\n\n"
+    )
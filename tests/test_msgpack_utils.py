@@ -0,0 +1,55 @@
+import pytest
+
+from brandon.msgpack_utils import packb, unpackb
+
+SAMPLES = [
+    (None, b"\xc0"),
+    (True, b"\xc3"),
+    (False, b"\xc2"),
+    (1, b"\x01"),
+    (-1, b"\xff"),
+    (200, b"\xcc\xc8"),
+    (-200, b"\xd1\xff\x38"),
+    (70000, b"\xce\x00\x01\x11\x70"),
+    (1.5, b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00"),
+    ("abc", b"\xa3abc"),
+    ("a" * 32, b"\xd9\x20" + b"a" * 32),
+    ([1, 2], b"\x92\x01\x02"),
+    ({"a": None}, b"\x81\xa1a\xc0"),
+    (list(range(16)), b"\xdc\x00\x10" + bytes(range(16))),
+]
+
+
+@pytest.mark.parametrize("obj,expected", SAMPLES)
+def test_packb(obj, expected):
+    assert packb(obj) == expected
+
+
+def test_packb_unsupported():
+    with pytest.raises(Exception):
+        packb(object())
+
+
+@pytest.mark.parametrize("obj,data", SAMPLES)
+def test_unpackb(obj, data):
+    assert unpackb(data) == obj
+
+
+def test_round_trip():
+    obj = {
+        "str": "é" * 300,
+        "bin": b"\x00" * 70000,
+        "ints": [2**64 - 1, -(2**63), -33, 255, 65536],
+        "map": {i: str(i) for i in range(20)},
+        1.5: [None, True, False],
+    }
+    assert unpackb(packb(obj)) == obj
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"\xa3ab", b"\x92\x01", b"\x01\x02", b"\xc1", b"\x81\x91\x01\x01"],
+)
+def test_unpackb_invalid(data):
+    with pytest.raises(ValueError):
+        unpackb(data)
@@ -0,0 +1,37 @@
+from brandon.names import (
+    normalize_name,
+    class_name,
+    member_name,
+    function_name,
+    safe_identifier,
+)
+
+
+def test_normalize_name():
+    assert normalize_name("Sample App") == "sampleapp"
+    assert normalize_name("Get-cOmm!") == "get_comm"
+    assert normalize_name("Get-cOmm!", dash_map="-") == "get-comm"
+    assert normalize_name("group1") == "group1"
+
+
+def test_class_name():
+    assert class_name("output-formats") == "OutputFormats"
+    assert class_name("python-arg-libs") == "PythonArgLibs"
+    assert class_name("enum1") == "Enum1"
+
+
+def test_member_name():
+    assert member_name("key-1") == "KEY_1"
+    assert member_name("utf-16") == "UTF_16"
+    assert member_name(10) == "10"
+
+
+def test_function_name():
+    assert function_name("my-command") == "my_command"
+    assert function_name("group1_group") == "group1_group"
+
+
+def test_safe_identifier():
+    assert safe_identifier("class") == "_class"
+    assert safe_identifier("10") == "_10"
+    assert safe_identifier("name") == "name"
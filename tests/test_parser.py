@@ -1,7 +1,10 @@
 import os
 import yaml
+import pickle
+import datetime
 import pytest
 
+from brandon import cache
 from brandon.spec import Parser, Types
 
 
@@ -82,3 +85,193 @@ def test_enums(tmp_path, project_spec):
     assert enum1.name == "enum1"
     assert len(enum1.items) == 1
     assert enum1.items["key1"] == "value1"
+
+
+def test_group_parameters(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    group = project_spec["cli"]["group1"]
+    group["options"] = {"opt2": {"description": "Group option", "type": "int"}}
+    group["commands"]["comm3"]["options"] = {
+        "opt2": {"description": "Overridden option", "type": "string"}
+    }
+    group["commands"]["comm4"] = {"description": "Test command 4", "inherit": False}
+
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    group = Parser(yml_spec).app.cli.groups[0]
+    comm1, comm3, comm4 = group.commands
+    assert group.arguments[0].name == "arg1"
+    assert group.options[0].name == "opt2"
+
+    # group parameters are shared, not copied
+    assert comm1.arguments[1] is group.arguments[0]
+    assert comm3.arguments[0] is group.arguments[0]
+    assert comm1.options[0] is group.options[0]
+
+    assert len(comm3.options) == 1
+    assert comm3.options[0].description == "Overridden option"
+
+    assert comm4.arguments == []
+    assert comm4.options == []
+
+
+def test_streaming(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    parser = Parser(yml_spec, streaming=True)
+    assert parser.app == Parser(yml_spec, streaming=False).app
+
+    # raw data is only kept for the top level fields
+    assert "cli" not in parser.data
+    assert "schemas" not in parser.data
+
+
+def test_streaming_anchors(tmp_path):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        fp.write(
+            """
+name: Sample
+version: 1.0.0
+description: Sample desc
+authors: [{name: Author}]
+cli:
+  comm1:
+    description: Test command 1
+    options:
+      opt1: &opt {description: Option 1, type: int}
+  comm2:
+    description: Test command 2
+    options:
+      opt1: *opt
+"""
+        )
+
+    app = Parser(yml_spec, streaming=True).app
+    assert app.cli.commands[1].options[0].type == Types.INT
+
+
+def test_streaming_malformed(tmp_path):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        fp.write("foo")
+
+    with pytest.raises(Exception):
+        Parser(yml_spec, streaming=True)
+
+
+@pytest.fixture
+def sharded_spec(tmp_path, project_spec):
+    cli = project_spec["cli"]
+    enums = project_spec["schemas"]["enums"]
+    shards = {
+        "group1.yml": {"group1": cli.pop("group1")},
+        "comm2.yml": {"comm2": cli.pop("comm2")},
+        "enums.yml": enums,
+    }
+    cli["$include"] = ["group1.yml", "comm2.yml"]
+    cli["version"] = {"description": "Show the version"}
+    project_spec["schemas"]["enums"] = {"$include": "enums.yml"}
+
+    for name, data in shards.items():
+        with open(os.path.join(tmp_path, name), "w") as fp:
+            yaml.dump(data, fp)
+
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    return yml_spec
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_includes(sharded_spec, streaming):
+    app = Parser(sharded_spec, streaming=streaming, cache=False).app
+
+    assert [g.name for g in app.cli.groups] == ["group1"]
+    assert [c.name for c in app.cli.commands] == ["comm2", "version"]
+    assert app.cli.groups[0].commands[0].arguments[1].name == "arg1"
+    assert app.schemas.enums[0].name == "enum1"
+
+
+def test_includes_cache(tmp_path, sharded_spec):
+    shards_dir = os.path.join(tmp_path, ".brandon", "shards", "project.yml")
+    app = Parser(sharded_spec).app
+    entries = set(os.listdir(shards_dir))
+    assert len(entries) == 3
+
+    # cached shards are reused and keep group parameters shared
+    cached = Parser(sharded_spec, jobs=1).app
+    assert cached == app
+    assert all(
+        cached.cli.groups[0].inherited_by(c) for c in cached.cli.groups[0].commands
+    )
+    assert set(os.listdir(shards_dir)) == entries
+
+    # changed shards are parsed again, replacing their stale entries
+    with open(os.path.join(tmp_path, "comm2.yml"), "w") as fp:
+        yaml.dump({"comm4": {"description": "Test command 4"}}, fp)
+
+    app = Parser(sharded_spec).app
+    assert [c.name for c in app.cli.commands] == ["comm4", "version"]
+    assert len(os.listdir(shards_dir)) == 3
+    assert len(entries & set(os.listdir(shards_dir))) == 2
+
+
+def test_includes_cache_data(tmp_path, sharded_spec):
+    shards_dir = os.path.join(tmp_path, ".brandon", "shards", "project.yml")
+    app = Parser(sharded_spec).app
+
+    # entries hold the plain data of the shards, and the ones that can't
+    # be decoded are loaded again
+    for name in os.listdir(shards_dir):
+        path = os.path.join(shards_dir, name)
+        assert isinstance(cache.load(path), dict)
+        with open(path, "wb") as fp:
+            fp.write(pickle.dumps(app))
+
+    assert Parser(sharded_spec).app == app
+    for name in os.listdir(shards_dir):
+        assert isinstance(cache.load(os.path.join(shards_dir, name)), dict)
+
+
+def test_includes_not_cached(tmp_path, sharded_spec):
+    # dates have no MessagePack counterpart, so the shard isn't cached
+    with open(os.path.join(tmp_path, "comm2.yml"), "w") as fp:
+        fp.write("comm4:\n  description: Released on 2020-01-01\n")
+        fp.write("  options:\n    since: {type: string, example: 2020-01-01}\n")
+
+    app = Parser(sharded_spec).app
+    assert app.cli.commands[0].options[0].example == datetime.date(2020, 1, 1)
+    assert Parser(sharded_spec).app == app
+
+    shards_dir = os.path.join(tmp_path, ".brandon", "shards", "project.yml")
+    assert len(os.listdir(shards_dir)) == 2
+
+
+def test_nested_includes(tmp_path, sharded_spec):
+    with open(os.path.join(tmp_path, "comm2.yml"), "w") as fp:
+        yaml.dump({"$include": "group1.yml"}, fp)
+
+    with pytest.raises(Exception):
+        Parser(sharded_spec, cache=False)
+
+
+def test_enum_reference(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    project_spec["cli"]["comm2"]["options"]["opt1"]["enum"] = "enum1"
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert Parser(yml_spec).app.cli.commands[0].options[0].enum == "enum1"
+
+    project_spec["cli"]["comm2"]["options"]["opt1"]["enum"] = "enum2"
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    with pytest.raises(Exception) as e:
+        Parser(yml_spec)
+    assert str(e.value) == "Enum `enum2` used by `opt1` is not defined"
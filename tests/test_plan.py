@@ -0,0 +1,52 @@
+import os
+
+from brandon.plan import Plan, markdown_table_size
+from brandon.md_utils import Table
+
+
+def test_plan(tmp_path):
+    (tmp_path / "existing.md").write_text("content")
+    (tmp_path / "folder").mkdir()
+
+    plan = Plan()
+    plan.add_directory(str(tmp_path / "folder"))
+    plan.add_directory(str(tmp_path / "new"))
+    plan.add_file(str(tmp_path / "existing.md"), 10)
+    plan.add_file(str(tmp_path / "new.md"), 20)
+    plan.add_file(str(tmp_path / "new" / "page.md"), 30)
+    plan.delete_file(str(tmp_path / "stale.md"), 5)
+
+    assert [e.action for e in plan.entries] == [
+        "keep",
+        "create",
+        "overwrite",
+        "create",
+        "create",
+        "delete",
+    ]
+    assert plan.entries[2].current_size == len("content")
+    assert plan.summary() == {
+        "directories": 2,
+        "new_directories": 1,
+        "files": 3,
+        "created": 2,
+        "overwritten": 1,
+        "deleted": 1,
+        "bytes": 60,
+    }
+    assert plan.to_dict()["entries"][3] == {
+        "path": str(tmp_path / "new.md"),
+        "directory": False,
+        "action": "create",
+        "size": 20,
+        "current_size": 0,
+    }
+
+
+def test_markdown_table_size():
+    header = ["Key", "Value"]
+    rows = [["`key1`", "value1"], ["`k`", "longer value"]]
+    rendered = Table(header=header, rows=rows, bold=True).render()
+
+    sizes = [[len(c) for c in row] for row in rows]
+    assert markdown_table_size(header, sizes) == len(rendered)
@@ -0,0 +1,75 @@
+import os
+import yaml
+
+from brandon.search import Index, load_index, tokenize
+
+
+def test_tokenize():
+    assert tokenize("--output_path") == {"output", "path", "output-path"}
+    assert tokenize("Set the Region.") == {"set", "the", "region"}
+
+
+def test_search(app):
+    index = Index.build(app)
+
+    assert index.search("opt1") == [["option", "sampleapp comm2 --opt1", "Option 1"]]
+    assert [r[1] for r in index.search("global argument")] == [
+        "sampleapp group1 comm1 <arg1>",
+        "sampleapp group1 comm3 <arg1>",
+    ]
+    assert index.search("enum1 value1") == [["item", "enum1.key1", "value1"]]
+    assert len(index.search("test", limit=2)) == 2
+    assert index.search("missing") == []
+
+
+def test_incremental_build(app):
+    index = Index.build(app)
+    unit = index.units["group:group1"]
+
+    app.cli.commands[0].description = "Changed"
+    updated = Index.build(app, previous=index)
+
+    assert updated.units["group:group1"] is unit
+    assert updated.units["command:comm2"] is not index.units["command:comm2"]
+    assert updated.search("changed")[0][1] == "sampleapp comm2"
+
+    # paths include the executable, so renaming the app updates them
+    app.exec = "renamed"
+    renamed = Index.build(app, previous=updated)
+    assert renamed.search("changed")[0][1] == "renamed comm2"
+
+
+def test_load_index(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    index = load_index(yml_spec)
+    assert index.is_current()
+    assert os.path.exists(os.path.join(tmp_path, ".brandon", "project.yml.index.json"))
+    assert load_index(yml_spec).units == index.units
+
+    project_spec["cli"]["comm2"]["options"]["region"] = {"type": "string"}
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert not index.is_current()
+    assert load_index(yml_spec).search("region")[0][1] == "sampleapp comm2 --region"
+
+    project_spec["name"] = "Renamed"
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    assert load_index(yml_spec).search("region")[0][1] == "renamed comm2 --region"
+
+
+def test_load_index_read_only(tmp_path, project_spec):
+    yml_spec = os.path.join(tmp_path, "project.yml")
+    with open(yml_spec, "w") as fp:
+        yaml.dump(project_spec, fp)
+
+    # a file in place of the cache directory
+    with open(os.path.join(tmp_path, ".brandon"), "w") as fp:
+        fp.write("")
+
+    assert load_index(yml_spec).search("comm2")[0][1] == "sampleapp comm2"
@@ -0,0 +1,56 @@
+import os
+import pickle
+
+from brandon.store import ArtifactStore, key, fetch
+
+
+def test_fetch(tmp_path):
+    store = ArtifactStore(os.path.join(tmp_path, "store"))
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "content"
+
+    k = key("test", "1", {"a": 1})
+    assert k == key("test", "1", {"a": 1})
+    assert k != key("test", "2", {"a": 1})
+
+    assert store.fetch(k, render) == "content"
+    assert store.fetch(k, render) == "content"
+    assert len(calls) == 1
+    assert store.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+    # a new store on the same directory reuses the artifacts
+    other = ArtifactStore(os.path.join(tmp_path, "store"))
+    assert other.get(k) == "content"
+
+    assert fetch(None, ["test"], render) == "content"
+    assert len(calls) == 2
+
+
+def test_eviction(tmp_path):
+    store = ArtifactStore(tmp_path, max_bytes=250)
+
+    for i in range(3):
+        store.put(key(str(i)), "x" * 100)
+        # distinct modification times for the least recently used order
+        os.utime(store._path(key(str(i))), ns=(i, i))
+
+    # the least recently used artifact is evicted, down to 80% of the size
+    assert store.stats()["evictions"] == 1
+    assert store.get(key("0")) is None
+    assert store.get(key("1")) == "x" * 100
+    assert store.get(key("2")) == "x" * 100
+
+
+def test_pickle(tmp_path):
+    store = ArtifactStore(tmp_path)
+    store.get(key("missing"))
+
+    copy = pickle.loads(pickle.dumps(store))
+    assert copy.stats() == {"hits": 0, "misses": 0, "evictions": 0}
+
+    copy.get(key("missing"))
+    store.merge(copy.stats())
+    assert store.stats()["misses"] == 2
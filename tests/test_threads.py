@@ -0,0 +1,131 @@
+import os
+import sys
+import yaml
+import subprocess
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from brandon.spec import Parser
+from brandon.store import ArtifactStore
+from brandon.schemas import Languages
+from brandon.builders import docs, summary
+from brandon.builders.project import Project
+from brandon.builders.languages import python
+
+JOBS = 16
+THREADS = 8
+
+# a host script without a `__main__` guard, building docs with several
+# processes from several threads
+DOCS_SCRIPT = """
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from brandon.spec import Parser
+from brandon.builders import docs
+
+app = Parser(sys.argv[1]).app
+
+def write(i):
+    builder = docs.Builder(app, os.path.join(sys.argv[2], f"out{i}"), jobs=2)
+    builder._create_directories()
+    builder._write_mkdocs_conf()
+    builder._write_pages()
+    return builder.check()
+
+with ThreadPoolExecutor(max_workers=2) as executor:
+    assert list(executor.map(write, range(4))) == [[]] * 4
+"""
+
+
+def run_concurrently(fn, jobs=JOBS):
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(fn, range(jobs)))
+
+
+def read_tree(root):
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for f in filenames:
+            path = os.path.join(dirpath, f)
+            with open(path) as fp:
+                files[os.path.relpath(path, root)] = fp.read()
+    return files
+
+
+@pytest.fixture
+def spec_file(tmp_path, project_spec):
+    filename = os.path.join(tmp_path, "project.yml")
+    with open(filename, "w") as fp:
+        yaml.dump(project_spec, fp)
+    return filename
+
+
+def test_parser(spec_file):
+    apps = run_concurrently(lambda _: Parser(spec_file).app)
+
+    assert all(a == apps[0] for a in apps)
+    assert not [f for f in os.listdir(os.path.dirname(spec_file)) if ".tmp" in f]
+
+
+def test_python_builder(tmp_path, spec_file):
+    store = ArtifactStore(os.path.join(tmp_path, "store"))
+
+    def build(i):
+        output_path = os.path.join(tmp_path, f"out{i}")
+        Project(
+            Parser(spec_file).app, Languages.PYTHON, output_path, store=store
+        ).create()
+        return read_tree(output_path)
+
+    trees = run_concurrently(build)
+
+    assert trees[0]
+    assert all(t == trees[0] for t in trees)
+    assert store.hits + store.misses > 0
+
+
+def test_shared_builders(tmp_path, app):
+    python_builder = python.Builder(app, tmp_path)
+    summary_builder = summary.Builder(app)
+
+    rendered = run_concurrently(lambda _: list(python_builder.rendered_files()))
+    summaries = run_concurrently(lambda _: summary_builder.build())
+
+    assert all(r == rendered[0] for r in rendered)
+    assert all(s == summaries[0] for s in summaries)
+    assert summaries[0] == summary.Builder(app).build()
+
+
+def test_docs_builder(tmp_path, app):
+    def write(i):
+        builder = docs.Builder(app, os.path.join(tmp_path, f"out{i}"))
+        builder._create_directories()
+        builder._write_mkdocs_conf()
+        builder._write_pages()
+        return read_tree(builder.output_path)
+
+    trees = run_concurrently(write)
+
+    assert all(t == trees[0] for t in trees)
+
+    builder = docs.Builder(app, os.path.join(tmp_path, "out0"))
+    assert run_concurrently(lambda _: builder.check()) == [[]] * JOBS
+
+
+def test_docs_builder_processes(tmp_path, spec_file):
+    script = os.path.join(tmp_path, "host.py")
+    with open(script, "w") as fp:
+        fp.write(DOCS_SCRIPT)
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, script, spec_file, str(tmp_path)],
+        env={**os.environ, "PYTHONPATH": root},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert len(os.listdir(tmp_path)) == 6